@@ -0,0 +1,89 @@
+from dataclasses import dataclass
+from enum import Enum
+
+
+class OverloadPolicy(Enum):
+    """How a [`GroupSession`][group_genie.session.GroupSession] handles messages
+    that exceed its [`Admission`][group_genie.admission.Admission] limits."""
+
+    REJECT = "reject"
+    """Answer the message immediately with a system message explaining the overload."""
+
+    DROP_OLDEST = "drop_oldest"
+    """Drop the oldest execution of the same owner that is still waiting for a
+    decision of its group reasoner, so that the new message is admitted. The dropped
+    execution emits [`Decision.IGNORE`][group_genie.agent.Decision]. Its message
+    stays in the session, so the group reasoner considers it when reasoning about
+    the new message. Messages are rejected if the owner has no such execution."""
+
+    BACKPRESSURE = "backpressure"
+    """[`submit()`][group_genie.session.GroupSession.submit] waits until the message
+    is admitted. [`handle()`][group_genie.session.GroupSession.handle] cannot wait
+    and rejects the message."""
+
+
+@dataclass
+class Admission:
+    """Admission limits of a [`GroupSession`][group_genie.session.GroupSession].
+
+    An execution is in flight from [`handle()`][group_genie.session.GroupSession.handle]
+    until its [`stream()`][group_genie.session.Execution.stream] completes, and
+    pending as long as its group reasoner has not decided (queued in the session,
+    waiting for a model concurrency slot or queued in the group reasoner runner).
+    Executions also end if their stream is cancelled, closed or fails. Applications
+    must stream all executions, otherwise they remain in flight.
+
+    Example:
+        ```python
+        admission = Admission(max_pending=100, max_in_flight_per_owner=5, policy=OverloadPolicy.DROP_OLDEST)
+        session = GroupSession(..., admission=admission)
+        ```
+
+    Attributes:
+        max_pending: Maximum number of pending executions of the session. None
+            means unlimited.
+        max_in_flight_per_owner: Maximum number of in-flight executions per owner
+            (message sender). None means unlimited.
+        policy: How messages exceeding the limits are handled.
+    """
+
+    max_pending: int | None = None
+    max_in_flight_per_owner: int | None = None
+    policy: OverloadPolicy = OverloadPolicy.REJECT
+
+    def check(self, pending: int, in_flight: int) -> "Overload | None":
+        """Check if a new execution can be admitted.
+
+        Args:
+            pending: Number of pending executions of the session.
+            in_flight: Number of in-flight executions of the owner.
+
+        Returns:
+            None if the execution can be admitted, the exceeded limit otherwise.
+        """
+        if self.max_pending is not None and pending >= self.max_pending:
+            return Overload(scope="session", limit=self.max_pending)
+        if self.max_in_flight_per_owner is not None and in_flight >= self.max_in_flight_per_owner:
+            return Overload(scope="owner", limit=self.max_in_flight_per_owner)
+        return None
+
+
+@dataclass
+class Overload:
+    """Admission limit exceeded by a message.
+
+    Attributes:
+        scope: Scope of the exceeded limit (`session` for `max_pending`, `owner` for
+            `max_in_flight_per_owner`).
+        limit: Value of the exceeded limit.
+    """
+
+    scope: str
+    limit: int
+
+    @property
+    def message(self) -> str:
+        """User-facing message content for rejected executions."""
+        if self.scope == "owner":
+            return "You have too many requests in progress. Please wait for a reply before sending more."
+        return "This group is currently overloaded. Please try again shortly."
@@ -1,9 +1,11 @@
 from group_sense import Decision as _Decision
 from group_sense import Response as _Response
 
-from group_genie.agent.approval import Approval, ApprovalContext
+from group_genie.agent.approval import Approval, ApprovalContext, ApprovalPolicy, ApprovalRule
 from group_genie.agent.base import Agent, AgentInfo, AgentInput, ApprovalCallback
+from group_genie.agent.cache import CachePolicy, ToolCache
 from group_genie.agent.factory import AgentFactory, AsyncTool, MultiAgentFactoryFn, SingleAgentFactoryFn
+from group_genie.agent.history import HistoryPolicy, Summarizer, TokenEstimator
 from group_genie.agent.runner import AgentRunner
 
 Decision = _Decision
@@ -1,8 +1,14 @@
-from asyncio import Future, Queue
-from dataclasses import dataclass
+import re
+from asyncio import CancelledError, Future, Queue, shield, wait_for
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
 from functools import partial
+from time import perf_counter
 from typing import Any, Awaitable, Callable
 
+from group_genie import tracing
+from group_genie.metrics import APPROVAL_WAIT, APPROVALS
+
 ApprovalCallback = Callable[[str, dict[str, Any]], Awaitable[bool]]
 """Callback function type for requesting approval of tool calls.
 
@@ -39,6 +45,9 @@ class Approval:
         tool_args: Positional arguments for the tool call.
         tool_kwargs: Keyword arguments for the tool call.
         ftr: Internal future for communicating the approval decision.
+        remember: Whether the decision should be remembered for the session (set by
+            [`approve()`][group_genie.agent.approval.Approval.approve] and
+            [`deny()`][group_genie.agent.approval.Approval.deny]).
 
     Example:
         ```python
@@ -59,6 +68,7 @@ class Approval:
     tool_args: tuple
     tool_kwargs: dict[str, Any]
     ftr: Future[bool]
+    remember: bool = False
 
     async def approved(self) -> bool:
         """Wait for and return the approval decision.
@@ -70,21 +80,39 @@ class Approval:
         """
         return await self.ftr
 
-    def approve(self):
+    def approve(self, remember: bool = False):
         """Approve the tool call and unblock agent execution.
 
         Allows the agent to proceed with the tool execution. The agent will receive
-        the tool's result.
+        the tool's result. Has no effect if the approval already timed out.
+
+        Args:
+            remember: If True, further calls of this tool by the same owner are
+                approved for the rest of the session without emitting an
+                [`Approval`][group_genie.agent.approval.Approval]. Requires an
+                [`ApprovalPolicy`][group_genie.agent.approval.ApprovalPolicy].
         """
-        self.ftr.set_result(True)
+        self._decide(True, remember)
 
-    def deny(self):
+    def deny(self, remember: bool = False):
         """Deny the tool call and unblock agent execution.
 
         Prevents the tool from executing. The agent will receive a denial message
-        (implementation-specific behavior).
+        (implementation-specific behavior). Has no effect if the approval already
+        timed out.
+
+        Args:
+            remember: If True, further calls of this tool by the same owner are
+                denied for the rest of the session without emitting an
+                [`Approval`][group_genie.agent.approval.Approval]. Requires an
+                [`ApprovalPolicy`][group_genie.agent.approval.ApprovalPolicy].
         """
-        self.ftr.set_result(False)
+        self._decide(False, remember)
+
+    def _decide(self, approved: bool, remember: bool):
+        if not self.ftr.done():
+            self.remember = remember
+            self.ftr.set_result(approved)
 
     def __str__(self) -> str:
         actor_str = f'sender="{self.sender}"'
@@ -98,6 +126,128 @@ class Approval:
         return f"{self.tool_name}({all_args})"
 
 
+@dataclass
+class ApprovalRule:
+    """Rule that approves or denies matching tool calls without asking the user.
+
+    All specified conditions must match. Tool, owner and sender conditions are
+    glob patterns (e.g. `get_*`), argument conditions are regular expressions that
+    must match the full string representation of an argument value.
+
+    Attributes:
+        approve: Decision for matching tool calls (True approves, False denies).
+        tool: Pattern for the tool name. None matches all tools.
+        owner: Pattern for the owner (user ID) on whose behalf the tool is called.
+            None matches all owners.
+        sender: Pattern for the agent calling the tool (e.g. `system`, `search:*`).
+            None matches all agents.
+        args: Patterns for tool arguments by argument name. A tool call without
+            a specified argument does not match.
+
+    Example:
+        ```python
+        ApprovalRule(approve=True, tool="get_weather")
+        ApprovalRule(approve=True, tool="read_file", args={"path": r"/data/public/.*"})
+        ApprovalRule(approve=False, tool="delete_*", owner="guest-*")
+        ```
+    """
+
+    approve: bool
+    tool: str | None = None
+    owner: str | None = None
+    sender: str | None = None
+    args: dict[str, str] = field(default_factory=dict)
+
+    def matches(self, owner: str | None, sender: str, tool_name: str, tool_args: dict[str, Any]) -> bool:
+        """Return True if the rule applies to a tool call."""
+        if self.tool is not None and not fnmatchcase(tool_name, self.tool):
+            return False
+        if self.owner is not None and (owner is None or not fnmatchcase(owner, self.owner)):
+            return False
+        if self.sender is not None and not fnmatchcase(sender, self.sender):
+            return False
+        for name, pattern in self.args.items():
+            if name not in tool_args or re.fullmatch(pattern, str(tool_args[name])) is None:
+                return False
+        return True
+
+
+class ApprovalPolicy:
+    """Policy that decides tool call approvals before they are emitted to the user.
+
+    Tool calls are decided, in this order, by the first matching
+    [`ApprovalRule`][group_genie.agent.approval.ApprovalRule], by a decision the
+    owner remembered for the session (see
+    [`Approval.approve()`][group_genie.agent.approval.Approval.approve]), or by the
+    user via an emitted [`Approval`][group_genie.agent.approval.Approval]. Emitted
+    approvals that are not decided within `timeout` seconds are decided with
+    `timeout_decision`, so that hung approvals do not block agents forever.
+
+    A policy is passed to a [`GroupSession`][group_genie.session.GroupSession].
+    Remembered decisions are kept in memory for the lifetime of the policy and are
+    not persisted, use one policy instance per session.
+
+    Example:
+        ```python
+        policy = ApprovalPolicy(
+            rules=[
+                ApprovalRule(approve=True, tool="get_weather"),
+                ApprovalRule(approve=False, tool="delete_*"),
+            ],
+            timeout=300,
+        )
+        session = GroupSession(..., approval_policy=policy)
+        ```
+    """
+
+    def __init__(
+        self,
+        rules: list[ApprovalRule] | None = None,
+        timeout: float | None = None,
+        timeout_decision: bool = False,
+    ):
+        """Initialize the policy.
+
+        Args:
+            rules: Rules evaluated in order, the first matching rule decides.
+            timeout: Optional timeout in seconds for emitted approvals. None means no
+                timeout.
+            timeout_decision: Decision for approvals that time out. Defaults to False
+                (deny).
+        """
+        self.rules = list(rules or [])
+        self.timeout = timeout
+        self.timeout_decision = timeout_decision
+        self._remembered: dict[tuple[str | None, str], bool] = {}
+
+    def decide(
+        self, owner: str | None, sender: str, tool_name: str, tool_args: dict[str, Any]
+    ) -> tuple[bool, str] | None:
+        """Decide a tool call without asking the user.
+
+        Returns:
+            The decision and its source (`rule` or `memory`), or None if the user
+                must decide.
+        """
+        for rule in self.rules:
+            if rule.matches(owner, sender, tool_name, tool_args):
+                return rule.approve, "rule"
+        if (decision := self._remembered.get((owner, tool_name))) is not None:
+            return decision, "memory"
+        return None
+
+    def remember(self, owner: str | None, tool_name: str, approved: bool):
+        """Remember a decision for further calls of a tool by an owner."""
+        self._remembered[(owner, tool_name)] = approved
+
+    def forget(self, owner: str | None = None):
+        """Forget remembered decisions of an owner, or of all owners if None."""
+        if owner is None:
+            self._remembered.clear()
+        else:
+            self._remembered = {key: value for key, value in self._remembered.items() if key[0] != owner}
+
+
 @dataclass
 class ApprovalContext:
     """Context for managing the approval workflow.
@@ -116,6 +266,9 @@ class ApprovalContext:
         queue: Queue for Approval objects that need user attention.
         auto_approve: If True, automatically approve all tool calls without emitting
             Approvals. Defaults to False.
+        owner: Owner (user ID) on whose behalf tools are called.
+        policy: Optional [`ApprovalPolicy`][group_genie.agent.approval.ApprovalPolicy]
+            evaluated before Approvals are emitted.
 
     Example:
         ```python
@@ -129,6 +282,8 @@ class ApprovalContext:
 
     queue: Queue[Approval]
     auto_approve: bool = False
+    owner: str | None = None
+    policy: ApprovalPolicy | None = None
 
     def approval_callback(self, sender: str) -> ApprovalCallback:
         """Create an approval callback for a specific sender.
@@ -145,11 +300,13 @@ class ApprovalContext:
     async def approval(self, sender: str, tool_name: str, tool_args: dict[str, Any]) -> bool:
         """Request approval for a tool call.
 
-        If auto_approve is enabled, immediately returns True. Otherwise, creates
-        an [`Approval`][group_genie.agent.approval.Approval] object, adds it to
-        the queue for the application to handle, and blocks until
+        If auto_approve is enabled, immediately returns True. Otherwise, returns the
+        decision of the approval policy (if any) or creates an
+        [`Approval`][group_genie.agent.approval.Approval] object, adds it to the
+        queue for the application to handle, and blocks until
         [`approve()`][group_genie.agent.approval.Approval.approve] or
-        [`deny()`][group_genie.agent.approval.Approval.deny] is called.
+        [`deny()`][group_genie.agent.approval.Approval.deny] is called or the
+        policy's approval timeout expires.
 
         Args:
             sender: Identifier of the agent requesting approval.
@@ -160,8 +317,15 @@ class ApprovalContext:
             True if approved, False if denied.
         """
         if self.auto_approve:
+            APPROVALS.inc(source="auto", approved="true")
             return True
 
+        if self.policy is not None:
+            if (decision := self.policy.decide(self.owner, sender, tool_name, tool_args)) is not None:
+                approved, source = decision
+                APPROVALS.inc(source=source, approved=str(approved).lower())
+                return approved
+
         approval = Approval(
             sender=sender,
             tool_name=tool_name,
@@ -169,5 +333,30 @@ class ApprovalContext:
             tool_kwargs=tool_args,
             ftr=Future[bool](),
         )
-        self.queue.put_nowait(approval)
-        return await approval.approved()
+        with tracing.span("approval", sender=sender, tool=tool_name) as span:
+            self.queue.put_nowait(approval)
+
+            start = perf_counter()
+            timeout = self.policy.timeout if self.policy is not None else None
+            source = "user"
+
+            try:
+                approved = await wait_for(shield(approval.approved()), timeout=timeout)
+            except TimeoutError:
+                assert self.policy is not None
+                approved = self.policy.timeout_decision
+                approval._decide(approved, remember=False)
+                source = "timeout"
+            except CancelledError:
+                # agent run cancelled, decide the approval to complete the shielded wait
+                approval._decide(False, remember=False)
+                raise
+            else:
+                if approval.remember and self.policy is not None:
+                    self.policy.remember(self.owner, tool_name, approved)
+
+            APPROVAL_WAIT.observe(perf_counter() - start, tool=tool_name, approved=str(approved).lower())
+            APPROVALS.inc(source=source, approved=str(approved).lower())
+            span.set_attribute("approved", approved)
+            span.set_attribute("source", source)
+            return approved
@@ -5,6 +5,7 @@ from typing import Any
 
 from group_genie.agent.approval import ApprovalCallback
 from group_genie.message import Attachment
+from group_genie.usage import Usage
 
 
 @dataclass
@@ -22,6 +23,26 @@ class AgentInfo:
         emoji: Optional emoji code for visual identification.
         idle_timeout: Optional timeout in seconds after which an idle agent is stopped
             to free resources. None means no timeout.
+        timeout: Optional timeout in seconds for a single agent run, including the time
+            spent waiting for approvals. On timeout, the run is cancelled and fails with
+            a `TimeoutError`. None means no timeout.
+        max_forks: Maximum number of forks of the agent that run concurrently with its
+            main instance. If greater than 0, queries that arrive while the agent is busy
+            are processed in parallel by forks, new agent instances created from a copy
+            of the current agent state. When a fork completes, its new conversation turns
+            are merged into the main instance with
+            [`merge()`][group_genie.agent.base.Agent.merge] (in completion order, after
+            the main instance completes its current run). Forks do not see the turns of
+            runs that are in progress. Requires an agent that implements `merge()`.
+            Defaults to 0 (sequential processing).
+        stateless: Whether the agent is stateless, i.e. does not need conversation
+            memory across runs (e.g. search or calculator agents). Stateless agents are
+            served from a pool of `pool_size` agent instances that process up to
+            `pool_size` queries concurrently. Each run starts from the initial agent
+            state, and state is not persisted. All instances of a stateless subagent
+            are served by a single pool, regardless of their instance ids.
+        pool_size: Number of agent instances in the pool of a stateless agent. Each
+            instance connects to its MCP servers once when the pool is created.
 
     Example:
         ```python
@@ -38,6 +59,10 @@ class AgentInfo:
     description: str
     emoji: str | None = None
     idle_timeout: float | None = None
+    timeout: float | None = None
+    max_forks: int = 0
+    stateless: bool = False
+    pool_size: int = 4
 
 
 @dataclass
@@ -170,3 +195,29 @@ class Agent(ABC):
             The agent's response as a string.
         """
         ...
+
+    def usage(self) -> Usage | None:
+        """Return the model usage of the last [`run()`][group_genie.agent.base.Agent.run].
+
+        Called by the framework after each run to aggregate usage per execution, owner
+        and session. Usage of subagents is recorded by their own runners and must not be
+        included. The default implementation returns None (usage not tracked).
+
+        Returns:
+            Usage of the last run, or None if not available.
+        """
+        return None
+
+    def merge(self, fork: "Agent"):
+        """Merge the conversation turns added by the last run of a fork into this agent.
+
+        A fork is another instance of this agent, created by the same factory and
+        initialized with [`set_serialized()`][group_genie.agent.base.Agent.set_serialized]
+        from a copy of this agent's state. Called by the framework for agents with
+        [`max_forks`][group_genie.agent.base.AgentInfo] greater than 0. The default
+        implementation raises `NotImplementedError` (forking not supported).
+
+        Args:
+            fork: The fork after its run.
+        """
+        raise NotImplementedError
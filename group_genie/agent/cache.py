@@ -0,0 +1,109 @@
+import json
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any
+
+from group_genie.metrics import TOOL_CACHE
+
+
+@dataclass
+class CachePolicy:
+    """Caching policy of a single tool.
+
+    Attributes:
+        ttl: Time in seconds a cached tool result is valid.
+        max_size: Maximum number of cached results of the tool. The least recently
+            used results are evicted first.
+    """
+
+    ttl: float
+    max_size: int = 256
+
+
+class ToolCache:
+    """Cache for the results of idempotent tools.
+
+    Tool results are cached by tool name, namespace and canonicalized arguments (JSON
+    with sorted keys), for tools that have a [`CachePolicy`][group_genie.agent.CachePolicy].
+    Cache hits skip both the approval request and the tool execution. Only results
+    of approved and successful tool calls are cached.
+
+    Agents use the source of a tool as namespace (the function or definition of a
+    function tool, the MCP server of an MCP tool), so that same-named tools of different agents or
+    MCP servers never share results.
+
+    A cache can be shared by agents of different owners by passing the same
+    instance to their constructors (e.g. from an agent factory function). Cache
+    only tools whose results do not depend on the owner (e.g. on owner secrets)
+    and that are safe to execute without approval once approved by any owner.
+
+    Example:
+        ```python
+        cache = ToolCache({"get_weather": CachePolicy(ttl=600, max_size=1000)})
+
+        def create_system_agent(secrets, extra_tools, agent_infos):
+            return DefaultAgent(
+                system_prompt="You are a helpful assistant",
+                model="google-gla:gemini-3-flash-preview",
+                tools=[get_weather],
+                tool_cache=cache,
+            )
+        ```
+    """
+
+    def __init__(self, policies: dict[str, CachePolicy]):
+        """Initialize the cache.
+
+        Args:
+            policies: Caching policies by tool name. Results of other tools are not cached.
+        """
+        self.policies = policies
+        self._entries: dict[str, OrderedDict[str, tuple[float, Any]]] = {name: OrderedDict() for name in policies}
+
+    def cached(self, tool_name: str) -> bool:
+        """Return True if results of the tool are cached."""
+        return tool_name in self.policies
+
+    def get(self, tool_name: str, tool_args: dict[str, Any] | None, namespace: str = "") -> Any:
+        """Return the cached result of a tool call.
+
+        Raises:
+            KeyError: If there is no valid cached result.
+        """
+        if (entries := self._entries.get(tool_name)) is None:
+            raise KeyError(tool_name)
+
+        key = self._key(namespace, tool_args)
+        entry = entries.get(key)
+
+        if entry is None or entry[0] < monotonic():
+            entries.pop(key, None)
+            TOOL_CACHE.inc(tool=tool_name, result="miss")
+            raise KeyError(tool_name)
+
+        entries.move_to_end(key)
+        TOOL_CACHE.inc(tool=tool_name, result="hit")
+        return entry[1]
+
+    def put(self, tool_name: str, tool_args: dict[str, Any] | None, result: Any, namespace: str = ""):
+        """Cache the result of a tool call. Ignored for tools without policy."""
+        if (policy := self.policies.get(tool_name)) is None:
+            return
+
+        key = self._key(namespace, tool_args)
+        entries = self._entries[tool_name]
+        entries[key] = (monotonic() + policy.ttl, result)
+        entries.move_to_end(key)
+
+        while len(entries) > policy.max_size:
+            entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all cached results."""
+        for entries in self._entries.values():
+            entries.clear()
+
+    @staticmethod
+    def _key(namespace: str, tool_args: dict[str, Any] | None) -> str:
+        return json.dumps([namespace, tool_args or {}], sort_keys=True, separators=(",", ":"), default=str)
@@ -2,7 +2,7 @@ import inspect
 from typing import Any, Awaitable, Callable
 
 from group_genie.agent.base import Agent, AgentInfo
-from group_genie.secrets import SecretsProvider
+from group_genie.secrets import AsyncSecretsProvider, SecretsProvider, load_secrets
 
 AsyncTool = Callable[..., Awaitable[Any]]
 
@@ -130,7 +130,7 @@ class AgentFactory:
         self,
         system_agent_factory: SingleAgentFactoryFn | MultiAgentFactoryFn,
         system_agent_info: AgentInfo | None = None,
-        secrets_provider: SecretsProvider | None = None,
+        secrets_provider: SecretsProvider | AsyncSecretsProvider | None = None,
     ):
         """Initialize the agent factory.
 
@@ -141,6 +141,8 @@ class AgentFactory:
             system_agent_info: Optional metadata for the system agent. Defaults to
                 a basic AgentInfo with name="system" and 600s idle timeout.
             secrets_provider: Optional provider for user-specific secrets (e.g., API keys).
+                Slow providers should be wrapped in a
+                [`CachingSecretsProvider`][group_genie.secrets.CachingSecretsProvider].
         """
         self._agent_factory_fns: dict[str, SingleAgentFactoryFn | MultiAgentFactoryFn] = {}
         self._agent_infos: dict[str, AgentInfo] = {}
@@ -166,7 +168,13 @@ class AgentFactory:
         """
         return self.create_agent(name="system", owner=owner, extra_tools=extra_tools)
 
-    def create_agent(self, name: str, owner: str, extra_tools: dict[str, AsyncTool] | None = None) -> Agent:
+    def create_agent(
+        self,
+        name: str,
+        owner: str,
+        extra_tools: dict[str, AsyncTool] | None = None,
+        secrets: dict[str, str] | None = None,
+    ) -> Agent:
         """Create an agent by name for a specific owner.
 
         Looks up the registered factory function for the given name and creates an
@@ -178,11 +186,17 @@ class AgentFactory:
             owner: User ID of the agent owner.
             extra_tools: Optional additional tools to provide to the agent. Only used
                 for MultiAgentFactoryFn agents.
+            secrets: Optional secrets of the owner, obtained with
+                [`get_secrets()`][group_genie.agent.factory.AgentFactory.get_secrets].
+                If None, secrets are retrieved synchronously from the secrets provider
+                (not supported for an
+                [`AsyncSecretsProvider`][group_genie.secrets.AsyncSecretsProvider]).
 
         Returns:
             A new Agent instance configured for the owner.
         """
-        secrets = self._get_secrets(owner)
+        if secrets is None:
+            secrets = self._get_secrets(owner)
         factory = self._agent_factory_fns[name]
         signature = inspect.signature(factory)
 
@@ -237,7 +251,20 @@ class AgentFactory:
         """
         return [info for name, info in self._agent_infos.items() if name not in [exclude]]
 
+    async def get_secrets(self, owner: str) -> dict[str, str]:
+        """Retrieve the secrets of an owner without blocking the event loop.
+
+        Args:
+            owner: User ID of the agent owner.
+
+        Returns:
+            The owner's secrets (empty if there is no secrets provider).
+        """
+        return await load_secrets(self._secrets_provider, owner)
+
     def _get_secrets(self, owner: str) -> dict[str, str]:
         if self._secrets_provider is None:
             return {}
+        if isinstance(self._secrets_provider, AsyncSecretsProvider):
+            raise TypeError("Async secrets provider requires secrets to be passed to create_agent()")
         return self._secrets_provider.get_secrets(owner) or {}
@@ -0,0 +1,167 @@
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence, TypeVar
+
+M = TypeVar("M")
+
+TokenEstimator = Callable[[Any], int]
+"""Function type for estimating the number of tokens of a single history message."""
+
+
+def estimate_tokens(message: Any) -> int:
+    """Estimate the number of tokens of a history message from its JSON size (~4 characters per token)."""
+    from pydantic_core import to_jsonable_python
+
+    return len(json.dumps(to_jsonable_python(message, bytes_mode="base64", fallback=str))) // 4
+
+
+class Summarizer(ABC):
+    """Abstract base class for summarizing older conversation turns.
+
+    Used by [`HistoryPolicy`][group_genie.agent.HistoryPolicy] to condense
+    turns that are removed from an agent's history into a summary that is kept as
+    the first turn of the history.
+    """
+
+    @abstractmethod
+    async def summarize(self, transcript: str) -> str:
+        """Summarize a conversation transcript.
+
+        Args:
+            transcript: Text rendering of the removed turns. If the history already
+                contained a summary, it is included at the beginning of the transcript.
+
+        Returns:
+            The summary text.
+        """
+        ...
+
+
+@dataclass
+class HistoryPolicy:
+    """Policy for bounding the conversation history an agent sends with each run.
+
+    History is managed in units of turns. A turn starts with a user prompt and
+    contains all subsequent model responses, tool calls and tool returns up to the
+    next user prompt. Removing whole turns keeps tool call/return pairs intact.
+
+    Before each run, the oldest turns are removed if the history has more than
+    `max_turns` turns or more than `max_tokens` estimated tokens. Removed turns are
+    condensed into a summary turn if a `summarizer` is configured, otherwise they
+    are discarded. The resulting history is also what is persisted.
+
+    Attributes:
+        max_turns: Maximum number of turns to keep. None means unlimited.
+        max_tokens: Maximum number of estimated tokens to keep. None means unlimited.
+            The most recent turn is always kept, even if it alone exceeds the budget.
+        token_estimator: Estimates the number of tokens of a single history message.
+            Defaults to a JSON size based estimate.
+        summarizer: Optional summarizer for removed turns.
+        compact_to: Fraction of an exceeded limit (`max_turns` or `max_tokens`) to
+            retain. Values below 1.0 remove more turns at once so that the
+            summarizer runs less often (e.g. 0.5 summarizes half of the history each
+            time the limit is reached). Defaults to 1.0 (sliding window).
+
+    Example:
+        ```python
+        agent = DefaultAgent(
+            system_prompt="You are a helpful assistant",
+            model="google-gla:gemini-3-flash-preview",
+            history_policy=HistoryPolicy(
+                max_turns=20,
+                max_tokens=50_000,
+                summarizer=DefaultSummarizer(model="google-gla:gemini-3-flash-preview"),
+                compact_to=0.5,
+            ),
+        )
+        ```
+    """
+
+    max_turns: int | None = None
+    max_tokens: int | None = None
+    token_estimator: TokenEstimator = estimate_tokens
+    summarizer: Summarizer | None = None
+    compact_to: float = 1.0
+
+    def __post_init__(self):
+        if not 0.0 < self.compact_to <= 1.0:
+            raise ValueError("compact_to must be in (0, 1]")
+
+    def exceeded(self, turns: Sequence[Sequence[Any]]) -> bool:
+        """Return True if the turns exceed a limit of this policy."""
+        if self.max_turns is not None and len(turns) > self.max_turns:
+            return True
+        if self.max_tokens is not None and self._tokens(turns) > self.max_tokens:
+            return True
+        return False
+
+    def retained(self, turns: Sequence[Sequence[Any]]) -> int:
+        """Return the number of most recent turns to retain after compaction.
+
+        Only exceeded limits are compacted. At least the most recent turn is retained.
+        """
+        retain = len(turns)
+
+        if self.max_turns is not None and len(turns) > self.max_turns:
+            retain = min(retain, int(self.max_turns * self.compact_to))
+
+        if self.max_tokens is not None and self._tokens(turns) > self.max_tokens:
+            budget = self.max_tokens * self.compact_to
+            tokens = 0
+            for i, turn in enumerate(reversed(turns[len(turns) - retain :])):
+                tokens += self._tokens([turn])
+                if tokens > budget:
+                    retain = i
+                    break
+
+        return max(retain, 1) if turns else 0
+
+    async def apply(
+        self,
+        turns: list[list[M]],
+        render: Callable[[list[M]], str],
+        summary_turn: Callable[[str], list[M]],
+    ) -> list[list[M]]:
+        """Apply this policy to a history split into turns.
+
+        Called by agent implementations with provider-specific rendering and summary
+        turn construction.
+
+        Args:
+            turns: History split into turns, oldest first.
+            render: Renders the messages of removed turns as transcript for the summarizer.
+            summary_turn: Creates a turn containing the summary text.
+
+        Returns:
+            The turns to keep, preceded by a summary turn if turns were summarized.
+        """
+        if not self.exceeded(turns):
+            return turns
+
+        retain = self.retained(turns)
+        removed = turns[: len(turns) - retain]
+        retained = turns[len(turns) - retain :]
+
+        if self.summarizer is None:
+            return retained
+
+        summary = await self.summarizer.summarize(render([message for turn in removed for message in turn]))
+        return [summary_turn(summary), *retained]
+
+    def _tokens(self, turns: Sequence[Sequence[Any]]) -> int:
+        return sum(self.token_estimator(message) for turn in turns for message in turn)
+
+
+def split_turns(messages: list[M], is_turn_start: Callable[[M], bool]) -> list[list[M]]:
+    """Split a message history into turns, starting a new turn at each message for
+    which `is_turn_start` returns True.
+
+    Messages preceding the first turn start are added to the first turn.
+    """
+    turns: list[list[M]] = []
+    for message in messages:
+        if not turns or is_turn_start(message):
+            turns.append([])
+        turns[-1].append(message)
+    return turns
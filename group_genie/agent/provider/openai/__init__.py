@@ -1,2 +1,4 @@
 from group_genie.agent.provider.openai.agent import DefaultAgent
+from group_genie.agent.provider.openai.cassette import RecordingModel, ReplayModel
+from group_genie.agent.provider.openai.model import LimitedModel
 from group_genie.agent.provider.openai.utils import MCPApprovalInterceptor
@@ -7,14 +7,18 @@ from dataclasses import replace
 from typing import Any
 
 from agents import Agent as AgentImpl
-from agents import FunctionTool, Model, ModelSettings, Runner, Tool, TResponseInputItem
+from agents import FunctionTool, Model, ModelSettings, Runner, Tool, ToolCallItem, TResponseInputItem
 from agents.mcp import MCPServer
 from pydantic_core import to_jsonable_python
 
 from group_genie.agent.approval import ApprovalCallback
 from group_genie.agent.base import Agent, AgentInput
+from group_genie.agent.cache import ToolCache
+from group_genie.agent.history import HistoryPolicy
+from group_genie.agent.provider.openai.history import apply_history_policy
 from group_genie.agent.provider.openai.utils import MCPApprovalInterceptor
 from group_genie.agent.provider.pydantic_ai.agent.prompt import user_prompt
+from group_genie.usage import Usage
 
 
 class DefaultAgent(Agent):
@@ -59,6 +63,8 @@ class DefaultAgent(Agent):
         model_settings: ModelSettings,
         tools: list[Tool] = [],
         mcp_servers: list[Any] = [],
+        history_policy: HistoryPolicy | None = None,
+        tool_cache: ToolCache | None = None,
         **kwargs: Any,
     ):
         """Initialize an OpenAI Agents SDK based agent.
@@ -74,6 +80,10 @@ class DefaultAgent(Agent):
                 `@function_tool` decorator from the OpenAI Agents SDK).
             mcp_servers: List of MCP server instances from the OpenAI Agents SDK.
                 These will be wrapped with approval interceptors.
+            history_policy: Optional policy that bounds the conversation history sent
+                with each run (and persisted). Unbounded if None.
+            tool_cache: Optional cache for results of idempotent tools, including MCP
+                tools. Cache hits skip approval and execution of tool calls.
             **kwargs: Additional arguments passed to the underlying OpenAI Agent
                 constructor.
         """
@@ -82,6 +92,8 @@ class DefaultAgent(Agent):
         self.model = model
         self.model_settings = model_settings
         self.kwargs = kwargs
+        self.history_policy = history_policy
+        self.tool_cache = tool_cache
 
         self._tools_wrapped = [self._wrap_tool(tool) for tool in tools]
         self._mcp_servers: list[MCPServer] = mcp_servers
@@ -90,6 +102,8 @@ class DefaultAgent(Agent):
         self._callback: ContextVar[ApprovalCallback] = ContextVar[ApprovalCallback]("callback")
         self._agent: AgentImpl[Any] | None = None
         self._history: list[TResponseInputItem] = []
+        self._usage: Usage | None = None
+        self._new_items: list[TResponseInputItem] = []
 
     def get_serialized(self) -> Any:
         """Serialize agent conversation history for persistence.
@@ -123,7 +137,9 @@ class DefaultAgent(Agent):
         async with AsyncExitStack() as stack:
             for mcp_server in self._mcp_servers:
                 _mcp_server = await stack.enter_async_context(mcp_server)
-                self._mcp_servers_wrapped.append(MCPApprovalInterceptor(wrapped=_mcp_server, callback=self._callback))
+                self._mcp_servers_wrapped.append(
+                    MCPApprovalInterceptor(wrapped=_mcp_server, callback=self._callback, cache=self.tool_cache)
+                )
 
             self._agent = AgentImpl[Any](
                 name="openai-agent",
@@ -190,6 +206,9 @@ class DefaultAgent(Agent):
                 }
             )
 
+        if self.history_policy is not None:
+            self._history = await apply_history_policy(self.history_policy, self._history)
+
         self._callback.set(callback)
         result = await Runner.run(
             self._agent,
@@ -209,20 +228,53 @@ class DefaultAgent(Agent):
             # remove preferences from history
             self._history[user_message_idx]["content"].pop(-2)
 
+        self._new_items = self._history[user_message_idx:]
+
+        usage = result.context_wrapper.usage
+        self._usage = Usage(
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
+            requests=usage.requests,
+            tool_calls=sum(isinstance(item, ToolCallItem) for item in result.new_items),
+        )
         return str(result.final_output)
 
+    def usage(self) -> Usage | None:
+        """Return the model usage of the last run, including all model requests and tool calls."""
+        return self._usage
+
     def _wrap_tool(self, tool: Tool) -> Tool:
         if not isinstance(tool, FunctionTool):
             return tool
 
         original_invoke = tool.on_invoke_tool
+        # function tools don't reference their function, they are identified by their definition
+        namespace = json.dumps([tool.description, tool.params_json_schema], sort_keys=True)
 
         async def wrapped_invoke(ctx: Any, args_json: str) -> Any:
-            callback = self._callback.get()
             args_dict = json.loads(args_json)
-            if await callback(tool_name=tool.name, tool_args=args_dict):  # type: ignore
-                return await original_invoke(ctx, args_json)
-            else:
+
+            if self.tool_cache is not None and self.tool_cache.cached(tool.name):
+                try:
+                    return self.tool_cache.get(tool.name, args_dict, namespace=namespace)
+                except KeyError:
+                    pass
+
+            callback = self._callback.get()
+            if not await callback(tool_name=tool.name, tool_args=args_dict):  # type: ignore
                 return f"Action denied: {tool.name}({args_dict})"
 
+            result = await original_invoke(ctx, args_json)
+
+            if self.tool_cache is not None:
+                self.tool_cache.put(tool.name, args_dict, result, namespace=namespace)
+
+            return result
+
         return replace(tool, on_invoke_tool=wrapped_invoke)
+
+    def merge(self, fork: Agent):
+        """Append the items of the last run of a fork to the conversation history."""
+        if not isinstance(fork, DefaultAgent):
+            raise TypeError(f"Cannot merge {type(fork).__name__} into {type(self).__name__}")
+        self._history.extend(fork._new_items)
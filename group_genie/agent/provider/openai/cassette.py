@@ -0,0 +1,108 @@
+import asyncio
+from time import perf_counter
+from typing import Any, AsyncIterator
+
+from agents import Model
+from agents.items import ModelResponse, TResponseOutputItem, TResponseStreamEvent
+from agents.usage import Usage
+from pydantic import TypeAdapter
+from pydantic_core import to_jsonable_python
+
+from group_genie.cassette import Cassette, request_key
+
+_output_adapter = TypeAdapter(list[TResponseOutputItem])
+_usage_adapter = TypeAdapter(Usage)
+
+
+class RecordingModel(Model):
+    """OpenAI Agents SDK model wrapper that records responses and latencies of model
+    calls to a [`Cassette`][group_genie.cassette.Cassette].
+
+    Responses, including tool calls, can be replayed offline with
+    [`ReplayModel`][group_genie.agent.provider.openai.ReplayModel]. Only
+    non-streaming calls are recorded (as made by
+    [`DefaultAgent`][group_genie.agent.provider.openai.DefaultAgent]).
+
+    Example:
+        ```python
+        cassette = Cassette(Path(".data", "cassettes", "system.jsonl"))
+
+        agent = DefaultAgent(
+            system_prompt="You are a helpful assistant",
+            model=RecordingModel(OpenAIResponsesModel(model="gpt-5", openai_client=client), cassette),
+            # model=ReplayModel(cassette),
+            model_settings=ModelSettings(),
+        )
+        ```
+    """
+
+    def __init__(self, wrapped: Model, cassette: Cassette):
+        """Initialize the wrapper.
+
+        Args:
+            wrapped: Model instance.
+            cassette: Cassette to record to.
+        """
+        self.wrapped = wrapped
+        self.cassette = cassette
+
+    async def get_response(
+        self, system_instructions: str | None, input: Any, *args: Any, **kwargs: Any
+    ) -> ModelResponse:  # type: ignore[override]
+        start = perf_counter()
+        response = await self.wrapped.get_response(system_instructions, input, *args, **kwargs)
+        self.cassette.record(
+            key=input_key(system_instructions, input),
+            response={
+                "output": _output_adapter.dump_python(response.output, mode="json"),
+                "usage": _usage_adapter.dump_python(response.usage, mode="json"),
+            },
+            latency=perf_counter() - start,
+        )
+        return response
+
+    def stream_response(self, *args: Any, **kwargs: Any) -> AsyncIterator[TResponseStreamEvent]:
+        return self.wrapped.stream_response(*args, **kwargs)
+
+
+class ReplayModel(Model):
+    """OpenAI Agents SDK model that replays responses recorded by a
+    [`RecordingModel`][group_genie.agent.provider.openai.RecordingModel].
+
+    Responses are served after the latency observed during recording, multiplied
+    by `latency_scale`, or after a latency sampled from the recorded latency
+    distribution. Does not access the network.
+    """
+
+    def __init__(self, cassette: Cassette, latency_scale: float = 1.0, sample_latency: bool = False):
+        """Initialize the replay model.
+
+        Args:
+            cassette: Cassette to replay.
+            latency_scale: Factor applied to replayed latencies (0 disables latency).
+            sample_latency: If True, latencies are sampled from all recorded latencies
+                instead of using the latency recorded for the response.
+        """
+        self.cassette = cassette
+        self.latency_scale = latency_scale
+        self.sample_latency = sample_latency
+
+    async def get_response(
+        self, system_instructions: str | None, input: Any, *args: Any, **kwargs: Any
+    ) -> ModelResponse:  # type: ignore[override]
+        entry = self.cassette.lookup(input_key(system_instructions, input))
+        latency = self.cassette.sample_latency() if self.sample_latency else entry.latency
+        await asyncio.sleep(latency * self.latency_scale)
+
+        return ModelResponse(
+            output=_output_adapter.validate_python(entry.response["output"]),
+            usage=_usage_adapter.validate_python(entry.response["usage"]),
+            response_id=None,
+        )
+
+    def stream_response(self, *args: Any, **kwargs: Any) -> AsyncIterator[TResponseStreamEvent]:
+        raise NotImplementedError("Streaming responses cannot be replayed")
+
+
+def input_key(system_instructions: str | None, input: Any) -> str:
+    return request_key(to_jsonable_python({"instructions": system_instructions, "input": input}, bytes_mode="base64"))
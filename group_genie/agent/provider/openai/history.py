@@ -0,0 +1,56 @@
+from typing import Any
+
+from agents import TResponseInputItem
+
+from group_genie.agent.history import HistoryPolicy, split_turns
+
+SUMMARY_PREFIX = "Summary of the earlier conversation:"
+MAX_RENDERED_CONTENT = 2000
+
+
+async def apply_history_policy(policy: HistoryPolicy, history: list[TResponseInputItem]) -> list[TResponseInputItem]:
+    """Apply a history policy to an OpenAI Agents SDK input item history."""
+    turns = split_turns(history, is_turn_start)
+    result = await policy.apply(turns, render=render, summary_turn=summary_turn)
+
+    if result is turns:
+        return history
+
+    return [item for turn in result for item in turn]
+
+
+def is_turn_start(item: TResponseInputItem) -> bool:
+    return item.get("role") == "user"  # type: ignore[union-attr]
+
+
+def summary_turn(summary: str) -> list[TResponseInputItem]:
+    return [
+        {"role": "user", "content": f"{SUMMARY_PREFIX}\n\n{summary}"},
+        {"role": "assistant", "content": "Understood."},
+    ]
+
+
+def render(items: list[TResponseInputItem]) -> str:
+    lines: list[str] = []
+    for item in items:
+        _item: dict[str, Any] = item  # type: ignore[assignment]
+        match _item:
+            case {"role": "user", "content": content}:
+                lines.append(f"User: {truncate(text(content))}")
+            case {"role": "assistant", "content": content}:
+                lines.append(f"Assistant: {truncate(text(content))}")
+            case {"type": "function_call", "name": name, "arguments": arguments}:
+                lines.append(f"Tool call: {name}({truncate(arguments)})")
+            case {"type": "function_call_output", "output": output}:
+                lines.append(f"Tool return: {truncate(str(output))}")
+    return "\n\n".join(lines)
+
+
+def text(content: str | list[dict[str, Any]]) -> str:
+    if isinstance(content, str):
+        return content
+    return " ".join(part.get("text", "[attachment]") for part in content)
+
+
+def truncate(text: str, max_length: int = MAX_RENDERED_CONTENT) -> str:
+    return text if len(text) <= max_length else text[:max_length] + " ..."
@@ -0,0 +1,48 @@
+from typing import Any, AsyncIterator
+
+from agents import Model
+from agents.items import ModelResponse, TResponseStreamEvent
+
+from group_genie.limiter import model_call
+
+
+class LimitedModel(Model):
+    """OpenAI Agents SDK model wrapper that runs model calls under a process-wide
+    [`ModelLimiter`][group_genie.limiter.ModelLimiter].
+
+    Can be used as model of [`DefaultAgent`][group_genie.agent.provider.openai.DefaultAgent]
+    and any other OpenAI Agents SDK agent. Calls are not limited if no limiter is
+    configured for the provider key.
+
+    Example:
+        ```python
+        from agents import OpenAIResponsesModel
+
+        configure_model_limiter("openai", max_concurrency=32, requests_per_second=10)
+
+        agent = DefaultAgent(
+            system_prompt="You are a helpful assistant",
+            model=LimitedModel(OpenAIResponsesModel(model="gpt-5", openai_client=client)),
+            model_settings=ModelSettings(),
+        )
+        ```
+    """
+
+    def __init__(self, wrapped: Model, key: str = "openai"):
+        """Initialize the wrapper.
+
+        Args:
+            wrapped: Model instance.
+            key: Provider key of the limiter.
+        """
+        self.wrapped = wrapped
+        self.key = key
+
+    async def get_response(self, *args: Any, **kwargs: Any) -> ModelResponse:
+        async with model_call(self.key):
+            return await self.wrapped.get_response(*args, **kwargs)
+
+    async def stream_response(self, *args: Any, **kwargs: Any) -> AsyncIterator[TResponseStreamEvent]:  # type: ignore[override]
+        async with model_call(self.key):
+            async for event in self.wrapped.stream_response(*args, **kwargs):
+                yield event
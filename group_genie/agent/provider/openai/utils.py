@@ -5,6 +5,7 @@ from agents.mcp import MCPServer
 from mcp.types import CallToolResult, TextContent
 
 from group_genie.agent.approval import ApprovalCallback
+from group_genie.agent.cache import ToolCache
 
 
 class MCPApprovalInterceptor(MCPServer):
@@ -25,6 +26,8 @@ class MCPApprovalInterceptor(MCPServer):
         _wrapped: The underlying MCP server being wrapped.
         _callback: Context variable containing the approval callback for the
             current agent run.
+        _cache: Optional cache for results of idempotent tools. Cache hits skip
+            approval and execution. Error results are not cached.
 
     Example:
         ```python
@@ -40,15 +43,25 @@ class MCPApprovalInterceptor(MCPServer):
         ```
     """
 
-    def __init__(self, wrapped: MCPServer, callback: ContextVar[ApprovalCallback]):
+    def __init__(
+        self,
+        wrapped: MCPServer,
+        callback: ContextVar[ApprovalCallback],
+        cache: ToolCache | None = None,
+    ):
         super().__init__(use_structured_content=wrapped.use_structured_content)
         self._wrapped = wrapped
         self._callback = callback
+        self._cache = cache
 
     @property
     def name(self) -> str:
         return self._wrapped.name
 
+    @property
+    def _cache_namespace(self) -> str:
+        return f"mcp:{self.name}"
+
     async def connect(self):
         await self._wrapped.connect()
 
@@ -73,13 +86,24 @@ class MCPApprovalInterceptor(MCPServer):
             CallToolResult containing either the tool's output (if approved) or
                 a denial message (if denied).
         """
+        if self._cache is not None and self._cache.cached(tool_name):
+            try:
+                return self._cache.get(tool_name, arguments, namespace=self._cache_namespace)
+            except KeyError:
+                pass
+
         callback = self._callback.get()
-        if await callback(tool_name=tool_name, tool_args=arguments):  # type: ignore
-            return await self._wrapped.call_tool(tool_name, arguments)
-        else:
+        if not await callback(tool_name=tool_name, tool_args=arguments):  # type: ignore
             text = f"Action denied: {tool_name}({arguments})"
             return CallToolResult(content=[TextContent(type="text", text=text)], isError=False)
 
+        result = await self._wrapped.call_tool(tool_name, arguments)
+
+        if self._cache is not None and not result.isError:
+            self._cache.put(tool_name, arguments, result, namespace=self._cache_namespace)
+
+        return result
+
     async def list_prompts(self) -> Any:
         return await self._wrapped.list_prompts()
 
@@ -1,3 +1,6 @@
 from group_genie.agent.provider.pydantic_ai.agent import DefaultAgent
+from group_genie.agent.provider.pydantic_ai.cassette import RecordingModel, ReplayModel
 from group_genie.agent.provider.pydantic_ai.group import DefaultGroupReasoner
+from group_genie.agent.provider.pydantic_ai.history import DefaultSummarizer
+from group_genie.agent.provider.pydantic_ai.model import LimitedModel
 from group_genie.agent.provider.pydantic_ai.utils import ToolFilter
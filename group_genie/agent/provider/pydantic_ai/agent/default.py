@@ -1,18 +1,23 @@
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
+from dataclasses import replace
 
 from pydantic_ai import Agent as AgentImpl
 from pydantic_ai.builtin_tools import AbstractBuiltinTool
-from pydantic_ai.messages import BinaryContent
+from pydantic_ai.messages import BinaryContent, ModelMessage, ModelRequest, SystemPromptPart
 from pydantic_ai.models import Model
 from pydantic_ai.settings import ModelSettings
 from pydantic_ai.toolsets import AbstractToolset, CombinedToolset, FunctionToolset
 
 from group_genie.agent.base import Agent, AgentInput, ApprovalCallback
+from group_genie.agent.cache import ToolCache
 from group_genie.agent.factory import AsyncTool
+from group_genie.agent.history import HistoryPolicy
 from group_genie.agent.provider.pydantic_ai.agent.prompt import user_prompt
 from group_genie.agent.provider.pydantic_ai.base import Stateful
-from group_genie.agent.provider.pydantic_ai.utils import ApprovalInterceptor
+from group_genie.agent.provider.pydantic_ai.history import apply_history_policy
+from group_genie.agent.provider.pydantic_ai.utils import ApprovalInterceptor, convert_usage
+from group_genie.usage import Usage
 
 
 class DefaultAgent(Stateful, Agent):
@@ -59,6 +64,8 @@ class DefaultAgent(Stateful, Agent):
         toolsets: list[AbstractToolset] = [],
         tools: list[AsyncTool] = [],
         builtin_tools: list[AbstractBuiltinTool] = [],
+        history_policy: HistoryPolicy | None = None,
+        tool_cache: ToolCache | None = None,
     ):
         """Initialize a pydantic-ai based agent.
 
@@ -72,8 +79,13 @@ class DefaultAgent(Stateful, Agent):
                 organized sets of related tools.
             tools: List of individual async functions to make available as tools.
             builtin_tools: List of pydantic-ai built-in tools (e.g., WebSearchTool).
+            history_policy: Optional policy that bounds the conversation history sent
+                with each run (and persisted). Unbounded if None.
+            tool_cache: Optional cache for results of idempotent tools. Cache hits
+                skip approval and execution of tool calls.
         """
         super().__init__()
+        self.history_policy = history_policy
 
         function_toolset = FunctionToolset(tools=tools)
         combined_toolset = CombinedToolset(toolsets=[*toolsets, function_toolset])
@@ -81,6 +93,7 @@ class DefaultAgent(Stateful, Agent):
         self._interceptor = ApprovalInterceptor(
             wrapped=combined_toolset,
             callback=ContextVar("callback"),
+            cache=tool_cache,
         )
         self._agent: AgentImpl[None, str] = AgentImpl(
             system_prompt=system_prompt,
@@ -90,6 +103,8 @@ class DefaultAgent(Stateful, Agent):
             builtin_tools=builtin_tools,
             output_type=str,
         )
+        self._usage: Usage | None = None
+        self._new_messages: list[ModelMessage] = []
 
     @asynccontextmanager
     async def mcp(self):
@@ -132,6 +147,9 @@ class DefaultAgent(Stateful, Agent):
 
         prompt.extend(user_prompt(input))
 
+        if self.history_policy is not None:
+            self._history = await apply_history_policy(self.history_policy, self._history)
+
         self._interceptor.callback.set(callback)
         result = await self._agent.run(prompt, message_history=self._history)
 
@@ -142,4 +160,23 @@ class DefaultAgent(Stateful, Agent):
             new_messages[0].parts[-1].content.pop(-2)
 
         self._history = result.all_messages()
+        self._new_messages = result.new_messages()
+        self._usage = convert_usage(result.usage())
         return result.output
+
+    def usage(self) -> Usage | None:
+        """Return the model usage of the last run, including all model requests and tool calls."""
+        return self._usage
+
+    def merge(self, fork: Agent):
+        """Append the messages of the last run of a fork to the conversation history."""
+        if not isinstance(fork, DefaultAgent):
+            raise TypeError(f"Cannot merge {type(fork).__name__} into {type(self).__name__}")
+
+        messages = fork._new_messages.copy()
+
+        if self._history and messages and isinstance(first := messages[0], ModelRequest):
+            # fork started from an empty history, system prompt is already in this history
+            messages[0] = replace(first, parts=[part for part in first.parts if not isinstance(part, SystemPromptPart)])
+
+        self._history.extend(messages)
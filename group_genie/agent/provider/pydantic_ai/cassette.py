@@ -0,0 +1,124 @@
+import asyncio
+from contextlib import asynccontextmanager
+from time import perf_counter
+from typing import Any, AsyncIterator
+
+from pydantic_ai import RunContext
+from pydantic_ai.messages import ModelMessage, ModelMessagesTypeAdapter, ModelResponse
+from pydantic_ai.models import KnownModelName, Model, ModelRequestParameters, StreamedResponse
+from pydantic_ai.models.wrapper import WrapperModel
+from pydantic_ai.settings import ModelSettings
+from pydantic_core import to_jsonable_python
+
+from group_genie.cassette import Cassette, request_key
+
+
+class RecordingModel(WrapperModel):
+    """pydantic-ai model wrapper that records responses and latencies of model
+    requests to a [`Cassette`][group_genie.cassette.Cassette].
+
+    Responses, including tool calls, can be replayed offline with
+    [`ReplayModel`][group_genie.agent.provider.pydantic_ai.ReplayModel]. Only
+    non-streaming requests are recorded (as made by
+    [`DefaultAgent`][group_genie.agent.provider.pydantic_ai.DefaultAgent] and
+    [`DefaultGroupReasoner`][group_genie.agent.provider.pydantic_ai.DefaultGroupReasoner]).
+
+    Example:
+        ```python
+        cassette = Cassette(Path(".data", "cassettes", "system.jsonl"))
+
+        def create_system_agent(secrets, extra_tools, agent_infos):
+            return DefaultAgent(
+                system_prompt="You are a helpful assistant",
+                model=RecordingModel("google-gla:gemini-3-flash-preview", cassette),
+                # model=ReplayModel(cassette),
+            )
+        ```
+    """
+
+    def __init__(self, wrapped: Model | KnownModelName | str, cassette: Cassette):
+        """Initialize the wrapper.
+
+        Args:
+            wrapped: Model instance or identifier.
+            cassette: Cassette to record to.
+        """
+        super().__init__(wrapped)  # type: ignore[arg-type]
+        self.cassette = cassette
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        start = perf_counter()
+        response = await super().request(messages, model_settings, model_request_parameters)
+        self.cassette.record(
+            key=messages_key(messages),
+            response=to_jsonable_python(ModelMessagesTypeAdapter.dump_python([response]), bytes_mode="base64"),
+            latency=perf_counter() - start,
+        )
+        return response
+
+
+class ReplayModel(Model):
+    """pydantic-ai model that replays responses recorded by a
+    [`RecordingModel`][group_genie.agent.provider.pydantic_ai.RecordingModel].
+
+    Responses are served after the latency observed during recording, multiplied
+    by `latency_scale`, or after a latency sampled from the recorded latency
+    distribution. Does not access the network.
+    """
+
+    def __init__(self, cassette: Cassette, latency_scale: float = 1.0, sample_latency: bool = False):
+        """Initialize the replay model.
+
+        Args:
+            cassette: Cassette to replay.
+            latency_scale: Factor applied to replayed latencies (0 disables latency).
+            sample_latency: If True, latencies are sampled from all recorded latencies
+                instead of using the latency recorded for the response.
+        """
+        super().__init__()
+        self.cassette = cassette
+        self.latency_scale = latency_scale
+        self.sample_latency = sample_latency
+
+    @property
+    def model_name(self) -> str:
+        return "replay"
+
+    @property
+    def system(self) -> str:
+        return "replay"
+
+    @property
+    def provider(self) -> None:
+        return None
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        entry = self.cassette.lookup(messages_key(messages))
+        latency = self.cassette.sample_latency() if self.sample_latency else entry.latency
+        await asyncio.sleep(latency * self.latency_scale)
+        return ModelMessagesTypeAdapter.validate_python(entry.response)[0]  # type: ignore[return-value]
+
+    @asynccontextmanager
+    async def request_stream(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+        run_context: RunContext[Any] | None = None,
+    ) -> AsyncIterator[StreamedResponse]:
+        raise NotImplementedError("Streaming requests cannot be replayed")
+        yield
+
+
+def messages_key(messages: list[ModelMessage]) -> str:
+    return request_key(to_jsonable_python(ModelMessagesTypeAdapter.dump_python(messages), bytes_mode="base64"))
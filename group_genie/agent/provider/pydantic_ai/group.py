@@ -5,8 +5,10 @@ from group_sense import Response
 from pydantic_ai.models import Model
 from pydantic_ai.settings import ModelSettings
 
+from group_genie.agent.provider.pydantic_ai.utils import messages_usage
 from group_genie.message import Attachment, Message, Thread
 from group_genie.reasoner import GroupReasoner
+from group_genie.usage import Usage
 
 
 class DefaultGroupReasoner(GroupReasoner):
@@ -67,6 +69,7 @@ class DefaultGroupReasoner(GroupReasoner):
             model=model,
             model_settings=model_settings,
         )
+        self._usage: Usage | None = None
 
     @property
     def processed(self) -> int:
@@ -90,7 +93,16 @@ class DefaultGroupReasoner(GroupReasoner):
         Returns:
             Response from group-sense with decision and optional query/receiver.
         """
-        return await self._reasoner.process(convert_messages(updates))
+        offset = len(self._reasoner._history)
+        try:
+            return await self._reasoner.process(convert_messages(updates))
+        finally:
+            # group-sense does not expose the run result, usage is derived from new history messages
+            self._usage = messages_usage(self._reasoner._history[offset:])
+
+    def usage(self) -> Usage | None:
+        """Return the model usage of the last run."""
+        return self._usage
 
 
 def convert_messages(messages: list[Message]) -> list[gs.Message]:
@@ -0,0 +1,119 @@
+from dataclasses import replace
+
+from pydantic_ai import Agent as AgentImpl
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelRequest,
+    ModelResponse,
+    SystemPromptPart,
+    TextPart,
+    ToolCallPart,
+    ToolReturnPart,
+    UserPromptPart,
+)
+from pydantic_ai.models import Model
+from pydantic_ai.settings import ModelSettings
+
+from group_genie.agent.history import HistoryPolicy, Summarizer, split_turns
+
+SUMMARY_PREFIX = "Summary of the earlier conversation:"
+SUMMARY_INSTRUCTIONS = """Summarize the following conversation between a user and an AI assistant.
+Preserve facts, user requests and decisions, results of tool calls and subagent runs (including subagent
+names and instance ids) and open questions that may be relevant for continuing the conversation. If the
+conversation starts with a summary of an even earlier conversation, merge it into your summary. Respond
+with the summary only."""
+
+MAX_RENDERED_CONTENT = 2000
+
+
+class DefaultSummarizer(Summarizer):
+    """[`Summarizer`][group_genie.agent.Summarizer] implementation using a
+    [pydantic-ai](https://ai.pydantic.dev/) agent.
+
+    Example:
+        ```python
+        summarizer = DefaultSummarizer(model="google-gla:gemini-3-flash-preview")
+        ```
+    """
+
+    def __init__(
+        self,
+        model: str | Model,
+        model_settings: ModelSettings | None = None,
+        instructions: str = SUMMARY_INSTRUCTIONS,
+    ):
+        """Initialize the summarizer.
+
+        Args:
+            model: Model identifier or pydantic-ai Model instance. A small, fast model
+                is usually sufficient.
+            model_settings: Optional model-specific settings.
+            instructions: Summarization instructions.
+        """
+        self._agent: AgentImpl[None, str] = AgentImpl(
+            model=model,
+            model_settings=model_settings,
+            system_prompt=instructions,
+            output_type=str,
+        )
+
+    async def summarize(self, transcript: str) -> str:
+        result = await self._agent.run(transcript)
+        return result.output
+
+
+async def apply_history_policy(policy: HistoryPolicy, history: list[ModelMessage]) -> list[ModelMessage]:
+    """Apply a history policy to a pydantic-ai message history.
+
+    System prompt parts of the first message are moved to the first retained
+    message, as pydantic-ai only adds them to an empty history.
+    """
+    turns = split_turns(history, is_turn_start)
+    result = await policy.apply(turns, render=render, summary_turn=summary_turn)
+
+    if result is turns:
+        return history
+
+    messages = [message for turn in result for message in turn]
+
+    if not messages or not isinstance(first := messages[0], ModelRequest) or not history:
+        return messages
+
+    system_parts = [part for part in history[0].parts if isinstance(part, SystemPromptPart)]
+    other_parts = [part for part in first.parts if not isinstance(part, SystemPromptPart)]
+    messages[0] = replace(first, parts=[*system_parts, *other_parts])
+    return messages
+
+
+def is_turn_start(message: ModelMessage) -> bool:
+    return isinstance(message, ModelRequest) and any(isinstance(part, UserPromptPart) for part in message.parts)
+
+
+def summary_turn(summary: str) -> list[ModelMessage]:
+    return [
+        ModelRequest(parts=[UserPromptPart(content=f"{SUMMARY_PREFIX}\n\n{summary}")]),
+        ModelResponse(parts=[TextPart(content="Understood.")]),
+    ]
+
+
+def render(messages: list[ModelMessage]) -> str:
+    lines: list[str] = []
+    for message in messages:
+        for part in message.parts:
+            match part:
+                case UserPromptPart(content=str() as content):
+                    lines.append(f"User: {truncate(content)}")
+                case UserPromptPart(content=content):
+                    text = " ".join(item if isinstance(item, str) else "[attachment]" for item in content)
+                    lines.append(f"User: {truncate(text)}")
+                case TextPart(content=content):
+                    lines.append(f"Assistant: {truncate(content)}")
+                case ToolCallPart():
+                    lines.append(f"Tool call: {part.tool_name}({truncate(part.args_as_json_str())})")
+                case ToolReturnPart():
+                    lines.append(f"Tool return ({part.tool_name}): {truncate(part.model_response_str())}")
+    return "\n\n".join(lines)
+
+
+def truncate(text: str, max_length: int = MAX_RENDERED_CONTENT) -> str:
+    return text if len(text) <= max_length else text[:max_length] + " ..."
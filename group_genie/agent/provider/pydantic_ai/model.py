@@ -0,0 +1,65 @@
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from pydantic_ai import RunContext
+from pydantic_ai.messages import ModelMessage, ModelResponse
+from pydantic_ai.models import KnownModelName, Model, ModelRequestParameters, StreamedResponse
+from pydantic_ai.models.wrapper import WrapperModel
+from pydantic_ai.settings import ModelSettings
+
+from group_genie.limiter import model_call
+
+
+class LimitedModel(WrapperModel):
+    """pydantic-ai model wrapper that runs model requests under a process-wide
+    [`ModelLimiter`][group_genie.limiter.ModelLimiter].
+
+    Can be used as model of [`DefaultAgent`][group_genie.agent.provider.pydantic_ai.DefaultAgent],
+    [`DefaultGroupReasoner`][group_genie.agent.provider.pydantic_ai.DefaultGroupReasoner]
+    and any other pydantic-ai agent. Requests are not limited if no limiter is
+    configured for the model's provider key.
+
+    Example:
+        ```python
+        configure_model_limiter("google-gla", max_concurrency=16, requests_per_second=5)
+
+        reasoner = DefaultGroupReasoner(
+            system_prompt="...",
+            model=LimitedModel("google-gla:gemini-3-flash-preview"),
+        )
+        ```
+    """
+
+    def __init__(self, wrapped: Model | KnownModelName | str, key: str | None = None):
+        """Initialize the wrapper.
+
+        Args:
+            wrapped: Model instance or identifier.
+            key: Provider key of the limiter. Defaults to the model's `system`
+                (e.g. `openai`, `google-gla`).
+        """
+        super().__init__(wrapped)  # type: ignore[arg-type]
+        self.key = key or self.wrapped.system
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        async with model_call(self.key):
+            return await super().request(messages, model_settings, model_request_parameters)
+
+    @asynccontextmanager
+    async def request_stream(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+        run_context: RunContext[Any] | None = None,
+    ) -> AsyncIterator[StreamedResponse]:
+        async with model_call(self.key):
+            async with super().request_stream(
+                messages, model_settings, model_request_parameters, run_context
+            ) as response_stream:
+                yield response_stream
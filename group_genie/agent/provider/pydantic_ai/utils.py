@@ -2,10 +2,15 @@ from contextvars import ContextVar
 from dataclasses import dataclass
 from typing import Any
 
+from pydantic_ai.messages import ModelMessage, ModelResponse, ToolCallPart
 from pydantic_ai.tools import ToolDefinition
-from pydantic_ai.toolsets import WrapperToolset
+from pydantic_ai.toolsets import AbstractToolset, FunctionToolset, WrapperToolset
+from pydantic_ai.toolsets.abstract import ToolsetTool
+from pydantic_ai.usage import RunUsage
 
 from group_genie.agent.base import ApprovalCallback
+from group_genie.agent.cache import ToolCache
+from group_genie.usage import Usage
 
 
 @dataclass
@@ -52,9 +57,58 @@ class ToolFilter:
 @dataclass
 class ApprovalInterceptor(WrapperToolset):
     callback: ContextVar[ApprovalCallback] = ContextVar("callback")
+    cache: ToolCache | None = None
 
     async def call_tool(self, name: str, tool_args: dict[str, Any], ctx, tool) -> Any:
+        namespace = cache_namespace(name, tool)
+
+        if self.cache is not None and self.cache.cached(name):
+            try:
+                return self.cache.get(name, tool_args, namespace=namespace)
+            except KeyError:
+                pass
+
         callback = self.callback.get()
         if not await callback(tool_name=name, tool_args=tool_args):  # type: ignore
             return f"Action denied: {name}({tool_args})"
-        return await self.wrapped.call_tool(name, tool_args, ctx, tool)
+
+        result = await self.wrapped.call_tool(name, tool_args, ctx, tool)
+
+        if self.cache is not None:
+            self.cache.put(name, tool_args, result, namespace=namespace)
+
+        return result
+
+
+def cache_namespace(name: str, tool: ToolsetTool) -> str:
+    """Return the [`ToolCache`][group_genie.agent.ToolCache] namespace of a tool: the
+    qualified name of the function of a function tool, the ID or label of other toolsets
+    (e.g. MCP servers)."""
+    toolset: AbstractToolset = getattr(tool, "source_toolset", tool.toolset)
+    if isinstance(toolset, FunctionToolset) and (function_tool := toolset.tools.get(name)) is not None:
+        function = function_tool.function
+        return f"{function.__module__}.{function.__qualname__}"
+    return toolset.id or toolset.label
+
+
+def convert_usage(usage: RunUsage) -> Usage:
+    return Usage(
+        input_tokens=usage.input_tokens,
+        output_tokens=usage.output_tokens,
+        requests=usage.requests,
+        tool_calls=usage.tool_calls,
+    )
+
+
+def messages_usage(messages: list[ModelMessage]) -> Usage:
+    """Sum the usage of all model responses in `messages`."""
+    usage = Usage()
+    for message in messages:
+        if isinstance(message, ModelResponse):
+            usage += Usage(
+                input_tokens=message.usage.input_tokens,
+                output_tokens=message.usage.output_tokens,
+                requests=1,
+                tool_calls=sum(isinstance(part, ToolCallPart) for part in message.parts),
+            )
+    return usage
@@ -1,15 +1,33 @@
 import json
 import logging
-from asyncio import CancelledError, Future, Queue, Task, create_task, sleep
+from asyncio import (
+    FIRST_COMPLETED,
+    CancelledError,
+    Future,
+    Queue,
+    Task,
+    create_task,
+    gather,
+    shield,
+    sleep,
+    wait,
+    wait_for,
+)
+from contextlib import AsyncExitStack
 from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import AsyncIterator
+from time import perf_counter, time
+from typing import Any, AsyncIterator
 
+from group_genie import tracing, usage
 from group_genie.agent.approval import Approval, ApprovalContext
 from group_genie.agent.base import Agent, AgentInput
 from group_genie.agent.factory import AgentFactory, AsyncTool
 from group_genie.datastore import DataStore, narrow
+from group_genie.footprint import RunnerFootprint, sizeof
 from group_genie.message import Attachment
+from group_genie.metrics import AGENT_QUEUE_WAIT, AGENT_RUN_DURATION, RUNNERS_CANCELLED, SUBAGENT_RUN_DURATION
+from group_genie.stats import Health, RunnerStats
 from group_genie.utils import identifier
 
 logger = logging.getLogger(__name__)
@@ -34,15 +52,30 @@ class AgentRunner:
         extra_tools = extra_tools or {}
         extra_tools |= {"run_subagent": self.run_subagent}
 
-        self._agent: Agent = agent_factory.create_agent(name=name, owner=owner, extra_tools=extra_tools)
+        self._extra_tools = extra_tools
+        self._agent: Agent  # created by worker
+        self._secrets: dict[str, str] = {}
         self._idle_timeout = agent_factory.agent_info(name=name).idle_timeout
+        self._timeout = agent_factory.agent_info(name=name).timeout
+        self._max_forks = agent_factory.agent_info(name=name).max_forks
+        self._stateless = agent_factory.agent_info(name=name).stateless
+        self._pool_size = agent_factory.agent_info(name=name).pool_size
         self._idle_timer: Task | None = None
+        self._idle_deadline: float | None = None
+        self._ready: Future[bool] = Future()
+        self._health = Health()
+        self._running: dict[int, float] = {}  # creation times of running invokes
 
         self._subagent_runners: dict[str, AgentRunner] = {}
+        self._main_task: Task | None = None
+        self._fork_tasks: set[Task] = set()
+        self._pool_tasks: set[Task] = set()
+        self._pending_merges: list[Agent] = []
         self._approval_context = ContextVar[ApprovalContext]("approval_context")
         self._worker_queue: Queue[Invoke | Stop] = Queue()
         self._worker_task = create_task(self._work())
         self._stopped = False
+        self._cancelled = False
 
     @property
     def stopped(self) -> bool:
@@ -53,6 +86,17 @@ class AgentRunner:
             self._stopped = True
             self._worker_queue.put_nowait(Stop())
 
+    def cancel(self):
+        """Stop the runner immediately.
+
+        Cancels in-flight invokes and those of subagent runners, fails queued
+        invokes and saves the agent state before the runner stops.
+        """
+        if not self._worker_task.done():
+            self._stopped = True
+            self._cancelled = True
+            self._worker_task.cancel()
+
     def _stop_subagents(self):
         for runner in self._subagent_runners.values():
             runner.stop()
@@ -65,31 +109,83 @@ class AgentRunner:
         else:
             self.stop()
 
-    async def join(self):
+    async def join(self, timeout: float | None = None):
+        """Wait for the runner to stop.
+
+        Args:
+            timeout: Seconds to wait before the runner is cancelled with
+                [`cancel()`][group_genie.agent.runner.AgentRunner.cancel]. None means
+                waiting until in-flight invokes completed.
+        """
+        if timeout is not None:
+            await wait([self._worker_task], timeout=timeout)
+            self.cancel()
         await self._worker_task
         if self._idle_timer is not None:
             self._idle_timer.cancel()
             await self._idle_timer
 
     async def _join_subagents(self):
-        for runner in self._subagent_runners.values():
-            await runner.join()
+        await gather(*[runner.join() for runner in self._subagent_runners.values()])
 
     def invoke(self, input: AgentInput, context: ApprovalContext) -> Future[str]:
-        if self._idle_timer is not None:
-            self._idle_timer.cancel()
-            self._idle_timer = None
-
         if self._stopped:
             raise RuntimeError(f"Agent {self.key} stopped")
 
         invoke = Invoke(input=input, context=context)
         self._worker_queue.put_nowait(invoke)
+        self.reset_idle_timer()
+        return invoke.future
+
+    def reset_idle_timer(self):
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+            self._idle_deadline = None
 
-        if self._idle_timeout is not None:
+        if self._idle_timeout is not None and not self._stopped:
             self._idle_timer = create_task(self._stop_after(self._idle_timeout))
+            self._idle_deadline = time() + self._idle_timeout
 
-        return invoke.future
+    async def ready(self) -> bool:
+        """Wait until the runner is initialized and ready to process invokes.
+
+        Returns:
+            True if initialization succeeded, False if it failed.
+        """
+        return await shield(self._ready)
+
+    def stats(self) -> RunnerStats:
+        now = perf_counter()
+        return RunnerStats(
+            key=self.key,
+            owner=self.owner,
+            kind="agent",
+            live=self._ready.done() and self._ready.result() and not self._worker_task.done(),
+            stopped=self._stopped,
+            idle_deadline=None if self._stopped else self._idle_deadline,
+            queued=self._worker_queue.qsize(),
+            in_flight=len(self._running),
+            in_flight_age=now - min(self._running.values()) if self._running else None,
+            pending_saves=self._health.pending_saves,
+            last_error=self._health.last_error,
+            subagents=[runner.stats() for runner in self._subagent_runners.values()],
+        )
+
+    def footprint(self) -> RunnerFootprint:
+        ready = self._ready.done() and self._ready.result()
+        active = ready and not self._worker_task.done()
+        tasks = [self._worker_task, self._idle_timer, self._main_task, *self._fork_tasks, *self._pool_tasks]
+        return RunnerFootprint(
+            key=self.key,
+            owner=self.owner,
+            kind="agent",
+            state_bytes=sizeof(self._agent.get_serialized()) if ready else 0,
+            queued=self._worker_queue.qsize(),
+            tasks=sum(1 for task in tasks if task is not None and not task.done()),
+            mcp_contexts=(self._pool_size if self._stateless else 1 + len(self._fork_tasks)) if active else 0,
+            subagents=[runner.footprint() for runner in self._subagent_runners.values()],
+        )
 
     async def run(self, input: AgentInput) -> AsyncIterator[Approval | str]:
         queue: Queue[Approval | Future[str]] = Queue()
@@ -150,7 +246,54 @@ class AgentRunner:
         if subagent_instance is None:
             subagent_instance = identifier()[:8]
 
-        key = f"{subagent_name}:{subagent_instance}"
+        runner = await self.get_subagent_runner(subagent_name, subagent_instance)
+        start = perf_counter()
+
+        with tracing.span("run_subagent", subagent=runner.key) as span:
+            try:
+                input = AgentInput(
+                    query=query,
+                    attachments=attachments,
+                )
+                response = await runner.invoke(
+                    input=input,
+                    context=self._approval_context.get(),
+                )
+            except Exception as e:
+                logger.exception("Subagent error")
+                span.error = repr(e)
+                response = f"Subagent ({subagent_name}) error: {e}"
+            finally:
+                SUBAGENT_RUN_DURATION.observe(perf_counter() - start, subagent=subagent_name)
+
+        result = {
+            "subagent_name": subagent_name,
+            "subagent_instance": subagent_instance,
+            "subagent_response": response,
+        }
+
+        result_json = json.dumps(result, indent=2)
+        logger.debug(result_json)
+        return result_json
+
+    async def get_subagent_runner(self, subagent_name: str, subagent_instance: str) -> "AgentRunner":
+        """Get or create the runner of a subagent instance owned by this runner.
+
+        Stopped runners (e.g. after their idle timeout) are replaced by a new runner
+        that loads the persisted subagent state.
+
+        Args:
+            subagent_name: The name of a registered agent.
+            subagent_instance: The instance id of the subagent.
+
+        Returns:
+            The [`AgentRunner`][group_genie.agent.runner.AgentRunner] of the subagent
+                instance.
+        """
+        if self.agent_factory.agent_info(name=subagent_name).stateless:
+            key = subagent_name  # single pool for all instances
+        else:
+            key = f"{subagent_name}:{subagent_instance}"
 
         if runner := self._subagent_runners.get(key):
             if runner.stopped:
@@ -167,30 +310,7 @@ class AgentRunner:
             )
             self._subagent_runners[key] = runner
 
-        runner = self._subagent_runners[key]
-
-        try:
-            input = AgentInput(
-                query=query,
-                attachments=attachments,
-            )
-            response = await runner.invoke(
-                input=input,
-                context=self._approval_context.get(),
-            )
-        except Exception as e:
-            logger.exception("Subagent error")
-            response = f"Subagent ({subagent_name}) error: {e}"
-
-        result = {
-            "subagent_name": subagent_name,
-            "subagent_instance": subagent_instance,
-            "subagent_response": response,
-        }
-
-        result_json = json.dumps(result, indent=2)
-        logger.debug(result_json)
-        return result_json
+        return self._subagent_runners[key]
 
     def _save(self, data_store: DataStore | None) -> Future[None]:
         if data_store is None:
@@ -199,7 +319,7 @@ class AgentRunner:
             return future
 
         system_agent_data = {"agent": self._agent.get_serialized()}
-        return data_store.save(self.key, system_agent_data)
+        return self._health.track(data_store.save(self.key, system_agent_data))
 
     async def _load(self, data_store: DataStore | None):
         if data_store is None:
@@ -214,34 +334,240 @@ class AgentRunner:
 
     async def _work(self):
         try:
+            self._secrets = await self.agent_factory.get_secrets(self.owner)
+            if self._stateless:
+                await self._work_pool()
+                return
+            self._agent = self._create_agent()
             async with self._agent.mcp():
                 async with narrow(self.data_store, self.owner) as data_store:
                     await self._load(data_store)
+                    self._ready.set_result(True)
                     await self._loop(data_store)
-        except Exception:
-            # TODO: drain queue and set exception on futures
+        except CancelledError:
+            self._stopped = True
+            if not self._ready.done():
+                self._ready.set_result(False)
+            self._reject_queued(RuntimeError(f"Agent {self.key} cancelled"))
+            if not self._cancelled:
+                raise
+        except Exception as e:
             logger.exception("Error during worker initialization")
-            raise
+            self._fail(e)
+
+    async def _work_pool(self):
+        async with AsyncExitStack() as stack:
+            pool = Queue[Agent]()
+            for _ in range(self._pool_size):
+                agent = self._create_agent()
+                await stack.enter_async_context(agent.mcp())
+                pool.put_nowait(agent)
+
+            self._agent = agent  # provides initial state of pooled agents
+            self._ready.set_result(True)
+            await self._loop_pool(pool)
+
+    def _create_agent(self) -> Agent:
+        return self.agent_factory.create_agent(
+            name=self.name,
+            owner=self.owner,
+            extra_tools=self._extra_tools,
+            secrets=self._secrets,
+        )
+
+    def _forkable(self) -> bool:
+        if self._max_forks > 0 and type(self._agent).merge is Agent.merge:
+            logger.warning(f"Agent {self.key} does not implement merge(), forking disabled")
+            self._max_forks = 0
+        return self._max_forks > 0
+
+    def _fail(self, e: Exception):
+        self._stopped = True
+        self._health.error("init", e)
+        if not self._ready.done():
+            self._ready.set_result(False)
+        self._reject_queued(e)
+
+    def _reject_queued(self, e: Exception):
+        while not self._worker_queue.empty():
+            match self._worker_queue.get_nowait():
+                case Invoke(future=future) if not future.done():
+                    future.set_exception(e)
 
     async def _loop(self, data_store: DataStore | None):
+        forkable = self._forkable()
+
+        try:
+            while True:
+                match await self._worker_queue.get():
+                    case Invoke() as invoke if forkable:
+                        await self._dispatch(invoke, data_store)
+                    case Invoke() as invoke:
+                        if await self._run(self._agent, invoke):
+                            self._save(data_store)  # background
+                    case Stop():
+                        if self._main_task is not None:
+                            await self._main_task
+                        await gather(*self._fork_tasks)
+                        await self._save(data_store)
+                        self._stop_subagents()
+                        await self._join_subagents()
+                        logger.debug(f"Agent {self.key} stopped")
+                        break
+        except CancelledError:
+            await self._abort(data_store)
+            raise
+
+    async def _loop_pool(self, pool: Queue[Agent]):
+        initial_state = self._agent.get_serialized()
+
+        try:
+            while True:
+                match await self._worker_queue.get():
+                    case Invoke() as invoke:
+                        agent = await pool.get()
+                        task = create_task(self._run_pooled(agent, invoke, pool, initial_state))
+                        task.add_done_callback(self._pool_tasks.discard)
+                        self._pool_tasks.add(task)
+                    case Stop():
+                        await gather(*self._pool_tasks)
+                        self._stop_subagents()
+                        await self._join_subagents()
+                        logger.debug(f"Agent {self.key} stopped")
+                        break
+        except CancelledError:
+            await self._abort(None)  # pooled agents are stateless
+            raise
+
+    async def _abort(self, data_store: DataStore | None):
+        tasks = [task for task in [self._main_task, *self._fork_tasks, *self._pool_tasks] if task is not None]
+        for task in tasks:
+            task.cancel()
+        for runner in self._subagent_runners.values():
+            runner.cancel()
+        await gather(*tasks, self._join_subagents(), return_exceptions=True)
+
+        # forks that completed while the cancelled main instance was running
+        for fork in self._pending_merges:
+            self._merge(fork)
+        self._pending_merges.clear()
+
+        await self._save(data_store)
+        RUNNERS_CANCELLED.inc(kind="agent")
+        logger.warning(f"Agent {self.key} cancelled after shutdown deadline")
+
+    async def _run_pooled(self, agent: Agent, invoke: "Invoke", pool: Queue[Agent], initial_state: Any):
+        try:
+            agent.set_serialized(initial_state)
+            await self._run(agent, invoke)
+        except Exception as e:
+            logger.exception(f"Error during pooled run of agent {self.key}")
+            self._health.error("run", e)
+            if not invoke.future.done():
+                invoke.future.set_exception(e)
+        finally:
+            pool.put_nowait(agent)
+
+    async def _dispatch(self, invoke: "Invoke", data_store: DataStore | None):
         while True:
-            match await self._worker_queue.get():
-                case Invoke(input=input, context=context, future=future):
-                    self._approval_context.set(context)
-                    try:
-                        callback = context.approval_callback(sender=self.key)
-                        response = await self._agent.run(input, callback)
-                    except Exception as e:
-                        future.set_exception(e)
-                    else:
-                        future.set_result(response)
-                        self._save(data_store)  # background
-                case Stop():
-                    await self._save(data_store)
-                    self._stop_subagents()
-                    await self._join_subagents()
-                    logger.debug(f"Agent {self.key} stopped")
-                    break
+            if self._main_task is None:
+                self._main_task = create_task(self._run_main(invoke, data_store))
+                return
+            if len(self._fork_tasks) < self._max_forks:
+                task = create_task(self._run_fork(invoke, data_store))
+                task.add_done_callback(self._fork_tasks.discard)
+                self._fork_tasks.add(task)
+                return
+            await wait([self._main_task, *self._fork_tasks], return_when=FIRST_COMPLETED)
+
+    async def _run_main(self, invoke: "Invoke", data_store: DataStore | None):
+        try:
+            changed = await self._run(self._agent, invoke)
+            # merge forks that completed while the main instance was running
+            for fork in self._pending_merges:
+                changed = self._merge(fork) or changed
+            self._pending_merges.clear()
+            if changed:
+                self._save(data_store)  # background
+        finally:
+            self._main_task = None
+
+    async def _run_fork(self, invoke: "Invoke", data_store: DataStore | None):
+        try:
+            fork = self._create_agent()
+            fork.set_serialized(self._agent.get_serialized())
+            async with fork.mcp():
+                if not await self._run(fork, invoke, fork=True):
+                    return
+        except Exception as e:
+            logger.exception(f"Error during fork of agent {self.key}")
+            self._health.error("fork", e)
+            if not invoke.future.done():
+                invoke.future.set_exception(e)
+            return
+
+        if self._main_task is not None:
+            self._pending_merges.append(fork)
+        elif self._merge(fork):
+            self._save(data_store)  # background
+
+    def _merge(self, fork: Agent) -> bool:
+        try:
+            self._agent.merge(fork)
+        except Exception as e:
+            logger.exception(f"Error merging fork into agent {self.key}")
+            self._health.error("merge", e)
+            return False
+        return True
+
+    async def _run(self, agent: Agent, invoke: "Invoke", fork: bool = False) -> bool:
+        queue_wait = perf_counter() - invoke.created
+        AGENT_QUEUE_WAIT.observe(queue_wait, agent=self.name)
+        self._approval_context.set(invoke.context)
+        future = invoke.future
+        start = perf_counter()
+        self._running[id(invoke)] = invoke.created
+        with (
+            usage.use_recorder(invoke.recorder),
+            tracing.span(
+                "agent.run",
+                parent=invoke.span,
+                agent=self.key,
+                owner=self.owner,
+                queue_wait=queue_wait,
+                fork=fork,
+            ) as span,
+        ):
+            try:
+                callback = invoke.context.approval_callback(sender=self.key)
+                response = await wait_for(agent.run(invoke.input, callback), timeout=self._timeout)
+            except CancelledError:
+                AGENT_RUN_DURATION.observe(perf_counter() - start, agent=self.name, outcome="cancelled")
+                if not future.done():
+                    future.set_exception(RuntimeError(f"Agent {self.key} cancelled"))
+                raise
+            except TimeoutError:
+                AGENT_RUN_DURATION.observe(perf_counter() - start, agent=self.name, outcome="timeout")
+                error = TimeoutError(f"Agent {self.key} timed out after {self._timeout}s")
+                span.error = repr(error)
+                self._health.error("timeout", error)
+                if not future.done():
+                    future.set_exception(error)
+            except Exception as e:
+                AGENT_RUN_DURATION.observe(perf_counter() - start, agent=self.name, outcome="error")
+                span.error = repr(e)
+                self._health.error("run", e)
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                AGENT_RUN_DURATION.observe(perf_counter() - start, agent=self.name, outcome="ok")
+                usage.record(self.key, agent.usage())
+                if not future.done():  # cancelled by the caller (e.g. a timed out parent agent)
+                    future.set_result(response)
+                return True
+            finally:
+                self._running.pop(id(invoke), None)
+        return False
 
 
 @dataclass
@@ -249,6 +575,9 @@ class Invoke:
     input: AgentInput
     context: ApprovalContext
     future: Future[str] = field(default_factory=Future)
+    created: float = field(default_factory=perf_counter)
+    span: tracing.Span | None = field(default_factory=tracing.current_span)
+    recorder: usage.UsageRecorder | None = field(default_factory=usage.current_recorder)
 
 
 @dataclass
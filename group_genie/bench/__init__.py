@@ -0,0 +1,11 @@
+from group_genie.bench.e2e import BenchConfig, BenchReport, run_benchmark
+from group_genie.bench.memory import MemoryConfig, MemoryReport, MemorySample, run_memory_benchmark
+from group_genie.bench.models import (
+    SimulatedGroupReasoner,
+    simulated_agent_factory,
+    simulated_group_reasoner_factory,
+    simulated_model,
+)
+from group_genie.bench.persistence import PersistenceConfig, PersistenceResult, run_persistence_benchmark
+from group_genie.bench.replay import ReplayConfig, ReplayReport, TranscriptMessage, load_transcript, run_replay
+from group_genie.bench.stats import StageRecorder, Summary
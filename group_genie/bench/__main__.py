@@ -0,0 +1,197 @@
+import argparse
+import asyncio
+import importlib
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from group_genie.bench.e2e import BenchConfig, run_benchmark
+from group_genie.bench.memory import MemoryConfig, run_memory_benchmark
+from group_genie.bench.persistence import BACKENDS, PersistenceConfig, format_results, run_persistence_benchmark
+from group_genie.bench.replay import ReplayConfig, run_replay
+
+
+def add_e2e_arguments(parser: argparse.ArgumentParser):
+    defaults = BenchConfig()
+    parser.add_argument("--sessions", type=int, default=defaults.sessions, help="number of concurrent sessions")
+    parser.add_argument("--senders", type=int, default=defaults.senders, help="distinct senders per session")
+    parser.add_argument("--messages", type=int, default=defaults.messages, help="messages per session")
+    parser.add_argument("--rate", type=float, default=defaults.rate, help="messages/s per session (0: all at once)")
+    parser.add_argument("--attachments", type=int, default=defaults.attachments, help="attachments per message")
+    parser.add_argument("--attachment-size", type=int, default=defaults.attachment_size, help="attachment bytes")
+    parser.add_argument("--reasoner-latency", type=float, default=defaults.reasoner_latency, help="seconds")
+    parser.add_argument("--agent-latency", type=float, default=defaults.agent_latency, help="seconds")
+    parser.add_argument("--jitter", type=float, default=defaults.jitter, help="relative latency jitter")
+    parser.add_argument("--delegate-ratio", type=float, default=defaults.delegate_ratio)
+    parser.add_argument("--response-size", type=int, default=defaults.response_size, help="response characters")
+    parser.add_argument("--persist", action="store_true", help="persist session state in a temporary data store")
+    parser.add_argument("--json", type=Path, help="write the report as JSON to this file ('-' for stdout)")
+
+
+def e2e(args: argparse.Namespace):
+    config = BenchConfig(
+        sessions=args.sessions,
+        senders=args.senders,
+        messages=args.messages,
+        rate=args.rate or None,
+        attachments=args.attachments,
+        attachment_size=args.attachment_size,
+        reasoner_latency=args.reasoner_latency,
+        agent_latency=args.agent_latency,
+        jitter=args.jitter,
+        delegate_ratio=args.delegate_ratio,
+        response_size=args.response_size,
+        persist=args.persist,
+    )
+    report = asyncio.run(run_benchmark(config))
+    output(report.to_dict(), report.format(), args.json)
+
+
+def add_persistence_arguments(parser: argparse.ArgumentParser):
+    defaults = PersistenceConfig()
+    parser.add_argument("--sizes", type=int, nargs="+", default=defaults.sizes, help="session/history sizes")
+    parser.add_argument("--threads", type=int, default=defaults.threads, help="messages referencing a thread")
+    parser.add_argument("--thread-size", type=int, default=defaults.thread_size, help="messages per thread")
+    parser.add_argument("--attachments", type=int, default=defaults.attachments, help="attachments per message")
+    parser.add_argument("--binary-parts", type=int, default=defaults.binary_parts, help="binary parts per turn")
+    parser.add_argument("--binary-size", type=int, default=defaults.binary_size, help="binary part bytes")
+    parser.add_argument("--content-size", type=int, default=defaults.content_size, help="content characters")
+    parser.add_argument("--repeat", type=int, default=defaults.repeat, help="measurements per operation")
+    parser.add_argument("--backends", nargs="+", choices=list(BACKENDS), default=defaults.backends)
+    parser.add_argument("--json", type=Path, help="write the results as JSON to this file ('-' for stdout)")
+
+
+def persistence(args: argparse.Namespace):
+    config = PersistenceConfig(
+        sizes=args.sizes,
+        threads=args.threads,
+        thread_size=args.thread_size,
+        attachments=args.attachments,
+        binary_parts=args.binary_parts,
+        binary_size=args.binary_size,
+        content_size=args.content_size,
+        repeat=args.repeat,
+        backends=args.backends,
+    )
+    results = asyncio.run(run_persistence_benchmark(config))
+    data = {"config": asdict(config), "results": [asdict(result) for result in results]}
+    output(data, format_results(results), args.json)
+
+
+def add_memory_arguments(parser: argparse.ArgumentParser):
+    defaults = MemoryConfig()
+    parser.add_argument("--sessions", type=int, default=defaults.sessions, help="number of sessions")
+    parser.add_argument("--senders", type=int, default=defaults.senders, help="distinct senders per session")
+    parser.add_argument("--messages", type=int, default=defaults.messages, help="messages per session")
+    parser.add_argument("--sample-every", type=int, default=defaults.sample_every, help="messages between samples")
+    parser.add_argument("--content-size", type=int, default=defaults.content_size, help="content characters")
+    parser.add_argument("--response-size", type=int, default=defaults.response_size, help="response characters")
+    parser.add_argument("--delegate-ratio", type=float, default=defaults.delegate_ratio)
+    parser.add_argument("--top", type=int, default=defaults.top, help="allocation sites with largest growth")
+    parser.add_argument("--json", type=Path, help="write the report as JSON to this file ('-' for stdout)")
+
+
+def memory(args: argparse.Namespace):
+    config = MemoryConfig(
+        sessions=args.sessions,
+        senders=args.senders,
+        messages=args.messages,
+        sample_every=args.sample_every,
+        content_size=args.content_size,
+        response_size=args.response_size,
+        delegate_ratio=args.delegate_ratio,
+        top=args.top,
+    )
+    report = asyncio.run(run_memory_benchmark(config))
+    output(report.to_dict(), report.format(), args.json)
+
+
+def add_replay_arguments(parser: argparse.ArgumentParser):
+    defaults = ReplayConfig()
+    parser.add_argument("transcripts", type=Path, nargs="+", help="JSONL files of message dicts")
+    parser.add_argument("--speedup", type=float, default=defaults.speedup, help="time compression (0: all at once)")
+    parser.add_argument("--interval", type=float, default=defaults.interval, help="seconds between untimed messages")
+    parser.add_argument("--copies", type=int, default=defaults.copies, help="concurrent sessions per group chat")
+    parser.add_argument("--sample-interval", type=float, default=defaults.sample_interval, help="backlog sampling")
+    parser.add_argument("--group-reasoner-factory", metavar="MODULE:FUNCTION", help="creates the reasoner factory")
+    parser.add_argument("--agent-factory", metavar="MODULE:FUNCTION", help="creates the agent factory")
+    parser.add_argument("--reasoner-latency", type=float, default=defaults.reasoner_latency, help="seconds")
+    parser.add_argument("--agent-latency", type=float, default=defaults.agent_latency, help="seconds")
+    parser.add_argument("--jitter", type=float, default=defaults.jitter, help="relative latency jitter")
+    parser.add_argument("--json", type=Path, help="write the report as JSON to this file ('-' for stdout)")
+
+
+def replay(args: argparse.Namespace):
+    config = ReplayConfig(
+        transcripts=args.transcripts,
+        speedup=args.speedup,
+        interval=args.interval,
+        copies=args.copies,
+        sample_interval=args.sample_interval,
+        reasoner_latency=args.reasoner_latency,
+        agent_latency=args.agent_latency,
+        jitter=args.jitter,
+    )
+    report = asyncio.run(
+        run_replay(
+            config,
+            group_reasoner_factory=create(args.group_reasoner_factory),
+            agent_factory=create(args.agent_factory),
+        )
+    )
+    data = report.to_dict()
+    data["config"]["transcripts"] = [str(path) for path in config.transcripts]
+    output(data, report.format(), args.json)
+
+
+def create(spec: str | None) -> Any:
+    """Call a factory function given as `module:function` without arguments."""
+    if spec is None:
+        return None
+    module, _, name = spec.partition(":")
+    return getattr(importlib.import_module(module), name)()
+
+
+def output(data: dict, text: str, path: Path | None):
+    if path is None:
+        print(text)
+    elif str(path) == "-":
+        json.dump(data, sys.stdout, indent=2)
+        print()
+    else:
+        path.write_text(json.dumps(data, indent=2))
+        print(text)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(prog="python -m group_genie.bench", description="Group Genie benchmarks")
+    commands = parser.add_subparsers(dest="command")
+
+    e2e_parser = commands.add_parser("e2e", help="end-to-end session throughput and latency (default)")
+    add_e2e_arguments(e2e_parser)
+    e2e_parser.set_defaults(func=e2e)
+
+    persistence_parser = commands.add_parser("persistence", help="data store and state serialization")
+    add_persistence_arguments(persistence_parser)
+    persistence_parser.set_defaults(func=persistence)
+
+    memory_parser = commands.add_parser("memory", help="memory growth per message (tracemalloc)")
+    add_memory_arguments(memory_parser)
+    memory_parser.set_defaults(func=memory)
+
+    replay_parser = commands.add_parser("replay", help="transcript replay against group sessions")
+    add_replay_arguments(replay_parser)
+    replay_parser.set_defaults(func=replay)
+
+    args = parser.parse_args(argv)
+
+    if args.command is None:
+        args = parser.parse_args(["e2e"])
+
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
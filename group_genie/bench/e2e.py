@@ -0,0 +1,210 @@
+import asyncio
+import tempfile
+from contextlib import AsyncExitStack
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from group_genie.bench.models import simulated_agent_factory, simulated_group_reasoner_factory
+from group_genie.bench.stats import StageRecorder, Summary, current_rss, peak_rss
+from group_genie.datastore import DataStore
+from group_genie.message import Attachment, Message
+from group_genie.monitor import LoopMonitor
+from group_genie.session import Execution, GroupSession
+
+
+@dataclass
+class BenchConfig:
+    """Configuration of an end-to-end benchmark run.
+
+    Attributes:
+        sessions: Number of concurrent group sessions.
+        senders: Number of distinct senders per session.
+        messages: Number of messages per session.
+        rate: Message rate per session in messages per second. None sends all
+            messages at once.
+        attachments: Number of attachments per message.
+        attachment_size: Size of each attachment in bytes.
+        reasoner_latency: Simulated group reasoner latency in seconds.
+        agent_latency: Simulated agent model latency in seconds.
+        jitter: Relative jitter of simulated latencies (0.1 means ±10%).
+        delegate_ratio: Fraction of messages delegated to agents by the reasoner.
+        response_size: Size of simulated agent responses in characters.
+        persist: Whether sessions persist their state in a temporary
+            [`DataStore`][group_genie.datastore.DataStore].
+    """
+
+    sessions: int = 1
+    senders: int = 4
+    messages: int = 100
+    rate: float | None = 20.0
+    attachments: int = 0
+    attachment_size: int = 100_000
+    reasoner_latency: float = 0.05
+    agent_latency: float = 0.2
+    jitter: float = 0.1
+    delegate_ratio: float = 1.0
+    response_size: int = 200
+    persist: bool = False
+
+
+@dataclass
+class BenchReport:
+    """Result of an end-to-end benchmark run.
+
+    Attributes:
+        config: Configuration of the run.
+        messages: Number of processed messages.
+        errors: Number of messages that failed or were answered with an error.
+        duration: Wall-clock duration in seconds, from the first message until the
+            last result.
+        throughput: Processed messages per second.
+        end_to_end: Latency from `handle()` until the result of a message.
+        stages: Latency per processing stage, recorded from latency metrics.
+        loop_lag: Event loop lag during the run.
+        peak_rss: Peak resident set size of the process in bytes (if available).
+        rss: Resident set size at the end of the run in bytes (if available).
+    """
+
+    config: BenchConfig
+    messages: int
+    errors: int
+    duration: float
+    throughput: float
+    end_to_end: Summary
+    stages: dict[str, Summary] = field(default_factory=dict)
+    loop_lag: Summary | None = None
+    peak_rss: int | None = None
+    rss: int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    def format(self) -> str:
+        """Format the report as human-readable table."""
+        lines = [
+            f"messages:   {self.messages} ({self.errors} errors) in {self.duration:.2f}s",
+            f"throughput: {self.throughput:.1f} messages/s",
+        ]
+        if self.peak_rss is not None:
+            lines.append(f"peak rss:   {self.peak_rss / 2**20:.1f} MiB")
+        lines.append("")
+        lines.append(format_summaries({"end_to_end": self.end_to_end, **self.stages, "loop_lag": self.loop_lag}))
+        return "\n".join(lines)
+
+
+def format_summaries(summaries: dict[str, Summary | None]) -> str:
+    """Format latency summaries as table with values in milliseconds."""
+    header = f"{'stage':<24}{'count':>8}{'mean':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}"
+    lines = [header, "-" * len(header)]
+    for name, s in summaries.items():
+        if s is None:
+            continue
+        values = "".join(f"{v * 1000:>10.1f}" for v in [s.mean, s.p50, s.p95, s.p99, s.max])
+        lines.append(f"{name:<24}{s.count:>8}{values}")
+    return "\n".join(lines)
+
+
+async def run_benchmark(config: BenchConfig) -> BenchReport:
+    """Run an end-to-end benchmark of [`GroupSession`][group_genie.session.GroupSession]s
+    with simulated group reasoners and agents.
+
+    Messages of each session are sent at the configured rate, round-robin across
+    senders, and processed with auto-approval. The benchmark runs offline, model
+    latencies are simulated.
+
+    Args:
+        config: Benchmark configuration.
+
+    Returns:
+        The benchmark report.
+    """
+    async with AsyncExitStack() as stack:
+        tmp = Path(stack.enter_context(tempfile.TemporaryDirectory()))
+        attachments = _create_attachments(tmp, config.attachments, config.attachment_size)
+        data_store = None
+
+        if config.persist:
+            data_store = await stack.enter_async_context(DataStore(root_path=tmp / "store"))
+
+        sessions = [
+            GroupSession(
+                id=f"session-{i}",
+                group_reasoner_factory=simulated_group_reasoner_factory(
+                    latency=config.reasoner_latency,
+                    jitter=config.jitter,
+                    delegate_ratio=config.delegate_ratio,
+                ),
+                agent_factory=simulated_agent_factory(
+                    latency=config.agent_latency,
+                    jitter=config.jitter,
+                    response_size=config.response_size,
+                ),
+                data_store=data_store,
+            )
+            for i in range(config.sessions)
+        ]
+
+        latencies: list[float] = []
+        errors = 0
+
+        async def complete(execution: Execution, start: float):
+            nonlocal errors
+            try:
+                message = await execution.result()
+            except Exception:
+                errors += 1
+            else:
+                if message is not None and message.content.startswith("System agent error"):
+                    errors += 1
+            latencies.append(perf_counter() - start)
+
+        async def drive(session: GroupSession) -> list[asyncio.Task]:
+            tasks = []
+            for i in range(config.messages):
+                message = Message(
+                    content=f"message {i}",
+                    sender=f"user-{i % config.senders}",
+                    attachments=attachments,
+                )
+                tasks.append(asyncio.create_task(complete(session.handle(message), perf_counter())))
+                if config.rate is not None:
+                    await asyncio.sleep(1.0 / config.rate)
+            return tasks
+
+        with StageRecorder() as recorder:
+            async with LoopMonitor(interval=0.01):
+                start = perf_counter()
+                drivers = await asyncio.gather(*[drive(session) for session in sessions])
+                await asyncio.gather(*[task for tasks in drivers for task in tasks])
+                duration = perf_counter() - start
+
+        for session in sessions:
+            session.stop()
+        await asyncio.gather(*[session.join() for session in sessions])
+
+    stages = recorder.summaries()
+    loop_lag = stages.pop("loop_lag", None)  # recorded by the loop monitor
+
+    return BenchReport(
+        config=config,
+        messages=len(latencies),
+        errors=errors,
+        duration=duration,
+        throughput=len(latencies) / duration if duration > 0 else 0.0,
+        end_to_end=Summary.of(latencies),
+        stages=stages,
+        loop_lag=loop_lag,
+        peak_rss=peak_rss(),
+        rss=current_rss(),
+    )
+
+
+def _create_attachments(path: Path, count: int, size: int) -> list[Attachment]:
+    attachments = []
+    for i in range(count):
+        file = path / f"attachment-{i}.bin"
+        file.write_bytes(b"\0" * size)
+        attachments.append(Attachment(path=str(file), name=file.name, media_type="image/png"))
+    return attachments
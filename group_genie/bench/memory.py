@@ -0,0 +1,173 @@
+import asyncio
+import gc
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from group_genie.bench.models import simulated_agent_factory, simulated_group_reasoner_factory
+from group_genie.bench.stats import slope
+from group_genie.footprint import SessionFootprint
+from group_genie.message import Message
+from group_genie.session import GroupSession
+
+
+@dataclass
+class MemoryConfig:
+    """Configuration of a memory benchmark run.
+
+    Attributes:
+        sessions: Number of group sessions.
+        senders: Number of distinct senders per session.
+        messages: Number of messages per session.
+        sample_every: Number of messages per session between memory samples.
+        content_size: Size of message contents in characters.
+        response_size: Size of simulated agent responses in characters.
+        delegate_ratio: Fraction of messages delegated to agents by the reasoner.
+        top: Number of allocation sites with the largest growth to report.
+    """
+
+    sessions: int = 1
+    senders: int = 4
+    messages: int = 200
+    sample_every: int = 20
+    content_size: int = 200
+    response_size: int = 200
+    delegate_ratio: float = 1.0
+    top: int = 10
+
+
+@dataclass
+class MemorySample:
+    """Memory measured after a number of messages per session.
+
+    Attributes:
+        messages: Number of handled messages per session.
+        traced: Memory allocated by Python (tracemalloc) in bytes.
+        footprint: Sum of the approximate session footprints in bytes (see
+            [`SessionFootprint`][group_genie.footprint.SessionFootprint]).
+        runners: Number of live runners.
+        tasks: Number of live runner tasks.
+    """
+
+    messages: int
+    traced: int
+    footprint: int
+    runners: int
+    tasks: int
+
+
+@dataclass
+class MemoryReport:
+    """Result of a memory benchmark run.
+
+    Attributes:
+        config: Configuration of the run.
+        samples: Memory samples, starting after the first message of each session.
+        traced_growth: Growth of traced memory per message in bytes (least squares
+            slope over all sessions).
+        footprint_growth: Growth of the session footprints per message in bytes.
+        top_growth: Allocation sites with the largest growth between the first and
+            the last sample, formatted as `file:line: +bytes (+blocks)`.
+        sessions: Footprints of the sessions after the last sample.
+    """
+
+    config: MemoryConfig
+    samples: list[MemorySample] = field(default_factory=list)
+    traced_growth: float = 0.0
+    footprint_growth: float = 0.0
+    top_growth: list[str] = field(default_factory=list)
+    sessions: list[SessionFootprint] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    def format(self) -> str:
+        """Format the report as human-readable table."""
+        header = f"{'messages':>10}{'traced':>14}{'footprint':>14}{'runners':>10}{'tasks':>10}"
+        lines = [header, "-" * len(header)]
+        for s in self.samples:
+            lines.append(
+                f"{s.messages:>10}{s.traced / 1024:>12.1f}Ki{s.footprint / 1024:>12.1f}Ki{s.runners:>10}{s.tasks:>10}"
+            )
+        lines.append("")
+        lines.append(f"traced growth:    {self.traced_growth:,.0f} bytes/message")
+        lines.append(f"footprint growth: {self.footprint_growth:,.0f} bytes/message")
+        if self.top_growth:
+            lines.append("")
+            lines.append("top growth:")
+            lines.extend(f"  {line}" for line in self.top_growth)
+        return "\n".join(lines)
+
+
+async def run_memory_benchmark(config: MemoryConfig) -> MemoryReport:
+    """Measure memory growth of [`GroupSession`][group_genie.session.GroupSession]s
+    per handled message with `tracemalloc`.
+
+    Messages are handled sequentially in each session (sessions run concurrently)
+    with simulated group reasoners and agents without latency. Traced memory and
+    session footprints are sampled every `sample_every` messages. A growth per
+    message well above the size of a message and its response indicates a leak.
+    Tracing slows down execution significantly.
+
+    Args:
+        config: Benchmark configuration.
+
+    Returns:
+        The benchmark report.
+    """
+    sessions = [
+        GroupSession(
+            id=f"session-{i}",
+            group_reasoner_factory=simulated_group_reasoner_factory(delegate_ratio=config.delegate_ratio),
+            agent_factory=simulated_agent_factory(response_size=config.response_size),
+        )
+        for i in range(config.sessions)
+    ]
+    report = MemoryReport(config=config)
+    first: tracemalloc.Snapshot | None = None
+    last: tracemalloc.Snapshot | None = None
+
+    async def handle(session: GroupSession, i: int):
+        message = Message(content=f"{i} " + "x" * config.content_size, sender=f"user-{i % config.senders}")
+        await session.handle(message).result()
+
+    async def sample(messages: int) -> tracemalloc.Snapshot:
+        footprints = await asyncio.gather(*[session.footprint() for session in sessions])
+        gc.collect()
+        report.samples.append(
+            MemorySample(
+                messages=messages,
+                traced=tracemalloc.get_traced_memory()[0],
+                footprint=sum(f.total_bytes for f in footprints),
+                runners=sum(f.runners for f in footprints),
+                tasks=sum(f.tasks for f in footprints),
+            )
+        )
+        report.sessions = footprints
+        return tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+
+    tracemalloc.start()
+    try:
+        for i in range(config.messages):
+            await asyncio.gather(*[handle(session, i) for session in sessions])
+            if i == 0 or (i + 1) % config.sample_every == 0 or i + 1 == config.messages:
+                last = await sample(i + 1)
+                first = first or last
+    finally:
+        for session in sessions:
+            session.stop()
+        await asyncio.gather(*[session.join() for session in sessions])
+        tracemalloc.stop()
+
+    report.traced_growth = slope([(s.messages * config.sessions, s.traced) for s in report.samples])
+    report.footprint_growth = slope([(s.messages * config.sessions, s.footprint) for s in report.samples])
+
+    if first is not None and last is not None and first is not last:
+        stats = last.compare_to(first, "lineno")[: config.top]
+        report.top_growth = [
+            f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}: "
+            f"{stat.size_diff:+,} bytes ({stat.count_diff:+,} blocks)"
+            for stat in stats
+        ]
+
+    return report
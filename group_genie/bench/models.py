@@ -0,0 +1,92 @@
+import asyncio
+import random
+from typing import Any
+
+from group_sense import Decision, Response
+from pydantic_ai.messages import ModelMessage, ModelResponse, TextPart
+from pydantic_ai.models.function import AgentInfo as FunctionAgentInfo
+from pydantic_ai.models.function import FunctionModel
+
+from group_genie.agent import AgentFactory, AgentInfo, AsyncTool
+from group_genie.agent.provider.pydantic_ai import DefaultAgent
+from group_genie.message import Message
+from group_genie.reasoner import GroupReasoner, GroupReasonerFactory
+
+
+def sample_latency(latency: float, jitter: float) -> float:
+    """Sample a latency uniformly from `latency * (1 ± jitter)`."""
+    return max(0.0, latency * (1.0 + random.uniform(-jitter, jitter)))
+
+
+class SimulatedGroupReasoner(GroupReasoner):
+    """Group reasoner that simulates model latency and delegates a fraction of messages.
+
+    Delegated queries are the content of the last update message, addressed to its
+    sender.
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, delegate_ratio: float = 1.0):
+        self.latency = latency
+        self.jitter = jitter
+        self.delegate_ratio = delegate_ratio
+        self._processed = 0
+
+    @property
+    def processed(self) -> int:
+        return self._processed
+
+    def get_serialized(self) -> Any:
+        return {"processed": self._processed}
+
+    def set_serialized(self, serialized: Any):
+        self._processed = serialized["processed"]
+
+    async def run(self, updates: list[Message]) -> Response:
+        await asyncio.sleep(sample_latency(self.latency, self.jitter))
+        self._processed += len(updates)
+
+        if random.random() >= self.delegate_ratio:
+            return Response(decision=Decision.IGNORE)
+
+        message = updates[-1]
+        return Response(decision=Decision.DELEGATE, query=message.content, receiver=message.sender)
+
+
+def simulated_model(latency: float = 0.0, jitter: float = 0.0, response_size: int = 200) -> FunctionModel:
+    """Create a pydantic-ai model that responds with `response_size` characters after a simulated latency."""
+
+    async def respond(messages: list[ModelMessage], info: FunctionAgentInfo) -> ModelResponse:
+        await asyncio.sleep(sample_latency(latency, jitter))
+        return ModelResponse(parts=[TextPart(content="x" * response_size)], model_name="simulated")
+
+    return FunctionModel(respond, model_name="simulated")
+
+
+def simulated_group_reasoner_factory(
+    latency: float = 0.0,
+    jitter: float = 0.0,
+    delegate_ratio: float = 1.0,
+) -> GroupReasonerFactory:
+    """Create a factory for [`SimulatedGroupReasoner`][group_genie.bench.SimulatedGroupReasoner]s."""
+
+    def create_group_reasoner(secrets: dict[str, str], owner: str) -> GroupReasoner:
+        return SimulatedGroupReasoner(latency=latency, jitter=jitter, delegate_ratio=delegate_ratio)
+
+    return GroupReasonerFactory(group_reasoner_factory_fn=create_group_reasoner)
+
+
+def simulated_agent_factory(latency: float = 0.0, jitter: float = 0.0, response_size: int = 200) -> AgentFactory:
+    """Create a factory for system agents backed by a
+    [`simulated_model()`][group_genie.bench.simulated_model]."""
+
+    def create_system_agent(
+        secrets: dict[str, str],
+        extra_tools: dict[str, AsyncTool],
+        agent_infos: list[AgentInfo],
+    ) -> DefaultAgent:
+        return DefaultAgent(
+            system_prompt="You are a helpful assistant",
+            model=simulated_model(latency=latency, jitter=jitter, response_size=response_size),
+        )
+
+    return AgentFactory(system_agent_factory=create_system_agent)
@@ -0,0 +1,226 @@
+import json
+import tempfile
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Awaitable, Callable
+
+from pydantic_ai.messages import BinaryContent, ModelMessage, ModelRequest, ModelResponse, TextPart, UserPromptPart
+
+from group_genie.agent.provider.pydantic_ai import DefaultAgent
+from group_genie.bench.models import simulated_model
+from group_genie.bench.stats import Summary
+from group_genie.datastore import DataStore
+from group_genie.message import Attachment, Message, Thread
+
+
+class CompactDataStore(DataStore):
+    """[`DataStore`][group_genie.datastore.DataStore] variant that writes compact JSON."""
+
+    def _save(self, key: str, data: Any):
+        path = self.narrow_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._file(key).open("w") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+
+BACKENDS: dict[str, type[DataStore]] = {
+    "json-indent": DataStore,
+    "json-compact": CompactDataStore,
+}
+"""Data store backends compared by the persistence benchmark."""
+
+
+@dataclass
+class PersistenceConfig:
+    """Configuration of the persistence benchmark.
+
+    Attributes:
+        sizes: Session sizes (number of messages) and agent history sizes (number of
+            turns) to benchmark.
+        threads: Number of messages per session that reference a thread.
+        thread_size: Number of messages per referenced thread.
+        attachments: Number of attachments (metadata) per session message.
+        binary_parts: Number of binary parts (e.g. images) per agent history turn.
+        binary_size: Size of each binary part in bytes.
+        content_size: Size of message contents in characters.
+        repeat: Number of measurements per operation.
+        backends: Names of the [`BACKENDS`][group_genie.bench.persistence.BACKENDS]
+            to benchmark.
+    """
+
+    sizes: list[int] = field(default_factory=lambda: [10, 100, 1000])
+    threads: int = 0
+    thread_size: int = 10
+    attachments: int = 0
+    binary_parts: int = 0
+    binary_size: int = 100_000
+    content_size: int = 200
+    repeat: int = 5
+    backends: list[str] = field(default_factory=lambda: list(BACKENDS))
+
+
+@dataclass
+class PersistenceResult:
+    """Measurement of a persistence operation.
+
+    Attributes:
+        target: Persisted state, `session` (group session messages) or `agent`
+            (agent conversation history).
+        size: Number of session messages or agent history turns.
+        operation: `serialize`, `deserialize`, `save` or `load`.
+        backend: Data store backend for `save` and `load`, None otherwise.
+        latency: Latency of the operation.
+        peak_memory: Peak memory allocated by a single operation in bytes.
+        bytes: Size of the persisted file in bytes (`save` only).
+    """
+
+    target: str
+    size: int
+    operation: str
+    backend: str | None
+    latency: Summary
+    peak_memory: int
+    bytes: int | None = None
+
+
+def synthetic_messages(config: PersistenceConfig, size: int) -> list[Message]:
+    """Generate `size` synthetic group session messages."""
+    content = "x" * config.content_size
+    attachments = [
+        Attachment(path=f"/tmp/attachment-{i}.png", name=f"attachment-{i}.png", media_type="image/png")
+        for i in range(config.attachments)
+    ]
+    thread = Thread(
+        id="thread",
+        messages=[Message(content=content, sender=f"user-{i % 4}") for i in range(config.thread_size)],
+    )
+    return [
+        Message(
+            content=content,
+            sender=f"user-{i % 4}",
+            receiver=f"user-{(i + 1) % 4}",
+            threads=[thread] if i < config.threads else [],
+            attachments=attachments,
+            request_id=f"request-{i}",
+        )
+        for i in range(size)
+    ]
+
+
+def synthetic_history(config: PersistenceConfig, size: int) -> list[ModelMessage]:
+    """Generate a synthetic pydantic-ai agent history of `size` turns."""
+    content = "x" * config.content_size
+    binary = BinaryContent(data=b"\0" * config.binary_size, media_type="image/png")
+    history: list[ModelMessage] = []
+    for _ in range(size):
+        history.append(ModelRequest(parts=[UserPromptPart(content=[content, *[binary] * config.binary_parts])]))
+        history.append(ModelResponse(parts=[TextPart(content=content)]))
+    return history
+
+
+async def run_persistence_benchmark(config: PersistenceConfig) -> list[PersistenceResult]:
+    """Benchmark serialization, [`DataStore`][group_genie.datastore.DataStore] save
+    and load of synthetic group sessions and agent histories.
+
+    Session serialization is measured as done by `GroupSession` (dataclass to dict,
+    and [`Message.deserialize()`][group_genie.message.Message.deserialize]), agent
+    serialization with `get_serialized()` and `set_serialized()` of a pydantic-ai
+    [`DefaultAgent`][group_genie.agent.provider.pydantic_ai.DefaultAgent].
+
+    Args:
+        config: Benchmark configuration.
+
+    Returns:
+        Results of all measured operations.
+    """
+    results: list[PersistenceResult] = []
+    agent = DefaultAgent(system_prompt="", model=simulated_model())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in config.sizes:
+            messages = synthetic_messages(config, size)
+            session_data = {"messages": [asdict(message) for message in messages]}
+
+            async def serialize_session():
+                return {"messages": [asdict(message) for message in messages]}
+
+            async def deserialize_session():
+                return [Message.deserialize(message) for message in session_data["messages"]]
+
+            agent._history = synthetic_history(config, size)
+            agent_data = agent.get_serialized()
+
+            async def serialize_agent():
+                return agent.get_serialized()
+
+            async def deserialize_agent():
+                agent.set_serialized(agent_data)
+
+            results.append(await _measure("session", size, "serialize", None, serialize_session, config.repeat))
+            results.append(await _measure("session", size, "deserialize", None, deserialize_session, config.repeat))
+            results.append(await _measure("agent", size, "serialize", None, serialize_agent, config.repeat))
+            results.append(await _measure("agent", size, "deserialize", None, deserialize_agent, config.repeat))
+
+            for backend in config.backends:
+                async with BACKENDS[backend](root_path=Path(tmp, backend, str(size))) as store:
+                    for target, data in [("session", session_data), ("agent", {"agent": agent_data})]:
+                        save = await _measure(
+                            target, size, "save", backend, lambda: store.save(target, data), config.repeat
+                        )
+                        save.bytes = store._file(target).stat().st_size
+                        results.append(save)
+                        results.append(
+                            await _measure(target, size, "load", backend, lambda: store.load(target), config.repeat)
+                        )
+
+    return results
+
+
+def format_results(results: list[PersistenceResult]) -> str:
+    """Format persistence results as human-readable table with latencies in milliseconds."""
+    header = (
+        f"{'target':<8}{'size':>7} {'operation':<12}{'backend':<14}{'p50':>10}{'max':>10}{'memory':>12}{'bytes':>14}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r.target:<8}{r.size:>7} {r.operation:<12}{r.backend or '-':<14}"
+            f"{r.latency.p50 * 1000:>10.2f}{r.latency.max * 1000:>10.2f}"
+            f"{r.peak_memory:>12}{r.bytes if r.bytes is not None else '-':>14}"
+        )
+    return "\n".join(lines)
+
+
+async def _measure(
+    target: str,
+    size: int,
+    operation: str,
+    backend: str | None,
+    fn: Callable[[], Awaitable[Any]],
+    repeat: int,
+) -> PersistenceResult:
+    latencies = []
+    for _ in range(repeat):
+        start = perf_counter()
+        await fn()
+        latencies.append(perf_counter() - start)
+
+    # measured separately, tracing allocations slows down operations
+    tracemalloc.start()
+    try:
+        await fn()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return PersistenceResult(
+        target=target,
+        size=size,
+        operation=operation,
+        backend=backend,
+        latency=Summary.of(latencies),
+        peak_memory=peak_memory,
+    )
@@ -0,0 +1,332 @@
+import asyncio
+import json
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from group_sense import Decision
+
+from group_genie.agent import AgentFactory, Approval
+from group_genie.bench.e2e import format_summaries
+from group_genie.bench.models import simulated_agent_factory, simulated_group_reasoner_factory
+from group_genie.bench.stats import StageRecorder, Summary, current_rss, peak_rss, slope
+from group_genie.message import Message
+from group_genie.monitor import LoopMonitor
+from group_genie.reasoner import GroupReasonerFactory
+from group_genie.session import Execution, GroupSession
+
+_MESSAGE_FIELDS = {f.name for f in fields(Message)}
+
+
+@dataclass
+class TranscriptMessage:
+    """Message of a transcript, scheduled relative to the start of the transcript.
+
+    Attributes:
+        message: The message.
+        offset: Seconds since the first message of the transcript (uncompressed).
+        session: Key of the group chat the message was sent to.
+    """
+
+    message: Message
+    offset: float
+    session: str
+
+
+def load_transcript(path: Path, interval: float = 1.0) -> list[TranscriptMessage]:
+    """Load a transcript from a JSONL file of [`Message`][group_genie.message.Message] dicts.
+
+    Each line is a message dict as created by `asdict(message)`, including threads
+    and attachments. Lines may additionally contain
+
+    - `timestamp`: send time as epoch seconds or ISO 8601 string. Messages without
+      timestamp are scheduled `interval` seconds after the previous message.
+    - `session`: key of the group chat the message was sent to. Messages without
+      session key belong to a group chat named after the file.
+
+    Other keys are ignored. Relative attachment paths are resolved against the
+    directory of the transcript file.
+
+    Args:
+        path: Path of the transcript file.
+        interval: Interval between messages without timestamp in seconds.
+
+    Returns:
+        The transcript messages in file order.
+    """
+    result: list[TranscriptMessage] = []
+    start: float | None = None
+    offset = 0.0
+
+    with path.open() as f:
+        for line in f:
+            if not line.strip():
+                continue
+
+            data = json.loads(line)
+
+            if (timestamp := data.get("timestamp")) is not None:
+                time = _parse_timestamp(timestamp)
+                if start is None:
+                    start = time
+                offset = max(offset, time - start)
+            elif result:
+                offset += interval
+
+            message = Message.deserialize({k: v for k, v in data.items() if k in _MESSAGE_FIELDS})
+            _resolve_attachments(message, path.parent)
+            result.append(TranscriptMessage(message=message, offset=offset, session=data.get("session", path.stem)))
+
+    return result
+
+
+@dataclass
+class ReplayConfig:
+    """Configuration of a transcript replay.
+
+    Attributes:
+        transcripts: Transcript files (see
+            [`load_transcript()`][group_genie.bench.load_transcript]).
+        speedup: Time compression factor applied to message offsets (10.0 replays
+            10 minutes of chat in 1 minute). 0 sends all messages at once.
+        interval: Interval between messages without timestamp in seconds
+            (uncompressed).
+        copies: Number of concurrent copies of each group chat, each replayed in
+            its own session. Increase to find the saturation point.
+        sample_interval: Interval for sampling the backlog in seconds.
+        reasoner_latency: Simulated group reasoner latency in seconds, if no group
+            reasoner factory is given.
+        agent_latency: Simulated agent model latency in seconds, if no agent factory
+            is given.
+        jitter: Relative jitter of simulated latencies.
+    """
+
+    transcripts: list[Path] = field(default_factory=list)
+    speedup: float = 10.0
+    interval: float = 1.0
+    copies: int = 1
+    sample_interval: float = 0.1
+    reasoner_latency: float = 0.05
+    agent_latency: float = 0.2
+    jitter: float = 0.1
+
+
+@dataclass
+class ReplayReport:
+    """Result of a transcript replay.
+
+    Attributes:
+        config: Configuration of the replay.
+        sessions: Number of replayed sessions.
+        messages: Number of processed messages.
+        delegated: Number of messages delegated to agents.
+        errors: Number of messages that failed or were answered with an error.
+        approvals: Number of auto-approved tool calls.
+        duration: Wall-clock duration in seconds, from the first message until the
+            last result.
+        offered_rate: Rate at which messages were sent in messages per second.
+        throughput: Processed messages per second.
+        end_to_end: Latency from `handle()` until the result of a message.
+        send_delay: Delay of `handle()` calls behind their compressed schedule. Grows
+            if the event loop is saturated.
+        backlog: Sampled `(elapsed seconds, messages in flight)` pairs.
+        max_backlog: Maximum number of messages in flight.
+        backlog_growth: Growth rate of the backlog while messages were sent, in
+            messages per second (least squares slope). A sustained positive value
+            means that the offered rate exceeds the processing capacity.
+        stages: Latency per processing stage, recorded from latency metrics.
+        loop_lag: Event loop lag during the replay.
+        peak_rss: Peak resident set size of the process in bytes (if available).
+        rss: Resident set size at the end of the replay in bytes (if available).
+    """
+
+    config: ReplayConfig
+    sessions: int
+    messages: int
+    delegated: int
+    errors: int
+    approvals: int
+    duration: float
+    offered_rate: float
+    throughput: float
+    end_to_end: Summary
+    send_delay: Summary
+    backlog: list[tuple[float, int]] = field(default_factory=list)
+    max_backlog: int = 0
+    backlog_growth: float = 0.0
+    stages: dict[str, Summary] = field(default_factory=dict)
+    loop_lag: Summary | None = None
+    peak_rss: int | None = None
+    rss: int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    def format(self) -> str:
+        """Format the report as human-readable table."""
+        lines = [
+            f"sessions:   {self.sessions}",
+            f"messages:   {self.messages} ({self.delegated} delegated, {self.errors} errors, "
+            f"{self.approvals} approvals) in {self.duration:.2f}s",
+            f"offered:    {self.offered_rate:.1f} messages/s",
+            f"throughput: {self.throughput:.1f} messages/s",
+            f"backlog:    max {self.max_backlog}, growth {self.backlog_growth:+.2f} messages/s",
+        ]
+        if self.peak_rss is not None:
+            lines.append(f"peak rss:   {self.peak_rss / 2**20:.1f} MiB")
+        lines.append("")
+        summaries = {"end_to_end": self.end_to_end, "send_delay": self.send_delay, **self.stages}
+        lines.append(format_summaries({**summaries, "loop_lag": self.loop_lag}))
+        return "\n".join(lines)
+
+
+async def run_replay(
+    config: ReplayConfig,
+    group_reasoner_factory: GroupReasonerFactory | None = None,
+    agent_factory: AgentFactory | None = None,
+) -> ReplayReport:
+    """Replay transcripts against [`GroupSession`][group_genie.session.GroupSession]s
+    at accelerated speed.
+
+    Each group chat of each transcript is replayed in `copies` concurrent sessions.
+    Messages are sent at their compressed transcript offsets, independent of the
+    progress of earlier messages, and their executions are streamed with
+    auto-approval of [`Approval`][group_genie.agent.approval.Approval]s.
+
+    Args:
+        config: Replay configuration.
+        group_reasoner_factory: Factory for group reasoners of the replayed sessions.
+            Defaults to simulated group reasoners.
+        agent_factory: Factory for agents of the replayed sessions. Defaults to
+            simulated agents.
+
+    Returns:
+        The replay report.
+    """
+    if group_reasoner_factory is None:
+        group_reasoner_factory = simulated_group_reasoner_factory(
+            latency=config.reasoner_latency,
+            jitter=config.jitter,
+        )
+    if agent_factory is None:
+        agent_factory = simulated_agent_factory(latency=config.agent_latency, jitter=config.jitter)
+
+    chats: dict[str, list[TranscriptMessage]] = {}
+    for path in config.transcripts:
+        for item in load_transcript(path, interval=config.interval):
+            chats.setdefault(f"{path.stem}/{item.session}", []).append(item)
+
+    sessions = [
+        (
+            GroupSession(
+                id=f"{key}#{copy}",
+                group_reasoner_factory=group_reasoner_factory,
+                agent_factory=agent_factory,
+            ),
+            items,
+        )
+        for key, items in chats.items()
+        for copy in range(config.copies)
+    ]
+
+    latencies: list[float] = []
+    send_delays: list[float] = []
+    backlog: list[tuple[float, int]] = []
+    in_flight = 0
+    max_in_flight = 0
+    delegated = 0
+    errors = 0
+    approvals = 0
+
+    async def complete(execution: Execution, sent: float):
+        nonlocal in_flight, delegated, errors, approvals
+        try:
+            async for elem in execution.stream():
+                match elem:
+                    case Decision.DELEGATE:
+                        delegated += 1
+                    case Approval():
+                        elem.approve()
+                        approvals += 1
+                    case Message() if elem.content.startswith("System agent error"):
+                        errors += 1
+        except Exception:
+            errors += 1
+        finally:
+            in_flight -= 1
+            latencies.append(perf_counter() - sent)
+
+    async def drive(session: GroupSession, items: list[TranscriptMessage], start: float) -> list[asyncio.Task]:
+        nonlocal in_flight, max_in_flight
+        tasks = []
+        for item in items:
+            scheduled = start + (item.offset / config.speedup if config.speedup > 0 else 0.0)
+            if (delay := scheduled - perf_counter()) > 0:
+                await asyncio.sleep(delay)
+            sent = perf_counter()
+            send_delays.append(max(0.0, sent - scheduled))
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            tasks.append(asyncio.create_task(complete(session.handle(item.message), sent)))
+        return tasks
+
+    async def sample(start: float):
+        while True:
+            backlog.append((perf_counter() - start, in_flight))
+            await asyncio.sleep(config.sample_interval)
+
+    with StageRecorder() as recorder:
+        async with LoopMonitor(interval=0.01):
+            start = perf_counter()
+            sampler = asyncio.create_task(sample(start))
+            drivers = await asyncio.gather(*[drive(session, items, start) for session, items in sessions])
+            sending = perf_counter() - start
+            await asyncio.gather(*[task for tasks in drivers for task in tasks])
+            duration = perf_counter() - start
+            sampler.cancel()
+            await asyncio.gather(sampler, return_exceptions=True)
+
+    for session, _ in sessions:
+        session.stop()
+    await asyncio.gather(*[session.join() for session, _ in sessions])
+
+    stages = recorder.summaries()
+    loop_lag = stages.pop("loop_lag", None)  # recorded by the loop monitor
+
+    return ReplayReport(
+        config=config,
+        sessions=len(sessions),
+        messages=len(latencies),
+        delegated=delegated,
+        errors=errors,
+        approvals=approvals,
+        duration=duration,
+        offered_rate=len(latencies) / sending if sending > 0 else 0.0,
+        throughput=len(latencies) / duration if duration > 0 else 0.0,
+        end_to_end=Summary.of(latencies),
+        send_delay=Summary.of(send_delays),
+        backlog=backlog,
+        max_backlog=max_in_flight,
+        backlog_growth=slope([(t, n) for t, n in backlog if t <= sending]),
+        stages=stages,
+        loop_lag=loop_lag,
+        peak_rss=peak_rss(),
+        rss=current_rss(),
+    )
+
+
+def _parse_timestamp(timestamp: float | int | str) -> float:
+    if isinstance(timestamp, str):
+        return datetime.fromisoformat(timestamp).timestamp()
+    return float(timestamp)
+
+
+def _resolve_attachments(message: Message, root: Path):
+    for attachment in message.attachments:
+        if not Path(attachment.path).is_absolute():
+            attachment.path = str(root / attachment.path)
+    for thread in message.threads:
+        for thread_message in thread.messages:
+            _resolve_attachments(thread_message, root)
@@ -0,0 +1,98 @@
+import math
+import os
+import sys
+from dataclasses import dataclass
+
+from group_genie.metrics import MetricsRegistry, default_registry
+
+
+@dataclass
+class Summary:
+    """Summary statistics of latency samples in seconds."""
+
+    count: int
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+    @staticmethod
+    def of(samples: list[float]) -> "Summary":
+        if not samples:
+            return Summary(count=0, mean=0.0, p50=0.0, p95=0.0, p99=0.0, max=0.0)
+        ordered = sorted(samples)
+        return Summary(
+            count=len(ordered),
+            mean=sum(ordered) / len(ordered),
+            p50=percentile(ordered, 0.50),
+            p95=percentile(ordered, 0.95),
+            p99=percentile(ordered, 0.99),
+            max=ordered[-1],
+        )
+
+
+def percentile(ordered: list[float], q: float) -> float:
+    """Return the q-quantile (0 <= q <= 1) of sorted samples (nearest rank)."""
+    return ordered[max(0, min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1))]
+
+
+def slope(points: list[tuple[float, float]]) -> float:
+    """Return the least squares slope of `(x, y)` points, 0.0 if undefined."""
+    if len(points) < 2:
+        return 0.0
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var = sum((x - mean_x) ** 2 for x, _ in points)
+    if var == 0:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var
+
+
+class StageRecorder:
+    """Records raw observations of latency histograms while active.
+
+    Stages are named after the metric without `group_genie_` prefix and
+    `_seconds` suffix (e.g. `reasoner_run` for `group_genie_reasoner_run_seconds`).
+    """
+
+    def __init__(self, registry: MetricsRegistry = default_registry):
+        self.registry = registry
+        self.samples: dict[str, list[float]] = {}
+
+    def __enter__(self) -> "StageRecorder":
+        self.registry.add_observer(self._observe)
+        return self
+
+    def __exit__(self, *args):
+        self.registry.remove_observer(self._observe)
+
+    def summaries(self) -> dict[str, Summary]:
+        return {stage: Summary.of(samples) for stage, samples in sorted(self.samples.items())}
+
+    def _observe(self, name: str, labels: dict[str, str], value: float):
+        if name.endswith("_seconds"):
+            stage = name.removeprefix("group_genie_").removesuffix("_seconds")
+            self.samples.setdefault(stage, []).append(value)
+
+
+def peak_rss() -> int | None:
+    """Return the peak resident set size of the process in bytes, None if not available."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def current_rss() -> int | None:
+    """Return the current resident set size of the process in bytes, None if not available."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+
+    return pages * os.sysconf("SC_PAGE_SIZE")
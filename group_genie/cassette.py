@@ -0,0 +1,126 @@
+import hashlib
+import json
+import random
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+IGNORED_FIELDS = frozenset(
+    {
+        "timestamp",
+        "id",
+        "tool_call_id",
+        "provider_response_id",
+        "provider_details",
+        "provider_name",
+        "model_name",
+        "finish_reason",
+        "run_id",
+        "conversation_id",
+        "usage",
+        "metadata",
+    }
+)
+"""Fields that are ignored when computing request keys (they vary between runs)."""
+
+
+@dataclass
+class CassetteEntry:
+    """Recorded model response.
+
+    Attributes:
+        key: Key of the request the response was recorded for.
+        response: Serialized model response (provider-specific format).
+        latency: Observed latency of the model call in seconds.
+    """
+
+    key: str
+    response: Any
+    latency: float
+
+
+class Cassette:
+    """Recorded model responses, stored as JSON lines file.
+
+    Used by the provider-specific recording and replay models
+    ([pydantic-ai][group_genie.agent.provider.pydantic_ai.RecordingModel],
+    [OpenAI Agents SDK][group_genie.agent.provider.openai.RecordingModel]).
+    Responses are stored with the key of their request and the observed latency.
+    Requests themselves are not stored.
+
+    On replay, responses are looked up by request key. Requests without recorded
+    response are served with recorded responses in recording order (cycling), unless
+    the cassette is strict. Responses recorded for the same key are served in
+    recording order too.
+    """
+
+    def __init__(self, path: Path, strict: bool = False):
+        """Open a cassette, loading existing entries.
+
+        Args:
+            path: Path of the cassette file. Created on first recording.
+            strict: If True, [`lookup()`][group_genie.cassette.Cassette.lookup]
+                raises `KeyError` for requests without recorded response.
+        """
+        self.path = path
+        self.strict = strict
+        self.entries: list[CassetteEntry] = []
+        self._by_key: dict[str, list[CassetteEntry]] = {}
+        self._key_positions: dict[str, int] = {}
+        self._position = 0
+
+        if path.exists():
+            with path.open() as f:
+                for line in f:
+                    if line.strip():
+                        self._add(CassetteEntry(**json.loads(line)))
+
+    def record(self, key: str, response: Any, latency: float):
+        """Append a recorded response to the cassette and its file."""
+        entry = CassetteEntry(key=key, response=response, latency=latency)
+        self._add(entry)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a") as f:
+            f.write(json.dumps(asdict(entry)) + "\n")
+
+    def lookup(self, key: str) -> CassetteEntry:
+        """Return the recorded response for a request key.
+
+        Raises:
+            KeyError: If the cassette is empty, or strict and there is no response
+                recorded for the key.
+        """
+        if entries := self._by_key.get(key):
+            position = self._key_positions.get(key, 0)
+            self._key_positions[key] = position + 1
+            return entries[position % len(entries)]
+
+        if self.strict or not self.entries:
+            raise KeyError(f"No recorded response for request {key}")
+
+        entry = self.entries[self._position % len(self.entries)]
+        self._position += 1
+        return entry
+
+    def sample_latency(self) -> float:
+        """Sample a latency from the recorded latency distribution."""
+        return random.choice(self.entries).latency if self.entries else 0.0
+
+    def _add(self, entry: CassetteEntry):
+        self.entries.append(entry)
+        self._by_key.setdefault(entry.key, []).append(entry)
+
+
+def request_key(request: Any) -> str:
+    """Compute the key of a JSON-compatible request, ignoring [`IGNORED_FIELDS`][group_genie.cassette.IGNORED_FIELDS]."""
+    canonical = json.dumps(_strip(request), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _strip(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        return {k: _strip(v) for k, v in obj.items() if k not in IGNORED_FIELDS}
+    if isinstance(obj, list):
+        return [_strip(v) for v in obj]
+    return obj
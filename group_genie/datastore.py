@@ -4,8 +4,10 @@ import re
 from asyncio import CancelledError, Future, Queue, Task, create_task
 from contextlib import asynccontextmanager
 from pathlib import Path
+from time import perf_counter
 from typing import Any, AsyncIterator
 
+from group_genie.metrics import DATASTORE_QUEUE_DEPTH, DATASTORE_SAVE_DURATION
 from group_genie.utils import arun
 
 logger = logging.getLogger(__name__)
@@ -143,6 +145,7 @@ class DataStore:
         """
         future = Future[None]()
         self._queue.put_nowait((key, data, future))
+        DATASTORE_QUEUE_DEPTH.inc()
         return future
 
     async def _save_worker(self):
@@ -150,8 +153,10 @@ class DataStore:
             try:
                 key, data, future = await self._queue.get()
             except CancelledError:
+                DATASTORE_QUEUE_DEPTH.dec(self._queue.qsize())  # discarded on shutdown
                 break
 
+            start = perf_counter()
             try:
                 await arun(self._save, key, data)
             except Exception as e:
@@ -159,6 +164,9 @@ class DataStore:
                 future.set_exception(e)
             else:
                 future.set_result(None)
+            finally:
+                DATASTORE_QUEUE_DEPTH.dec()
+                DATASTORE_SAVE_DURATION.observe(perf_counter() - start)
 
     def _save(self, key: str, data: Data):
         path = self.narrow_path(key)
@@ -0,0 +1,140 @@
+import sys
+from dataclasses import dataclass, field
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any
+
+_SKIPPED = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+
+
+def sizeof(obj: Any) -> int:
+    """Return the approximate deep size of an object in bytes.
+
+    Follows the items of built-in containers and the attributes of objects with a
+    `__dict__` or `__slots__`. Objects reachable over several paths are counted
+    once. Types, modules and functions are not counted.
+    """
+    seen: set[int] = set()
+    stack = [obj]
+    size = 0
+
+    while stack:
+        item = stack.pop()
+        if id(item) in seen or isinstance(item, _SKIPPED):
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+
+        if isinstance(item, (str, bytes, bytearray, int, float, bool)) or item is None:
+            continue
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        else:
+            if (attrs := getattr(item, "__dict__", None)) is not None:
+                stack.append(attrs)
+            for slot in getattr(type(item), "__slots__", ()):
+                if hasattr(item, slot):
+                    stack.append(getattr(item, slot))
+
+    return size
+
+
+@dataclass
+class RunnerFootprint:
+    """Approximate memory footprint of a group reasoner or agent runner.
+
+    Attributes:
+        key: Runner key (`reasoner:<owner>`, `system` or `<subagent name>:<instance id>`).
+        owner: User ID of the runner owner.
+        kind: `reasoner` or `agent`.
+        state_bytes: Approximate size of the reasoner or agent state (mainly
+            conversation history) in bytes, measured on the serialized state.
+        queued: Number of queued invocations.
+        tasks: Number of live asyncio tasks of the runner (worker, idle timer and
+            runs).
+        mcp_contexts: Number of agent instances with an open
+            [`mcp()`][group_genie.agent.base.Agent.mcp] context, each holding the
+            connections to the agent's MCP servers.
+        subagents: Footprints of the subagent runners of an agent runner.
+    """
+
+    key: str
+    owner: str
+    kind: str
+    state_bytes: int = 0
+    queued: int = 0
+    tasks: int = 0
+    mcp_contexts: int = 0
+    subagents: list["RunnerFootprint"] = field(default_factory=list)
+
+    @property
+    def total_bytes(self) -> int:
+        """State size including subagents."""
+        return self.state_bytes + sum(s.total_bytes for s in self.subagents)
+
+    @property
+    def total_runners(self) -> int:
+        """Number of runners including subagents."""
+        return 1 + sum(s.total_runners for s in self.subagents)
+
+    @property
+    def total_tasks(self) -> int:
+        """Number of tasks including subagents."""
+        return self.tasks + sum(s.total_tasks for s in self.subagents)
+
+    @property
+    def total_mcp_contexts(self) -> int:
+        """Number of open MCP contexts including subagents."""
+        return self.mcp_contexts + sum(s.total_mcp_contexts for s in self.subagents)
+
+
+@dataclass
+class SessionFootprint:
+    """Approximate memory footprint of a [`GroupSession`][group_genie.session.GroupSession].
+
+    Returned by [`footprint()`][group_genie.session.GroupSession.footprint].
+
+    Attributes:
+        id: Session ID.
+        messages: Number of messages of the session.
+        message_bytes: Approximate size of the messages in bytes, including threads
+            and attachment metadata.
+        reasoners: Footprints of the group reasoner runners, one per owner.
+        agents: Footprints of the system agent runners, one per owner, including
+            their subagent runners.
+    """
+
+    id: str
+    messages: int = 0
+    message_bytes: int = 0
+    reasoners: list[RunnerFootprint] = field(default_factory=list)
+    agents: list[RunnerFootprint] = field(default_factory=list)
+
+    @property
+    def total_bytes(self) -> int:
+        """Message size plus state size of all runners."""
+        return self.message_bytes + sum(r.total_bytes for r in self.reasoners + self.agents)
+
+    @property
+    def runners(self) -> int:
+        """Number of live runners, including subagent runners."""
+        return sum(r.total_runners for r in self.reasoners + self.agents)
+
+    @property
+    def tasks(self) -> int:
+        """Number of live runner tasks."""
+        return sum(r.total_tasks for r in self.reasoners + self.agents)
+
+    @property
+    def mcp_contexts(self) -> int:
+        """Number of open MCP contexts."""
+        return sum(r.total_mcp_contexts for r in self.agents)
+
+    def by_owner(self) -> dict[str, int]:
+        """Return the state size of runners by owner in bytes (messages are shared and not included)."""
+        result: dict[str, int] = {}
+        for runner in self.reasoners + self.agents:
+            result[runner.owner] = result.get(runner.owner, 0) + runner.total_bytes
+        return result
@@ -0,0 +1,150 @@
+from asyncio import CancelledError, Semaphore, sleep
+from contextlib import asynccontextmanager
+from time import perf_counter
+from typing import AsyncIterator
+
+from group_genie.metrics import MODEL_CALLS_ACTIVE, MODEL_LIMITER_WAIT
+from group_genie.scheduler import TokenBucket
+
+_limiters: dict[str, "ModelLimiter"] = {}
+
+
+class ModelLimiter:
+    """Concurrency and request rate limiter for model calls to a provider.
+
+    Limits the number of in-flight model calls and paces call starts to a maximum
+    requests-per-second rate, allowing short bursts. Waiting calls are started in
+    FIFO order. Limiters are process-wide and keyed by provider, so that all
+    sessions, runners and agents calling the same provider share its limits.
+    Configure them with
+    [`configure_model_limiter()`][group_genie.limiter.configure_model_limiter].
+    """
+
+    def __init__(
+        self,
+        key: str,
+        max_concurrency: int | None = None,
+        requests_per_second: float | None = None,
+        burst: int = 1,
+    ):
+        """Initialize a model limiter.
+
+        Args:
+            key: Provider key (e.g. `openai`, `google-gla`).
+            max_concurrency: Maximum number of in-flight model calls. None means
+                unlimited.
+            requests_per_second: Maximum sustained rate of model call starts. None
+                means unlimited.
+            burst: Number of calls that can be started at once before pacing applies.
+        """
+        self.key = key
+        self.max_concurrency = max_concurrency
+        self.requests_per_second = requests_per_second
+
+        self._semaphore = Semaphore(max_concurrency) if max_concurrency is not None else None
+        self._bucket = TokenBucket(burst, requests_per_second) if requests_per_second is not None else None
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Wait until a model call can be started and hold a concurrency slot for its duration."""
+        start = perf_counter()
+
+        if self._semaphore is not None:
+            await self._semaphore.acquire()
+
+        try:
+            await self._pace()
+            MODEL_LIMITER_WAIT.observe(perf_counter() - start, provider=self.key)
+            MODEL_CALLS_ACTIVE.inc(provider=self.key)
+            try:
+                yield
+            finally:
+                MODEL_CALLS_ACTIVE.dec(provider=self.key)
+        finally:
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+    async def _pace(self):
+        if self._bucket is None:
+            return
+
+        # reserve a request, waiting callers are started in reservation order
+        self._bucket.consume(1)
+
+        if delay := self._bucket.wait_time(0):
+            try:
+                await sleep(delay)
+            except CancelledError:
+                self._bucket.consume(-1)  # return reservation
+                raise
+
+
+def configure_model_limiter(
+    key: str,
+    max_concurrency: int | None = None,
+    requests_per_second: float | None = None,
+    burst: int = 1,
+) -> ModelLimiter:
+    """Configure the process-wide limiter for a provider, replacing an existing one.
+
+    Model calls opt into limiting by wrapping models with the provider-specific
+    `LimitedModel` ([pydantic-ai][group_genie.agent.provider.pydantic_ai.LimitedModel],
+    [OpenAI Agents SDK][group_genie.agent.provider.openai.LimitedModel]) or, in custom
+    agents, by running model calls in a [`model_call()`][group_genie.limiter.model_call]
+    context. Waiting times are recorded in the `group_genie_model_limiter_wait_seconds`
+    metric.
+
+    Args:
+        key: Provider key. For pydantic-ai models, this defaults to the model's
+            `system` (e.g. `openai`, `google-gla`, `anthropic`).
+        max_concurrency: Maximum number of in-flight model calls. None means
+            unlimited.
+        requests_per_second: Maximum sustained rate of model call starts. None
+            means unlimited.
+        burst: Number of calls that can be started at once before pacing applies.
+
+    Returns:
+        The configured limiter.
+
+    Example:
+        ```python
+        configure_model_limiter("google-gla", max_concurrency=16, requests_per_second=5, burst=10)
+
+        agent = DefaultAgent(
+            system_prompt="You are a helpful assistant",
+            model=LimitedModel("google-gla:gemini-3-flash-preview"),
+        )
+        ```
+    """
+    limiter = ModelLimiter(key, max_concurrency=max_concurrency, requests_per_second=requests_per_second, burst=burst)
+    _limiters[key] = limiter
+    return limiter
+
+
+def model_limiter(key: str) -> ModelLimiter | None:
+    """Return the limiter configured for a provider, None if there is none."""
+    return _limiters.get(key)
+
+
+def remove_model_limiter(key: str):
+    """Remove the limiter of a provider. Subsequent model calls are not limited."""
+    _limiters.pop(key, None)
+
+
+@asynccontextmanager
+async def model_call(key: str) -> AsyncIterator[None]:
+    """Context manager for running a model call under the limiter of a provider.
+
+    Does not limit the call if no limiter is configured for the provider.
+
+    Example:
+        ```python
+        async with model_call("openai"):
+            response = await client.responses.create(...)
+        ```
+    """
+    if (limiter := _limiters.get(key)) is None:
+        yield
+    else:
+        async with limiter.slot():
+            yield
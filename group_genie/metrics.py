@@ -0,0 +1,375 @@
+import math
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+from threading import Lock
+from time import perf_counter
+from typing import Callable, Iterator, TypeVar
+
+Labels = tuple[tuple[str, str], ...]
+
+MetricsObserver = Callable[[str, dict[str, str], float], None]
+"""Hook function type for observing metric updates.
+
+Called synchronously on every metric update with the metric name, the labels of
+the updated series and the observed value (the increment for counters, the new
+value for gauges and the observation for histograms). Observers must be fast and
+must not raise.
+"""
+
+M = TypeVar("M", bound="Metric")
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+"""Default histogram bucket upper bounds in seconds."""
+
+
+class Metric(ABC):
+    """Base class of metrics with labeled series."""
+
+    type: str = "untyped"
+
+    def __init__(self, name: str, help: str, registry: "MetricsRegistry"):
+        self.name = name
+        self.help = help
+        self._registry = registry
+        self._lock = Lock()
+
+    def _notify(self, labels: dict[str, str], value: float):
+        self._registry._notify(self.name, labels, value)
+
+    @abstractmethod
+    def samples(self) -> Iterator[tuple[str, Labels, float]]:
+        """Yield `(sample name, labels, value)` tuples of all series."""
+
+
+class Counter(Metric):
+    """Monotonically increasing value, e.g. the number of decisions."""
+
+    type = "counter"
+
+    def __init__(self, name: str, help: str, registry: "MetricsRegistry"):
+        super().__init__(name, help, registry)
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, value: float = 1.0, **labels: str):
+        """Increment the series identified by `labels` by `value`."""
+        if value < 0:
+            raise ValueError("Counters can only be incremented by non-negative values")
+        key = _key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + value
+        self._notify(labels, value)
+
+    def value(self, **labels: str) -> float:
+        """Return the current value of the series identified by `labels`."""
+        return self._values.get(_key(labels), 0.0)
+
+    def samples(self) -> Iterator[tuple[str, Labels, float]]:
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield f"{self.name}_total", key, value
+
+
+class Gauge(Metric):
+    """Value that can go up and down, e.g. a queue depth."""
+
+    type = "gauge"
+
+    def __init__(self, name: str, help: str, registry: "MetricsRegistry"):
+        super().__init__(name, help, registry)
+        self._values: dict[Labels, float] = {}
+
+    def set(self, value: float, **labels: str):
+        """Set the series identified by `labels` to `value`."""
+        with self._lock:
+            self._values[_key(labels)] = value
+        self._notify(labels, value)
+
+    def inc(self, value: float = 1.0, **labels: str):
+        """Increment the series identified by `labels` by `value`."""
+        key = _key(labels)
+        with self._lock:
+            self._values[key] = new_value = self._values.get(key, 0.0) + value
+        self._notify(labels, new_value)
+
+    def dec(self, value: float = 1.0, **labels: str):
+        """Decrement the series identified by `labels` by `value`."""
+        self.inc(-value, **labels)
+
+    def value(self, **labels: str) -> float:
+        """Return the current value of the series identified by `labels`."""
+        return self._values.get(_key(labels), 0.0)
+
+    def samples(self) -> Iterator[tuple[str, Labels, float]]:
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield self.name, key, value
+
+
+class Histogram(Metric):
+    """Distribution of observed values (e.g. latencies) over cumulative buckets."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        registry: "MetricsRegistry",
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help, registry)
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[Labels, _HistogramSeries] = {}
+
+    def observe(self, value: float, **labels: str):
+        """Record an observation in the series identified by `labels`."""
+        key = _key(labels)
+        with self._lock:
+            if (series := self._series.get(key)) is None:
+                series = self._series[key] = _HistogramSeries(len(self.buckets))
+            series.counts[bisect_left(self.buckets, value)] += 1
+            series.sum += value
+            series.count += 1
+        self._notify(labels, value)
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Context manager that observes the duration of its body in seconds."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(perf_counter() - start, **labels)
+
+    def count(self, **labels: str) -> int:
+        """Return the number of observations in the series identified by `labels`."""
+        series = self._series.get(_key(labels))
+        return 0 if series is None else series.count
+
+    def sum(self, **labels: str) -> float:
+        """Return the sum of observations in the series identified by `labels`."""
+        series = self._series.get(_key(labels))
+        return 0.0 if series is None else series.sum
+
+    def samples(self) -> Iterator[tuple[str, Labels, float]]:
+        with self._lock:
+            items = [(key, list(series.counts), series.sum, series.count) for key, series in self._series.items()]
+        for key, counts, total, count in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                yield f"{self.name}_bucket", key + (("le", _format_value(bound)),), cumulative
+            yield f"{self.name}_sum", key, total
+            yield f"{self.name}_count", key, count
+
+
+class _HistogramSeries:
+    def __init__(self, num_buckets: int):
+        self.counts = [0] * (num_buckets + 1)  # last bucket is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+
+class MetricsRegistry:
+    """Registry of counters, gauges and histograms.
+
+    Group Genie records per-stage latencies, decision counts and queue depths in
+    the module-level [`default_registry`][group_genie.metrics.default_registry].
+    Applications can export its content in Prometheus text format with
+    [`render()`][group_genie.metrics.MetricsRegistry.render] (e.g. from an
+    existing HTTP endpoint or to a file for the node exporter textfile collector)
+    or subscribe to individual updates with
+    [`add_observer()`][group_genie.metrics.MetricsRegistry.add_observer] to
+    forward them to another metrics backend.
+
+    Example:
+        ```python
+        from group_genie.metrics import default_registry
+
+        # export all metrics in Prometheus text format
+        print(default_registry.render())
+
+        # forward metric updates to another backend
+        default_registry.add_observer(lambda name, labels, value: statsd.timing(name, value))
+        ```
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+        self._observers: list[MetricsObserver] = []
+        self._lock = Lock()
+
+    def counter(self, name: str, help: str) -> Counter:
+        """Get or create a counter. The `_total` suffix is added on export."""
+        return self._register(name, Counter, lambda: Counter(name, help, self))
+
+    def gauge(self, name: str, help: str) -> Gauge:
+        """Get or create a gauge."""
+        return self._register(name, Gauge, lambda: Gauge(name, help, self))
+
+    def histogram(self, name: str, help: str, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        """Get or create a histogram with the given bucket upper bounds."""
+        return self._register(name, Histogram, lambda: Histogram(name, help, self, buckets=buckets))
+
+    def _register(self, name: str, cls: type[M], create: Callable[[], M]) -> M:
+        with self._lock:
+            if (metric := self._metrics.get(name)) is None:
+                metric = self._metrics[name] = create()
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} already registered as {metric.type}")
+        return metric  # type: ignore[return-value]
+
+    def metric(self, name: str) -> Metric:
+        """Return a registered metric by name.
+
+        Raises:
+            KeyError: If no metric with the given name is registered.
+        """
+        return self._metrics[name]
+
+    def add_observer(self, observer: MetricsObserver):
+        """Register a hook that is called on every metric update."""
+        self._observers.append(observer)
+
+    def remove_observer(self, observer: MetricsObserver):
+        """Remove a previously registered hook."""
+        self._observers.remove(observer)
+
+    def _notify(self, name: str, labels: dict[str, str], value: float):
+        for observer in self._observers:
+            observer(name, labels, value)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format (version 0.0.4)."""
+        lines: list[str] = []
+        for metric in list(self._metrics.values()):
+            lines.append(f"# HELP {metric.name} {_escape(metric.help, quote=False)}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for sample_name, labels, value in metric.samples():
+                lines.append(f"{sample_name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _key(labels: dict[str, str]) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape(value: str, quote: bool = True) -> str:
+    value = value.replace("\\", "\\\\").replace("\n", "\\n")
+    return value.replace('"', '\\"') if quote else value
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+default_registry = MetricsRegistry()
+"""Registry in which Group Genie records its built-in metrics."""
+
+SESSION_QUEUE_WAIT = default_registry.histogram(
+    "group_genie_session_queue_wait_seconds",
+    "Time a message waits in the group session worker queue.",
+)
+REASONER_QUEUE_WAIT = default_registry.histogram(
+    "group_genie_reasoner_queue_wait_seconds",
+    "Time an update waits in a group reasoner runner queue.",
+)
+REASONER_RUN_DURATION = default_registry.histogram(
+    "group_genie_reasoner_run_seconds",
+    "Duration of group reasoner runs.",
+)
+DECISIONS = default_registry.counter(
+    "group_genie_decisions",
+    "Number of decisions by decision and source (system, route, prefilter, reasoner, timeout, error).",
+)
+PREFERENCES_FETCH_DURATION = default_registry.histogram(
+    "group_genie_preferences_fetch_seconds",
+    "Duration of user preferences fetches.",
+)
+AGENT_QUEUE_WAIT = default_registry.histogram(
+    "group_genie_agent_queue_wait_seconds",
+    "Time a query waits in an agent runner queue, by agent name.",
+)
+AGENT_RUN_DURATION = default_registry.histogram(
+    "group_genie_agent_run_seconds",
+    "Duration of agent runs by agent name and outcome (ok, error, timeout).",
+)
+SUBAGENT_RUN_DURATION = default_registry.histogram(
+    "group_genie_subagent_run_seconds",
+    "Duration of run_subagent tool calls by subagent name.",
+)
+APPROVAL_WAIT = default_registry.histogram(
+    "group_genie_approval_wait_seconds",
+    "Time a tool call waits for approval, by tool name and decision.",
+)
+DATASTORE_SAVE_DURATION = default_registry.histogram(
+    "group_genie_datastore_save_seconds",
+    "Duration of data store save operations.",
+)
+DATASTORE_QUEUE_DEPTH = default_registry.gauge(
+    "group_genie_datastore_queue_depth",
+    "Number of pending data store save operations.",
+)
+APPROVALS = default_registry.counter(
+    "group_genie_approvals",
+    "Number of tool call approval decisions by source (auto, rule, memory, user, timeout) and decision.",
+)
+THROTTLED = default_registry.counter(
+    "group_genie_throttled",
+    "Number of throttled executions by budget scope (owner, session) and resource (requests, tokens).",
+)
+SCHEDULER_SLOT_WAIT = default_registry.histogram(
+    "group_genie_scheduler_slot_wait_seconds",
+    "Time an execution waits for a model concurrency slot.",
+)
+MODEL_LIMITER_WAIT = default_registry.histogram(
+    "group_genie_model_limiter_wait_seconds",
+    "Time a model call waits for its provider's concurrency and rate limits.",
+)
+MODEL_CALLS_ACTIVE = default_registry.gauge(
+    "group_genie_model_calls_active",
+    "Number of in-flight model calls by provider (limited calls only).",
+)
+TOOL_CACHE = default_registry.counter(
+    "group_genie_tool_cache",
+    "Number of tool result cache lookups by tool name and result (hit, miss).",
+)
+LOOP_LAG = default_registry.histogram(
+    "group_genie_loop_lag_seconds",
+    "Event loop lag measured by the loop monitor heartbeat.",
+)
+LOOP_STALLS = default_registry.counter(
+    "group_genie_loop_stalls",
+    "Number of event loop stalls above the loop monitor threshold by stage (blocking function).",
+)
+PROFILES = default_registry.counter(
+    "group_genie_profiles",
+    "Number of profiles of slow executions by outcome (written, rate_limited).",
+)
+RUNNERS_CANCELLED = default_registry.counter(
+    "group_genie_runners_cancelled",
+    "Number of runners cancelled after their shutdown deadline by kind (reasoner, agent).",
+)
+OVERLOAD = default_registry.counter(
+    "group_genie_overload",
+    "Number of messages exceeding session admission limits by scope (session, owner) and outcome (rejected, dropped).",
+)
+ADMISSION_WAIT = default_registry.histogram(
+    "group_genie_admission_wait_seconds",
+    "Time a submitted message waits for admission under backpressure.",
+)
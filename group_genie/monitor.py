@@ -0,0 +1,208 @@
+import asyncio
+import logging
+import sys
+import threading
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+from time import perf_counter, time
+from types import FrameType
+from typing import Callable
+
+from group_genie.metrics import LOOP_LAG, LOOP_STALLS
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Stall:
+    """Event loop stall detected by a [`LoopMonitor`][group_genie.monitor.LoopMonitor].
+
+    Attributes:
+        lag: Delay of the monitor's heartbeat in seconds, approximately the
+            duration the loop was blocked.
+        stage: Innermost Group Genie function on the blocked stack (as
+            `module:qualname`), or the innermost function if no Group Genie code was
+            on the stack. Used as `stage` label of the stall metric.
+        task: Name of the task that blocked the loop, None if the loop was blocked
+            by a callback outside a task.
+        coro: Qualified name of the coroutine of that task.
+        stack: Formatted stack of the loop thread, captured while it was blocked.
+        time: Unix timestamp of the capture.
+    """
+
+    lag: float
+    stage: str = "unknown"
+    task: str | None = None
+    coro: str | None = None
+    stack: str = ""
+    time: float = field(default_factory=time)
+
+
+class LoopMonitor:
+    """Detects event loop stalls and attributes them to the code that blocked the loop.
+
+    All sessions, runners and agents in a process share one asyncio event loop,
+    so synchronous work in any of them (state serialization, JSON encoding,
+    synchronous secrets providers, ...) delays all others. The monitor runs a
+    heartbeat on the loop and a watchdog thread that captures the stack of the
+    loop thread when the heartbeat is late by more than `threshold` seconds.
+
+    When the loop resumes, the stall is
+
+    - recorded in the `group_genie_loop_stalls` metric, labeled with its stage,
+    - logged as warning with the captured stack (with the [`Stall`][group_genie.monitor.Stall]
+      in the `stall` attribute of the log record),
+    - passed to the optional `on_stall` callback and kept in
+      [`stalls`][group_genie.monitor.LoopMonitor.stalls].
+
+    The lag of every heartbeat is recorded in the `group_genie_loop_lag_seconds`
+    metric.
+
+    Example:
+        ```python
+        async with LoopMonitor(threshold=0.1):
+            ...  # run sessions
+        ```
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.05,
+        threshold: float = 0.1,
+        stack_limit: int = 30,
+        history: int = 100,
+        on_stall: Callable[[Stall], None] | None = None,
+    ):
+        """Initialize a loop monitor.
+
+        Args:
+            interval: Heartbeat interval in seconds.
+            threshold: Minimum heartbeat delay in seconds that is reported as stall.
+            stack_limit: Maximum number of stack frames captured per stall.
+            history: Number of most recent stalls kept in
+                [`stalls`][group_genie.monitor.LoopMonitor.stalls].
+            on_stall: Optional callback, called on the event loop for each stall.
+        """
+        self.interval = interval
+        self.threshold = threshold
+        self.stack_limit = stack_limit
+        self.on_stall = on_stall
+        self.stalls: deque[Stall] = deque(maxlen=history)
+        """Most recent stalls, oldest first."""
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: int | None = None
+        self._beat = perf_counter()
+        self._captured: Stall | None = None
+        self._captured_beat: float | None = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+
+    async def __aenter__(self) -> "LoopMonitor":
+        self.start()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.stop()
+
+    def start(self):
+        """Start monitoring the running event loop."""
+        if self._task is not None:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._beat = perf_counter()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._heartbeat())
+        self._watchdog = threading.Thread(target=self._watch, name="group-genie-loop-monitor", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self):
+        """Stop monitoring."""
+        if self._task is None:
+            return
+
+        self._stop.set()
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+
+    async def _heartbeat(self):
+        while True:
+            self._beat = perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, perf_counter() - self._beat - self.interval)
+            LOOP_LAG.observe(lag)
+            if lag >= self.threshold:
+                self._report(lag)
+
+    def _report(self, lag: float):
+        with self._lock:
+            stall, self._captured = self._captured, None
+
+        if stall is None:  # resumed before the watchdog captured the stack
+            stall = Stall(lag=lag)
+        stall.lag = lag
+
+        self.stalls.append(stall)
+        LOOP_STALLS.inc(stage=stall.stage)
+        logger.warning(
+            f"Event loop blocked for {lag * 1000:.0f}ms in {stall.stage} (task {stall.task})\n{stall.stack}",
+            extra={"stall": stall},
+        )
+
+        if self.on_stall is not None:
+            try:
+                self.on_stall(stall)
+            except Exception:
+                logger.exception("Error in loop stall callback")
+
+    def _watch(self):
+        check = min(self.interval, self.threshold) / 2
+
+        while not self._stop.wait(check):
+            beat = self._beat
+            if perf_counter() - beat < self.interval + self.threshold or self._captured_beat == beat:
+                continue
+
+            stall = self._capture()
+            with self._lock:
+                self._captured = stall
+                self._captured_beat = beat
+
+    def _capture(self) -> Stall:
+        stall = Stall(lag=0.0)
+
+        if self._loop is not None and (task := asyncio.current_task(self._loop)) is not None:
+            stall.task = task.get_name()
+            stall.coro = getattr(task.get_coro(), "__qualname__", None)
+
+        if (frame := sys._current_frames().get(self._loop_thread or 0)) is not None:
+            stall.stage = _stage(frame)
+            stall.stack = "".join(traceback.format_stack(frame, limit=self.stack_limit))
+
+        return stall
+
+
+def _stage(frame: FrameType) -> str:
+    innermost: str | None = None
+    current: FrameType | None = frame
+
+    while current is not None:
+        module = current.f_globals.get("__name__", "")
+        name = f"{module}:{current.f_code.co_qualname}"
+        if innermost is None:
+            innermost = name
+        if module.startswith("group_genie.") and module != __name__:
+            return name
+        current = current.f_back
+
+    return innermost or "unknown"
@@ -0,0 +1,197 @@
+import logging
+import sys
+import threading
+from asyncio import get_running_loop
+from collections import Counter
+from pathlib import Path
+from time import perf_counter, sleep
+from types import FrameType
+
+from group_genie.datastore import sanitize
+from group_genie.metrics import PROFILES
+from group_genie.scheduler import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+class Profile:
+    """Stack samples collected while an execution is in flight.
+
+    Created by [`ExecutionProfiler.begin()`][group_genie.profiling.ExecutionProfiler.begin].
+    """
+
+    def __init__(self, profiler: "ExecutionProfiler", key: str):
+        self.key = key
+        self.samples: Counter[str] = Counter()
+        self._profiler = profiler
+        self._start = perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        return perf_counter() - self._start
+
+    def end(self) -> Path | None:
+        """Stop sampling and write the profile if the execution was slow.
+
+        Returns:
+            Path of the profile file, None if the execution was faster than the
+                threshold or the profile was rate limited.
+        """
+        return self._profiler._end(self)
+
+
+class ExecutionProfiler:
+    """Opt-in sampling profiler for slow executions.
+
+    While executions are in flight, a sampler thread periodically captures the stack
+    of the event loop thread (stdlib only, no tracing hooks are installed, so the
+    overhead on the loop is small). When an execution ends after more than
+    `threshold` seconds, its samples are written to `<directory>/<request id>.collapsed`
+    in collapsed stack format (one `frame;frame;...;frame count` line per stack),
+    which can be opened with [speedscope](https://www.speedscope.app/) or converted
+    to a flame graph. Executions of messages without `request_id` are keyed by their
+    trace ID.
+
+    All sessions, runners and agents in a process share the event loop, so a
+    profile shows everything the loop did while the execution was in flight,
+    including work for other executions. Samples in the event loop's selector mean
+    that the loop was idle, waiting for I/O such as model responses.
+
+    Profiles are rate limited, and the number of concurrently profiled executions
+    and their sampling duration are bounded, so that the profiler can be enabled in
+    production.
+
+    Example:
+        ```python
+        profiler = ExecutionProfiler(directory=Path(".data", "profiles"), threshold=10.0)
+        session = GroupSession(..., profiler=profiler)
+
+        execution = session.handle(message)
+        await execution.result()
+
+        if execution.profile is not None:
+            print(f"Slow execution profiled: {execution.profile}")
+        ```
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        threshold: float = 10.0,
+        interval: float = 0.01,
+        max_active: int = 16,
+        max_duration: float = 300.0,
+        max_profiles: int = 5,
+        period: float = 600.0,
+        stack_limit: int = 64,
+    ):
+        """Initialize the profiler.
+
+        Args:
+            directory: Directory in which profiles are written.
+            threshold: Minimum execution duration in seconds for writing a profile.
+            interval: Sampling interval in seconds.
+            max_active: Maximum number of concurrently profiled executions. Further
+                executions are not profiled.
+            max_duration: Maximum sampling duration per execution in seconds.
+            max_profiles: Maximum number of profiles written per `period` (allowing
+                bursts of up to `max_profiles`).
+            period: Rate limiting period in seconds.
+            stack_limit: Maximum number of frames per sampled stack (innermost
+                frames are kept).
+        """
+        self.directory = directory
+        self.threshold = threshold
+        self.interval = interval
+        self.max_active = max_active
+        self.max_duration = max_duration
+        self.stack_limit = stack_limit
+
+        self._bucket = TokenBucket(max_profiles, max_profiles / period)
+        self._active: list[Profile] = []
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._loop_thread: int | None = None
+
+    def begin(self, key: str) -> Profile | None:
+        """Start sampling for an execution.
+
+        Must be called on the event loop thread.
+
+        Args:
+            key: Key of the execution (request ID or trace ID).
+
+        Returns:
+            The profile of the execution, None if `max_active` executions are
+                already profiled.
+        """
+        with self._lock:
+            if len(self._active) >= self.max_active:
+                return None
+
+            profile = Profile(self, key)
+            self._active.append(profile)
+            self._loop_thread = threading.get_ident()
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._sample, name="group-genie-profiler", daemon=True)
+                self._thread.start()
+
+        return profile
+
+    def _end(self, profile: Profile) -> Path | None:
+        with self._lock:
+            if profile in self._active:
+                self._active.remove(profile)
+
+        if profile.elapsed < self.threshold or not profile.samples:
+            return None
+
+        if self._bucket.balance < 1:
+            PROFILES.inc(outcome="rate_limited")
+            logger.debug(f"Profile of execution {profile.key} rate limited")
+            return None
+
+        self._bucket.consume(1)
+        PROFILES.inc(outcome="written")
+
+        path = self.directory / f"{sanitize(profile.key)}.collapsed"
+        get_running_loop().run_in_executor(None, self._write, path, profile.samples)
+        logger.info(f"Execution {profile.key} took {profile.elapsed:.1f}s, profile written to {path}")
+        return path
+
+    def _write(self, path: Path, samples: Counter[str]):
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("".join(f"{stack} {count}\n" for stack, count in samples.items()))
+        except Exception:
+            logger.exception(f"Error writing profile {path}")
+
+    def _sample(self):
+        while True:
+            sleep(self.interval)
+
+            frame = sys._current_frames().get(self._loop_thread or 0)
+            stack = None if frame is None else _collapse(frame, self.stack_limit)
+            del frame
+
+            with self._lock:
+                self._active = [p for p in self._active if p.elapsed < self.max_duration]
+                if not self._active:
+                    self._thread = None
+                    return
+                if stack is not None:
+                    for profile in self._active:
+                        profile.samples[stack] += 1
+
+
+def _collapse(frame: FrameType, limit: int) -> str:
+    frames: list[str] = []
+    current: FrameType | None = frame
+
+    while current is not None and len(frames) < limit:
+        module = current.f_globals.get("__name__", "?")
+        frames.append(f"{module}:{current.f_code.co_qualname}".replace(";", ","))
+        current = current.f_back
+
+    return ";".join(reversed(frames))
@@ -1,3 +1,10 @@
 from group_genie.reasoner.base import GroupReasoner
 from group_genie.reasoner.factory import GroupReasonerFactory, GroupReasonerFactoryFn
+from group_genie.reasoner.prefilter import (
+    LengthPrefilter,
+    MentionPrefilter,
+    Prefilter,
+    ReceiverPrefilter,
+    RegexPrefilter,
+)
 from group_genie.reasoner.runner import GroupReasonerRunner
@@ -5,6 +5,7 @@ from typing import Any
 from group_sense import Response
 
 from group_genie.message import Message
+from group_genie.usage import Usage
 
 logger = logging.getLogger(__name__)
 
@@ -99,3 +100,17 @@ class GroupReasoner(ABC):
                 and optional delegation parameters (query and receiver).
         """
         ...
+
+    def usage(self) -> Usage | None:
+        """Return the model usage of the last [`run()`][group_genie.reasoner.base.GroupReasoner.run].
+
+        Called by the framework after each run to aggregate usage per execution, owner
+        and session. Also called after failed, timed out and cancelled (hedged) runs,
+        so implementations should report the usage consumed by the last run so far
+        rather than the usage of an earlier run. The default implementation returns
+        None (usage not tracked).
+
+        Returns:
+            Usage of the last run, or None if not available.
+        """
+        return None
@@ -3,7 +3,8 @@ from typing import Any, Callable
 from group_sense import GroupReasonerFactory as GroupReasonerFactoryBase
 
 from group_genie.reasoner.base import GroupReasoner
-from group_genie.secrets import SecretsProvider
+from group_genie.reasoner.prefilter import Prefilter
+from group_genie.secrets import AsyncSecretsProvider, SecretsProvider, load_secrets
 
 GroupReasonerFactoryFn = Callable[[dict[str, str], str], GroupReasoner]
 """Factory function signature for creating group reasoners.
@@ -60,6 +61,7 @@ class GroupReasonerFactory(GroupReasonerFactoryBase):
             group_reasoner_factory_fn=create_reasoner,
             group_reasoner_idle_timeout=600,
             secrets_provider=my_secrets_provider,
+            prefilters=[RegexPrefilter(pattern=r"[\\W_]*"), MentionPrefilter(mentions=["genie"])],
         )
 
         # Factory creates reasoner for specific user
@@ -71,7 +73,10 @@ class GroupReasonerFactory(GroupReasonerFactoryBase):
         self,
         group_reasoner_factory_fn: GroupReasonerFactoryFn,
         group_reasoner_idle_timeout: float | None = None,
-        secrets_provider: SecretsProvider | None = None,
+        secrets_provider: SecretsProvider | AsyncSecretsProvider | None = None,
+        prefilters: list[Prefilter] | None = None,
+        group_reasoner_timeout: float | None = None,
+        hedge_percentile: float | None = None,
     ):
         """Initialize the group reasoner factory.
 
@@ -81,16 +86,46 @@ class GroupReasonerFactory(GroupReasonerFactoryBase):
             group_reasoner_idle_timeout: Optional timeout in seconds after which an idle
                 reasoner is stopped to free resources. Defaults to 600s (10 minutes).
             secrets_provider: Optional provider for user-specific secrets (e.g., API keys).
+            prefilters: Optional list of [`Prefilter`][group_genie.reasoner.prefilter.Prefilter]s
+                evaluated in order before the group reasoner. The first prefilter that
+                returns a decision short-circuits the reasoner call.
+            group_reasoner_timeout: Optional timeout in seconds for a single reasoner
+                call. On timeout, the call is cancelled and the decision is IGNORE.
+            hedge_percentile: Optional latency percentile (e.g. 0.95) of recent reasoner
+                calls after which a second, hedged call is started on a copy of the
+                reasoner state. The first successful result is used and the other call
+                is cancelled. Requires reasoners that only update their state when
+                [`run()`][group_genie.reasoner.base.GroupReasoner.run] completes.
         """
         self._group_reasoner_factory_fn = group_reasoner_factory_fn
         self._group_reasoner_idle_timeout = group_reasoner_idle_timeout or 600
         self._secrets_provider = secrets_provider
+        self._prefilters = prefilters or []
+        self._group_reasoner_timeout = group_reasoner_timeout
+        self._hedge_percentile = hedge_percentile
 
     @property
     def group_reasoner_idle_timeout(self) -> float | None:
         return self._group_reasoner_idle_timeout
 
-    def create_group_reasoner(self, owner: str, **kwargs: Any) -> GroupReasoner:
+    @property
+    def prefilters(self) -> list[Prefilter]:
+        return self._prefilters
+
+    @property
+    def group_reasoner_timeout(self) -> float | None:
+        return self._group_reasoner_timeout
+
+    @property
+    def hedge_percentile(self) -> float | None:
+        return self._hedge_percentile
+
+    def create_group_reasoner(
+        self,
+        owner: str,
+        secrets: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> GroupReasoner:
         """Create a group reasoner instance for a specific owner.
 
         Retrieves secrets for the owner and creates a reasoner instance using the
@@ -98,16 +133,35 @@ class GroupReasonerFactory(GroupReasonerFactoryBase):
 
         Args:
             owner: User ID of the reasoner owner.
+            secrets: Optional secrets of the owner, obtained with
+                [`get_secrets()`][group_genie.reasoner.factory.GroupReasonerFactory.get_secrets].
+                If None, secrets are retrieved synchronously from the secrets provider
+                (not supported for an
+                [`AsyncSecretsProvider`][group_genie.secrets.AsyncSecretsProvider]).
             **kwargs: Additional keyword arguments passed to the factory function.
 
         Returns:
             A new [`GroupReasoner`][group_genie.reasoner.base.GroupReasoner] instance
                 configured for the owner.
         """
-        secrets = self._get_secrets(owner)
+        if secrets is None:
+            secrets = self._get_secrets(owner)
         return self._group_reasoner_factory_fn(secrets, owner, **kwargs)
 
+    async def get_secrets(self, owner: str) -> dict[str, str]:
+        """Retrieve the secrets of an owner without blocking the event loop.
+
+        Args:
+            owner: User ID of the reasoner owner.
+
+        Returns:
+            The owner's secrets (empty if there is no secrets provider).
+        """
+        return await load_secrets(self._secrets_provider, owner)
+
     def _get_secrets(self, owner: str) -> dict[str, str]:
         if self._secrets_provider is None:
             return {}
+        if isinstance(self._secrets_provider, AsyncSecretsProvider):
+            raise TypeError("Async secrets provider requires secrets to be passed to create_group_reasoner()")
         return self._secrets_provider.get_secrets(owner) or {}
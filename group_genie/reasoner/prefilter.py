@@ -0,0 +1,153 @@
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from group_sense import Decision, Response
+
+from group_genie.message import Message
+
+
+class Prefilter(ABC):
+    """Abstract base class for cheap, rule-based pre-reasoning stages.
+
+    Prefilters run before the group reasoner and can decide on a message update
+    without a model call. A prefilter either returns a
+    [`Response`][group_genie.agent.Response] (IGNORE or DELEGATE), which is used
+    instead of calling the reasoner, or None to pass the update on to the next
+    prefilter and finally to the reasoner.
+
+    Messages resolved by a prefilter are not consumed by the group reasoner. Its
+    [`processed`][group_genie.reasoner.base.GroupReasoner.processed] offset is left
+    unchanged, so these messages are included as context in the next update batch
+    that reaches the reasoner.
+
+    Example:
+        ```python
+        class GreetingPrefilter(Prefilter):
+            async def apply(self, owner: str, updates: list[Message]) -> Response | None:
+                if updates[-1].content.lower() in ["hi", "hello", "thanks"]:
+                    return Response(decision=Decision.IGNORE)
+                return None
+        ```
+    """
+
+    @abstractmethod
+    async def apply(self, owner: str, updates: list[Message]) -> Response | None:
+        """Decide on a message update without calling the group reasoner.
+
+        Args:
+            owner: User ID of the reasoner owner.
+            updates: Messages that arrived since the reasoner's last run. The last
+                message is the one that triggered reasoning.
+
+        Returns:
+            A response with the decision, or None if this prefilter cannot decide.
+        """
+        ...
+
+
+@dataclass
+class MentionPrefilter(Prefilter):
+    """Delegates messages that explicitly mention the assistant.
+
+    If the last message contains one of the configured mentions (e.g. `@genie`),
+    it is delegated with the mention removed from the query. The response is
+    directed to the message sender.
+
+    Attributes:
+        mentions: Mention handles without the leading `@` (e.g. `["genie"]`).
+    """
+
+    mentions: list[str]
+
+    def __post_init__(self):
+        names = "|".join(re.escape(mention) for mention in self.mentions)
+        self._pattern = re.compile(rf"(?<!\w)@(?:{names})(?!\w)", re.IGNORECASE)
+
+    async def apply(self, owner: str, updates: list[Message]) -> Response | None:
+        message = updates[-1]
+
+        if not self._pattern.search(message.content):
+            return None
+
+        query = self._pattern.sub("", message.content).strip()
+        return Response(decision=Decision.DELEGATE, query=query, receiver=message.sender)
+
+
+@dataclass
+class RegexPrefilter(Prefilter):
+    """Decides on messages whose content matches a regular expression.
+
+    Matching is done with `re.fullmatch` against the stripped content of the last
+    message. Delegated messages use the message content as query and are directed
+    to the message sender.
+
+    Attributes:
+        pattern: Regular expression matched against the message content.
+        decision: Decision returned for matching messages. Defaults to IGNORE.
+
+    Example:
+        ```python
+        # ignore messages consisting only of emojis, punctuation or whitespace
+        RegexPrefilter(pattern=r"[\\W_]*")
+        ```
+    """
+
+    pattern: str
+    decision: Decision = Decision.IGNORE
+
+    def __post_init__(self):
+        self._pattern = re.compile(self.pattern, re.IGNORECASE | re.DOTALL)
+
+    async def apply(self, owner: str, updates: list[Message]) -> Response | None:
+        message = updates[-1]
+
+        if not self._pattern.fullmatch(message.content.strip()):
+            return None
+
+        if self.decision == Decision.IGNORE:
+            return Response(decision=Decision.IGNORE)
+
+        return Response(decision=Decision.DELEGATE, query=message.content, receiver=message.sender)
+
+
+@dataclass
+class LengthPrefilter(Prefilter):
+    """Ignores messages that are too short to require assistance.
+
+    Messages with attachments or referenced threads are never ignored by this
+    prefilter.
+
+    Attributes:
+        min_length: Minimum number of characters (after stripping whitespace) a
+            message must have to be passed on.
+    """
+
+    min_length: int
+
+    async def apply(self, owner: str, updates: list[Message]) -> Response | None:
+        message = updates[-1]
+
+        if message.attachments or message.threads:
+            return None
+
+        if len(message.content.strip()) < self.min_length:
+            return Response(decision=Decision.IGNORE)
+
+        return None
+
+
+@dataclass
+class ReceiverPrefilter(Prefilter):
+    """Ignores messages that are explicitly addressed to another group member.
+
+    Messages addressed to the owner or to `system` are passed on.
+    """
+
+    async def apply(self, owner: str, updates: list[Message]) -> Response | None:
+        message = updates[-1]
+
+        if message.receiver and message.receiver not in [owner, "system"]:
+            return Response(decision=Decision.IGNORE)
+
+        return None
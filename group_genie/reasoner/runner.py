@@ -1,15 +1,24 @@
 import logging
-from asyncio import CancelledError, Future, Queue, Task, create_task, sleep
+from asyncio import FIRST_COMPLETED, CancelledError, Future, Queue, Task, create_task, shield, sleep, wait, wait_for
 from dataclasses import dataclass, field
+from time import perf_counter, time
 
 from group_sense import Decision, Response
 
+from group_genie import tracing, usage
 from group_genie.datastore import DataStore, narrow
+from group_genie.footprint import RunnerFootprint, sizeof
 from group_genie.message import Message
+from group_genie.metrics import DECISIONS, REASONER_QUEUE_WAIT, REASONER_RUN_DURATION, RUNNERS_CANCELLED
+from group_genie.reasoner.base import GroupReasoner
 from group_genie.reasoner.factory import GroupReasonerFactory
+from group_genie.stats import Health, RunnerStats
+from group_genie.utils import LatencyWindow
 
 logger = logging.getLogger(__name__)
 
+HEDGE_MIN_SAMPLES = 20
+
 
 class GroupReasonerRunner:
     def __init__(
@@ -23,13 +32,25 @@ class GroupReasonerRunner:
         self.owner = owner
         self.data_store = data_store
 
-        self._group_reasoner = group_reasoner_factory.create_group_reasoner(owner=owner)
+        self._group_reasoner_factory = group_reasoner_factory
+        self._group_reasoner: GroupReasoner  # created by worker
         self._idle_timeout = group_reasoner_factory.group_reasoner_idle_timeout
+        self._prefilters = group_reasoner_factory.prefilters
+        self._timeout = group_reasoner_factory.group_reasoner_timeout
+        self._hedge_percentile = group_reasoner_factory.hedge_percentile
+        self._latencies = LatencyWindow()
+        self._secrets: dict[str, str] = {}
         self._idle_timer: Task | None = None
+        self._idle_deadline: float | None = None
+        self._ready: Future[bool] = Future()
+        self._health = Health()
+        self._running: float | None = None  # creation time of running invoke
+        self._queued: set[Future[Response]] = set()  # futures of queued invokes
 
         self._worker_queue: Queue[Invoke | Stop] = Queue()
         self._worker_task = create_task(self._work())
         self._stopped = False
+        self._cancelled = False
 
     @property
     def stopped(self) -> bool:
@@ -40,6 +61,17 @@ class GroupReasonerRunner:
             self._stopped = True
             self._worker_queue.put_nowait(Stop())
 
+    def cancel(self):
+        """Stop the runner immediately.
+
+        Cancels the in-flight invoke, fails queued invokes and saves the group
+        reasoner state before the runner stops.
+        """
+        if not self._worker_task.done():
+            self._stopped = True
+            self._cancelled = True
+            self._worker_task.cancel()
+
     async def _stop_after(self, timeout: float):
         try:
             await sleep(timeout)
@@ -48,27 +80,91 @@ class GroupReasonerRunner:
         else:
             self.stop()
 
-    async def join(self):
+    async def join(self, timeout: float | None = None):
+        """Wait for the runner to stop.
+
+        Args:
+            timeout: Seconds to wait before the runner is cancelled with
+                [`cancel()`][group_genie.reasoner.runner.GroupReasonerRunner.cancel].
+                None means waiting until queued invokes completed.
+        """
+        if timeout is not None:
+            await wait([self._worker_task], timeout=timeout)
+            self.cancel()
         await self._worker_task
         if self._idle_timer is not None:
             self._idle_timer.cancel()
             await self._idle_timer
 
     def invoke(self, messages: list[Message]) -> Future[Response]:
-        if self._idle_timer is not None:
-            self._idle_timer.cancel()
-            self._idle_timer = None
-
         if self._stopped:
             raise RuntimeError(f"Agent {self.key} stopped")
 
         invoke = Invoke(messages=messages)
         self._worker_queue.put_nowait(invoke)
+        self._queued.add(invoke.future)
+        self.reset_idle_timer()
+        return invoke.future
+
+    def discard(self, future: Future[Response]) -> bool:
+        """Cancel a queued invoke.
+
+        Messages of a discarded invoke are included in the updates of the next
+        invoke.
 
-        if self._idle_timeout is not None:
+        Returns:
+            True if the invoke was queued and is cancelled, False if it is already
+                running or done.
+        """
+        if future not in self._queued:
+            return False
+        self._queued.discard(future)
+        future.cancel()
+        return True
+
+    def reset_idle_timer(self):
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+            self._idle_deadline = None
+
+        if self._idle_timeout is not None and not self._stopped:
             self._idle_timer = create_task(self._stop_after(self._idle_timeout))
+            self._idle_deadline = time() + self._idle_timeout
 
-        return invoke.future
+    async def ready(self) -> bool:
+        """Wait until the runner is initialized and ready to process invokes.
+
+        Returns:
+            True if initialization succeeded, False if it failed.
+        """
+        return await shield(self._ready)
+
+    def stats(self) -> RunnerStats:
+        return RunnerStats(
+            key=self.key,
+            owner=self.owner,
+            kind="reasoner",
+            live=self._ready.done() and self._ready.result() and not self._worker_task.done(),
+            stopped=self._stopped,
+            idle_deadline=None if self._stopped else self._idle_deadline,
+            queued=self._worker_queue.qsize(),
+            in_flight=0 if self._running is None else 1,
+            in_flight_age=None if self._running is None else perf_counter() - self._running,
+            pending_saves=self._health.pending_saves,
+            last_error=self._health.last_error,
+        )
+
+    def footprint(self) -> RunnerFootprint:
+        ready = self._ready.done() and self._ready.result()
+        return RunnerFootprint(
+            key=self.key,
+            owner=self.owner,
+            kind="reasoner",
+            state_bytes=sizeof(self._group_reasoner.get_serialized()) if ready else 0,
+            queued=self._worker_queue.qsize(),
+            tasks=sum(1 for task in [self._worker_task, self._idle_timer] if task is not None and not task.done()),
+        )
 
     def _save(self, data_store: DataStore | None) -> Future[None]:
         if data_store is None:
@@ -77,7 +173,7 @@ class GroupReasonerRunner:
             return future
 
         data = self._group_reasoner.get_serialized()
-        return data_store.save("reasoner", data)
+        return self._health.track(data_store.save("reasoner", data))
 
     async def _load(self, data_store: DataStore | None):
         if data_store is None:
@@ -90,50 +186,186 @@ class GroupReasonerRunner:
         else:
             self._group_reasoner.set_serialized(data)
 
+    async def _prefilter(self, updates: list[Message]) -> Response | None:
+        for prefilter in self._prefilters:
+            if response := await prefilter.apply(self.owner, updates):
+                logger.debug(f"Prefilter {type(prefilter).__name__} decision: {response.decision}")
+                return response
+        return None
+
+    def _create_group_reasoner(self) -> GroupReasoner:
+        return self._group_reasoner_factory.create_group_reasoner(owner=self.owner, secrets=self._secrets)
+
+    async def _reason(self, updates: list[Message]) -> Response:
+        try:
+            response = await wait_for(self._run(updates), timeout=self._timeout)
+        except TimeoutError:
+            logger.warning(f"Group reasoner {self.key} timed out after {self._timeout}s")
+            self._health.error("timeout", TimeoutError(f"Group reasoner {self.key} timed out after {self._timeout}s"))
+            response = Response(decision=Decision.IGNORE)
+            DECISIONS.inc(decision=response.decision.value, source="timeout")
+        else:
+            DECISIONS.inc(decision=response.decision.value, source="reasoner")
+        return response
+
+    async def _run(self, updates: list[Message]) -> Response:
+        start = perf_counter()
+
+        with tracing.span("reasoner.run", updates=len(updates)):
+            if self._hedge_percentile is not None and len(self._latencies) >= HEDGE_MIN_SAMPLES:
+                response = await self._run_hedged(updates, delay=self._latencies.percentile(self._hedge_percentile))
+            else:
+                reasoner = self._group_reasoner
+                try:
+                    response = await reasoner.run(updates)
+                finally:
+                    # also record usage of failed and timed out runs
+                    usage.record("reasoner", reasoner.usage())
+
+        latency = perf_counter() - start
+        self._latencies.add(latency)
+        REASONER_RUN_DURATION.observe(latency)
+        return response
+
+    async def _run_hedged(self, updates: list[Message], delay: float | None) -> Response:
+        primary = create_task(self._group_reasoner.run(updates))
+        reasoners = {primary: self._group_reasoner}
+
+        try:
+            done, pending = await wait([primary], timeout=delay)
+
+            if not done:
+                logger.debug(f"Group reasoner {self.key} hedging after {delay:.3f}s")
+                if span := tracing.current_span():
+                    span.set_attribute("hedged", True)
+                hedge_reasoner = self._create_group_reasoner()
+                hedge_reasoner.set_serialized(self._group_reasoner.get_serialized())
+                hedge = create_task(hedge_reasoner.run(updates))
+                reasoners[hedge] = hedge_reasoner
+                pending.add(hedge)
+
+            succeeded = [task for task in done if task.exception() is None]
+
+            while pending and not succeeded:
+                done, pending = await wait(pending, return_when=FIRST_COMPLETED)
+                succeeded = [task for task in done if task.exception() is None]
+
+            if succeeded:
+                task = primary if primary in succeeded else succeeded[0]
+                self._group_reasoner = reasoners[task]
+                return task.result()
+            return primary.result()  # re-raise error of primary call
+        finally:
+            for task in reasoners:
+                task.cancel()
+            # record usage of both calls, including the cancelled or failed one
+            await wait(reasoners)
+            for reasoner in reasoners.values():
+                usage.record("reasoner", reasoner.usage())
+
     async def _work(self):
         try:
+            self._secrets = await self._group_reasoner_factory.get_secrets(self.owner)
+            self._group_reasoner = self._create_group_reasoner()
             async with narrow(self.data_store, self.owner) as data_store:
                 await self._load(data_store)
+                self._ready.set_result(True)
                 await self._loop(data_store)
-        except Exception:
-            # TODO: drain queue and set exception on futures
+        except CancelledError:
+            self._stopped = True
+            if not self._ready.done():
+                self._ready.set_result(False)
+            self._reject_queued(RuntimeError(f"Group reasoner {self.key} cancelled"))
+            if not self._cancelled:
+                raise
+        except Exception as e:
             logger.exception("Error during worker initialization")
-            raise
+            self._fail(e)
+
+    def _fail(self, e: Exception):
+        self._stopped = True
+        self._health.error("init", e)
+        if not self._ready.done():
+            self._ready.set_result(False)
+        self._reject_queued(e)
+
+    def _reject_queued(self, e: Exception):
+        while not self._worker_queue.empty():
+            match self._worker_queue.get_nowait():
+                case Invoke(future=future) if not future.done():
+                    future.set_exception(e)
+        self._queued.clear()
 
     async def _loop(self, data_store: DataStore | None):
-        while True:
-            match await self._worker_queue.get():
-                case Invoke(messages=messages, future=future):
-                    updates = messages[self._group_reasoner.processed :]
-                    message = updates[-1]
-
-                    if message.sender != self.owner:
-                        logger.warning(f"Last message in update batch is not from the owner: {message.sender}")
-
-                    try:
-                        if message.receiver == "system":
-                            response = Response(
-                                decision=Decision.DELEGATE,
-                                query=message.content,
-                                receiver=message.sender,
-                            )
-                        else:
-                            response = await self._group_reasoner.run(updates)
-                    except Exception as e:
-                        future.set_exception(e)
-                    else:
-                        future.set_result(response)
-                        self._save(data_store)  # background
-                case Stop():
-                    await self._save(data_store)
-                    logger.debug(f"Group reasoner {self.key} stopped")
-                    break
+        try:
+            while True:
+                match await self._worker_queue.get():
+                    case Invoke(future=future) if future.cancelled():
+                        pass  # discarded
+                    case Invoke(messages=messages, future=future, created=created, span=parent, recorder=recorder):
+                        self._queued.discard(future)
+                        queue_wait = perf_counter() - created
+                        REASONER_QUEUE_WAIT.observe(queue_wait)
+                        self._running = created
+                        updates = messages[self._group_reasoner.processed :]
+                        message = updates[-1]
+
+                        if message.sender != self.owner:
+                            logger.warning(f"Last message in update batch is not from the owner: {message.sender}")
+
+                        with (
+                            usage.use_recorder(recorder),
+                            tracing.span(
+                                "reasoner.invoke", parent=parent, owner=self.owner, queue_wait=queue_wait
+                            ) as span,
+                        ):
+                            try:
+                                if message.receiver == "system":
+                                    response = Response(
+                                        decision=Decision.DELEGATE,
+                                        query=message.content,
+                                        receiver=message.sender,
+                                    )
+                                    DECISIONS.inc(decision=response.decision.value, source="system")
+                                elif prefiltered := await self._prefilter(updates):
+                                    response = prefiltered
+                                    DECISIONS.inc(decision=response.decision.value, source="prefilter")
+                                else:
+                                    response = await self._reason(updates)
+                                    self._save(data_store)  # background
+                            except CancelledError:
+                                if not future.done():
+                                    future.set_exception(RuntimeError(f"Group reasoner {self.key} cancelled"))
+                                raise
+                            except Exception as e:
+                                span.error = repr(e)
+                                self._health.error("run", e)
+                                if not future.done():
+                                    future.set_exception(e)
+                            else:
+                                span.set_attribute("decision", response.decision.value)
+                                if not future.done():  # cancelled by the caller
+                                    future.set_result(response)
+                            finally:
+                                self._running = None
+                    case Stop():
+                        await self._save(data_store)
+                        logger.debug(f"Group reasoner {self.key} stopped")
+                        break
+        except CancelledError:
+            await self._save(data_store)
+            RUNNERS_CANCELLED.inc(kind="reasoner")
+            logger.warning(f"Group reasoner {self.key} cancelled after shutdown deadline")
+            raise
 
 
 @dataclass
 class Invoke:
     messages: list[Message]
     future: Future[Response] = field(default_factory=Future)
+    created: float = field(default_factory=perf_counter)
+    span: tracing.Span | None = field(default_factory=tracing.current_span)
+    recorder: usage.UsageRecorder | None = field(default_factory=usage.current_recorder)
 
 
 @dataclass
@@ -0,0 +1,293 @@
+import logging
+from asyncio import CancelledError, Future
+from collections import deque
+from dataclasses import dataclass
+from time import monotonic
+
+from group_genie.metrics import SCHEDULER_SLOT_WAIT, THROTTLED
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Token bucket that refills continuously up to its capacity.
+
+    The balance may become negative when more is consumed than available (e.g.
+    when charging model tokens after a run). Consumers are throttled until the
+    balance is refilled.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float):
+        """Initialize a full token bucket.
+
+        Args:
+            capacity: Maximum balance of the bucket.
+            refill_rate: Refill rate in units per second.
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._balance = capacity
+        self._updated = monotonic()
+
+    @property
+    def balance(self) -> float:
+        """Current balance after refill."""
+        now = monotonic()
+        self._balance = min(self.capacity, self._balance + (now - self._updated) * self.refill_rate)
+        self._updated = now
+        return self._balance
+
+    def consume(self, amount: float):
+        """Consume `amount` units, the balance may become negative."""
+        self._balance = self.balance - amount
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until the balance is at least `amount`."""
+        missing = amount - self.balance
+        if missing <= 0:
+            return 0.0
+        return missing / self.refill_rate
+
+
+@dataclass
+class Budget:
+    """Request and token budget, refilled continuously over a period.
+
+    A budget of `requests=20, tokens=100_000, period=3600` allows bursts of up to
+    20 executions and 100k model tokens, and refills at a rate of 20 executions
+    and 100k tokens per hour.
+
+    Attributes:
+        requests: Maximum number of executions per period. None means unlimited.
+        tokens: Maximum number of model tokens (input and output) per period. None
+            means unlimited.
+        period: Refill period in seconds.
+    """
+
+    requests: float | None = None
+    tokens: float | None = None
+    period: float = 60.0
+
+    def _buckets(self) -> tuple[TokenBucket | None, TokenBucket | None]:
+        return (
+            None if self.requests is None else TokenBucket(self.requests, self.requests / self.period),
+            None if self.tokens is None else TokenBucket(self.tokens, self.tokens / self.period),
+        )
+
+
+@dataclass
+class Throttle:
+    """Reason why an execution was throttled.
+
+    Attributes:
+        scope: Budget scope that was exceeded (`owner` or `session`).
+        resource: Budget resource that was exceeded (`requests` or `tokens`).
+        retry_after: Estimated number of seconds until the budget allows a new
+            execution.
+    """
+
+    scope: str
+    resource: str
+    retry_after: float
+
+    @property
+    def message(self) -> str:
+        """User-facing message content for throttled executions."""
+        who = "Your" if self.scope == "owner" else "This group's"
+        return (
+            f"{who} {self.resource} budget is exhausted. Please try again in {max(1, round(self.retry_after))} seconds."
+        )
+
+
+class FairLimiter:
+    """Concurrency limiter that hands out free slots round-robin across owners.
+
+    Unlike a FIFO semaphore, an owner with many waiting executions cannot starve
+    other owners: when a slot is released, it is handed to the next owner in
+    round-robin order, each owner getting one slot per round.
+    """
+
+    def __init__(self, limit: int):
+        """Initialize the limiter.
+
+        Args:
+            limit: Maximum number of concurrently held slots.
+        """
+        self.limit = limit
+        self._active = 0
+        self._waiters: dict[str, deque[Future[None]]] = {}  # insertion order is round-robin order
+
+    @property
+    def active(self) -> int:
+        """Number of currently held slots."""
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        """Number of waiting acquirers."""
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+    async def acquire(self, owner: str):
+        """Wait for a free slot. Must be paired with [`release()`][group_genie.scheduler.FairLimiter.release]."""
+        if self._active < self.limit and not self._waiters:
+            self._active += 1
+            return
+
+        future = Future[None]()
+        self._waiters.setdefault(owner, deque()).append(future)
+
+        try:
+            await future
+        except CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()  # slot was handed over before cancellation
+            else:
+                self._remove(owner, future)
+            raise
+
+    def release(self):
+        """Release a slot, handing it to the next waiting owner (if any)."""
+        while self._waiters:
+            owner = next(iter(self._waiters))
+            waiters = self._waiters.pop(owner)
+            future = waiters.popleft()
+
+            if waiters:
+                self._waiters[owner] = waiters  # move owner to the end of the round
+
+            if not future.done():
+                future.set_result(None)  # hand over slot, active count unchanged
+                return
+
+        self._active -= 1
+
+    def _remove(self, owner: str, future: Future[None]):
+        if waiters := self._waiters.get(owner):
+            if future in waiters:
+                waiters.remove(future)
+            if not waiters:
+                del self._waiters[owner]
+
+
+class Scheduler:
+    """Enforces request and token budgets and shares model concurrency fairly.
+
+    A scheduler sits between [`GroupSession`][group_genie.session.GroupSession]
+    and its runners. It can be shared by several sessions in the same process to
+    enforce process-wide limits.
+
+    - Owner budgets limit the executions and model tokens per user (across all
+      sessions sharing the scheduler).
+    - Session budgets limit the executions and model tokens per group session.
+    - `max_concurrency` limits the number of concurrently running group reasoner
+      and system agent runs. Free slots are handed out round-robin across owners,
+      so that a single heavy user cannot starve others. Subagent runs share the
+      slot of their system agent run. Time spent waiting for approvals is included.
+
+    Executions are admitted when they are delegated to an agent (by the group
+    reasoner, a direct route or a message addressed to `system`) and all applicable
+    budgets have a positive balance. Each admitted execution consumes one request.
+    Messages ignored by the group reasoner are not admitted and consume no requests.
+    Model tokens are charged after each agent or reasoner run, based on the
+    [`Usage`][group_genie.usage.Usage] reported by the run. Throttled executions
+    are answered with a [`Message`][group_genie.message.Message] explaining the
+    reason, without running agents.
+
+    Example:
+        ```python
+        scheduler = Scheduler(
+            owner_budget=Budget(requests=30, tokens=200_000, period=3600),
+            session_budget=Budget(requests=300, period=3600),
+            max_concurrency=8,
+        )
+        session = GroupSession(..., scheduler=scheduler)
+        ```
+    """
+
+    def __init__(
+        self,
+        owner_budget: Budget | None = None,
+        session_budget: Budget | None = None,
+        max_concurrency: int | None = None,
+    ):
+        """Initialize a scheduler.
+
+        Args:
+            owner_budget: Budget applied to each owner. None means unlimited.
+            session_budget: Budget applied to each session. None means unlimited.
+            max_concurrency: Maximum number of concurrent model runs. None means
+                unlimited.
+        """
+        self.owner_budget = owner_budget
+        self.session_budget = session_budget
+        self.max_concurrency = max_concurrency
+
+        self._owner_buckets: dict[str, tuple[TokenBucket | None, TokenBucket | None]] = {}
+        self._session_buckets: dict[str, tuple[TokenBucket | None, TokenBucket | None]] = {}
+        self._limiter = FairLimiter(max_concurrency) if max_concurrency is not None else None
+
+    def admit(self, session_id: str, owner: str) -> Throttle | None:
+        """Admit a delegated execution, consuming one request from the owner and session budgets.
+
+        Args:
+            session_id: ID of the session handling the execution.
+            owner: User ID of the message sender.
+
+        Returns:
+            None if the execution is admitted, the throttle reason otherwise. Nothing
+                is consumed from budgets of throttled executions.
+        """
+        scopes = [
+            ("owner", self._buckets(self._owner_buckets, owner, self.owner_budget)),
+            ("session", self._buckets(self._session_buckets, session_id, self.session_budget)),
+        ]
+
+        for scope, (requests, tokens) in scopes:
+            if requests is not None and requests.balance < 1:
+                return self._throttle(scope, "requests", requests.wait_time(1))
+            if tokens is not None and tokens.balance <= 0:
+                return self._throttle(scope, "tokens", tokens.wait_time(1))
+
+        for _, (requests, _) in scopes:
+            if requests is not None:
+                requests.consume(1)
+
+        return None
+
+    def charge(self, session_id: str, owner: str, tokens: int):
+        """Charge model tokens to the owner and session budgets."""
+        for buckets in [
+            self._buckets(self._owner_buckets, owner, self.owner_budget),
+            self._buckets(self._session_buckets, session_id, self.session_budget),
+        ]:
+            if (bucket := buckets[1]) is not None:
+                bucket.consume(tokens)
+
+    async def acquire(self, owner: str):
+        """Wait for a model concurrency slot. Returns immediately if concurrency is unlimited."""
+        if self._limiter is not None:
+            with SCHEDULER_SLOT_WAIT.time():
+                await self._limiter.acquire(owner)
+
+    def release(self):
+        """Release a model concurrency slot acquired with [`acquire()`][group_genie.scheduler.Scheduler.acquire]."""
+        if self._limiter is not None:
+            self._limiter.release()
+
+    @staticmethod
+    def _buckets(
+        buckets: dict[str, tuple[TokenBucket | None, TokenBucket | None]],
+        key: str,
+        budget: Budget | None,
+    ) -> tuple[TokenBucket | None, TokenBucket | None]:
+        if budget is None:
+            return None, None
+        if key not in buckets:
+            buckets[key] = budget._buckets()
+        return buckets[key]
+
+    @staticmethod
+    def _throttle(scope: str, resource: str, retry_after: float) -> Throttle:
+        logger.debug(f"Execution throttled: {scope} {resource} budget exhausted")
+        THROTTLED.inc(scope=scope, resource=resource)
+        return Throttle(scope=scope, resource=resource, retry_after=retry_after)
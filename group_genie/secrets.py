@@ -1,4 +1,8 @@
 from abc import ABC, abstractmethod
+from asyncio import Task, create_task, shield
+from time import monotonic
+
+from group_genie.utils import arun
 
 
 class SecretsProvider(ABC):
@@ -47,3 +51,106 @@ class SecretsProvider(ABC):
                 has no secrets configured.
         """
         ...
+
+
+class AsyncSecretsProvider(ABC):
+    """Abstract base class for providing user-specific secrets asynchronously.
+
+    Async variant of [`SecretsProvider`][group_genie.secrets.SecretsProvider] for
+    secrets stored in remote services. Can be used wherever a
+    [`SecretsProvider`][group_genie.secrets.SecretsProvider] is accepted.
+
+    Example:
+        ```python
+        class VaultSecretsProvider(AsyncSecretsProvider):
+            async def get_secrets(self, username: str) -> dict[str, str] | None:
+                return await vault_client.read(f"users/{username}")
+        ```
+    """
+
+    @abstractmethod
+    async def get_secrets(self, username: str) -> dict[str, str] | None:
+        """Retrieve secrets for a specific user.
+
+        Args:
+            username: User ID to fetch secrets for.
+
+        Returns:
+            Dictionary mapping credential names to values, or None if the user
+                has no secrets configured.
+        """
+        ...
+
+
+class CachingSecretsProvider(AsyncSecretsProvider):
+    """Caches the secrets of another provider for a configurable time-to-live.
+
+    Wraps a [`SecretsProvider`][group_genie.secrets.SecretsProvider] or an
+    [`AsyncSecretsProvider`][group_genie.secrets.AsyncSecretsProvider]. Synchronous
+    providers are called on a thread pool so that they don't block the event loop.
+    Concurrent lookups for the same user share a single call to the wrapped provider.
+
+    Example:
+        ```python
+        secrets_provider = CachingSecretsProvider(DatabaseSecretsProvider(), ttl=300)
+        ```
+    """
+
+    def __init__(self, provider: SecretsProvider | AsyncSecretsProvider, ttl: float = 300):
+        """Initialize the caching provider.
+
+        Args:
+            provider: The provider to cache secrets from.
+            ttl: Time-to-live of cached secrets in seconds.
+        """
+        self._provider = provider
+        self._ttl = ttl
+        self._cache: dict[str, tuple[float, dict[str, str] | None]] = {}
+        self._pending: dict[str, Task[dict[str, str] | None]] = {}
+
+    async def get_secrets(self, username: str) -> dict[str, str] | None:
+        if entry := self._cache.get(username):
+            expires, secrets = entry
+            if expires > monotonic():
+                return secrets
+            self._cache.pop(username)
+
+        if (task := self._pending.get(username)) is None:
+            task = create_task(self._fetch(username))
+            self._pending[username] = task
+
+        return await shield(task)
+
+    def invalidate(self, username: str | None = None):
+        """Remove cached secrets of a user, or of all users if username is None."""
+        if username is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(username, None)
+
+    async def _fetch(self, username: str) -> dict[str, str] | None:
+        try:
+            secrets = await load_secrets(self._provider, username)
+        finally:
+            self._pending.pop(username, None)
+
+        self._cache[username] = (monotonic() + self._ttl, secrets)
+        return secrets
+
+
+async def load_secrets(provider: SecretsProvider | AsyncSecretsProvider | None, username: str) -> dict[str, str]:
+    """Retrieve secrets from a sync or async provider without blocking the event loop.
+
+    Args:
+        provider: The secrets provider, or None.
+        username: User ID to fetch secrets for.
+
+    Returns:
+        The user's secrets, or an empty dictionary if there is no provider or the
+            user has no secrets configured.
+    """
+    if provider is None:
+        return {}
+    if isinstance(provider, AsyncSecretsProvider):
+        return await provider.get_secrets(username) or {}
+    return await arun(provider.get_secrets, username) or {}
@@ -1,18 +1,30 @@
 import logging
-from asyncio import Future, Queue, create_task
+import re
+from asyncio import CancelledError, Future, Queue, Task, create_task, gather
 from dataclasses import asdict, dataclass, field
+from functools import partial
+from pathlib import Path
+from time import perf_counter
 from typing import AsyncIterator, Callable
 
-from group_sense import Decision
+from group_sense import Decision, Response
 
-from group_genie.agent import AgentFactory, Approval, ApprovalContext
+from group_genie import tracing
+from group_genie.admission import Admission, Overload, OverloadPolicy
+from group_genie.agent import AgentFactory, Approval, ApprovalContext, ApprovalPolicy
 from group_genie.agent.base import AgentInput
 from group_genie.agent.runner import AgentRunner
 from group_genie.datastore import DataStore, narrow
+from group_genie.footprint import SessionFootprint, sizeof
 from group_genie.message import Attachment, Message
+from group_genie.metrics import ADMISSION_WAIT, DECISIONS, OVERLOAD, PREFERENCES_FETCH_DURATION, SESSION_QUEUE_WAIT
 from group_genie.preferences import PreferencesSource
+from group_genie.profiling import ExecutionProfiler, Profile
 from group_genie.reasoner import GroupReasonerFactory
 from group_genie.reasoner.runner import GroupReasonerRunner
+from group_genie.scheduler import Scheduler, Throttle
+from group_genie.stats import Health, SessionStats
+from group_genie.usage import Usage, UsageRecorder, use_recorder
 
 logger = logging.getLogger(__name__)
 
@@ -27,8 +39,10 @@ class GroupSession:
 
     Messages are stored internally in the order of
     [`handle()`][group_genie.session.GroupSession.handle] calls and processed
-    concurrently for different senders. Messages from the same sender are always
-    processed sequentially.
+    concurrently for different senders. Messages from the same sender are
+    processed sequentially, unless the system agent is configured with
+    [`max_forks`][group_genie.agent.base.AgentInfo] to run delegations of the same
+    sender in parallel.
 
     Persisted session state (messages and agent/reasoner state) is automatically
     loaded during initialization if a [`DataStore`][group_genie.datastore.DataStore]
@@ -71,6 +85,12 @@ class GroupSession:
         agent_factory: AgentFactory,
         data_store: DataStore | None = None,
         preferences_source: PreferencesSource | None = None,
+        direct_routing: bool = False,
+        prewarm_recent: int = 0,
+        scheduler: Scheduler | None = None,
+        approval_policy: ApprovalPolicy | None = None,
+        profiler: ExecutionProfiler | None = None,
+        admission: Admission | None = None,
     ):
         """Initialize a new group chat session.
 
@@ -86,18 +106,52 @@ class GroupSession:
                 saved after each message. Experimental feature not suitable for production.
             preferences_source: Optional source for user-specific preferences that are
                 included in agent prompts.
+            direct_routing: If True, messages addressed to a registered subagent, either
+                with `receiver` set to the subagent name or with content starting with
+                `@<subagent name>`, bypass the group reasoner and the system agent and
+                are processed directly by a subagent instance of the sender.
+            prewarm_recent: Number of most recent distinct senders in the loaded message
+                history whose runners are prewarmed (see
+                [`prewarm()`][group_genie.session.GroupSession.prewarm]) when the session
+                is rehydrated from the [`DataStore`][group_genie.datastore.DataStore].
+            scheduler: Optional [`Scheduler`][group_genie.scheduler.Scheduler] that
+                enforces per-owner and per-session budgets and limits model concurrency.
+                Can be shared by several sessions.
+            approval_policy: Optional
+                [`ApprovalPolicy`][group_genie.agent.approval.ApprovalPolicy] that
+                decides tool call approvals by rules and remembered decisions before
+                [`Approval`][group_genie.agent.approval.Approval]s are emitted, and
+                applies a timeout to emitted approvals.
+            profiler: Optional
+                [`ExecutionProfiler`][group_genie.profiling.ExecutionProfiler] that
+                samples the process while executions are in flight and writes
+                profiles of slow executions. Can be shared by several sessions.
+            admission: Optional [`Admission`][group_genie.admission.Admission] limits
+                on pending and in-flight executions, and the policy for handling
+                messages that exceed them.
         """
         self.id = id
         self.group_reasoner_factory = group_reasoner_factory
         self.agent_factory = agent_factory
         self.data_store = data_store
         self.preferences_source = preferences_source
+        self.direct_routing = direct_routing
+        self.prewarm_recent = prewarm_recent
+        self.scheduler = scheduler
+        self.approval_policy = approval_policy
+        self.profiler = profiler
+        self.admission = admission
 
         self._group_reasoner_runners: dict[str, GroupReasonerRunner] = {}
         self._system_agent_runners: dict[str, AgentRunner] = {}
         self._messages: list[Message] = []
+        self._usage: dict[str, Usage] = {}
+        self._health = Health()
+        self._prewarm_tasks: set[Task[bool]] = set()
+        self._executions: list[tuple[str, Execution]] = []  # admitted executions by owner, oldest first
+        self._admission_waiters: list[Future[None]] = []
 
-        self._worker_queue: Queue[Invoke | RequestIds | Stop] = Queue()
+        self._worker_queue: Queue[Invoke | Prewarm | RequestIds | Stats | Footprint | Stop] = Queue()
         self._worker_task = create_task(self._work())
         self._stopped = False
 
@@ -105,15 +159,25 @@ class GroupSession:
     def stopped(self) -> bool:
         return self._stopped
 
-    def stop(self):
+    def stop(self, timeout: float | None = None):
         """Request graceful shutdown of the session.
 
         Allows currently processing messages to complete before stopping all group
-        reasoners and agents. Call join() after stop() to wait for shutdown completion.
+        reasoners and agents. Runners are stopped concurrently. Call join() after
+        stop() to wait for shutdown completion.
+
+        Args:
+            timeout: Shutdown deadline in seconds. Runners that have not stopped
+                within the deadline are cancelled: their in-flight and queued
+                invokes fail (executions emit an error message or
+                [`Decision.IGNORE`][group_genie.agent.Decision]) and their state is
+                saved before they stop. None means waiting until all processing
+                messages completed.
         """
         if not self.stopped:
             self._stopped = True
-            self._worker_queue.put_nowait(Stop())
+            self._worker_queue.put_nowait(Stop(deadline=None if timeout is None else perf_counter() + timeout))
+            self._admission_changed()
 
     async def join(self):
         """Wait for the session to complete shutdown.
@@ -123,21 +187,18 @@ class GroupSession:
         """
         await self._worker_task
 
-    def _stop_group_reasoners(self):
-        for runner in self._group_reasoner_runners.values():
-            runner.stop()
-
-    async def _join_group_reasoners(self):
-        for runner in self._group_reasoner_runners.values():
-            await runner.join()
-
-    def _stop_system_agents(self):
-        for runner in self._system_agent_runners.values():
-            runner.stop()
-
-    async def _join_system_agents(self):
-        for runner in self._system_agent_runners.values():
-            await runner.join()
+    def _stop_runners(self):
+        for reasoner_runner in self._group_reasoner_runners.values():
+            reasoner_runner.stop()
+        for agent_runner in self._system_agent_runners.values():
+            agent_runner.stop()
+
+    async def _join_runners(self, deadline: float | None):
+        timeout = None if deadline is None else max(0.0, deadline - perf_counter())
+        await gather(
+            *[runner.join(timeout) for runner in self._group_reasoner_runners.values()],
+            *[runner.join(timeout) for runner in self._system_agent_runners.values()],
+        )
 
     def request_ids(self) -> Future[set[str]]:
         """Retrieve all request IDs from messages in this session.
@@ -151,6 +212,89 @@ class GroupSession:
         self._worker_queue.put_nowait(_request_ids)
         return _request_ids.future
 
+    async def stats(self) -> SessionStats:
+        """Report the health and load of this session and its runners.
+
+        Served by the session worker after all previously handled messages have
+        been added to the session. Cheap enough to be polled regularly, e.g. by a
+        dashboard that aggregates the stats of many sessions with
+        [`StatsSummary.of()`][group_genie.stats.StatsSummary.of]. Stats of a stopped
+        session are reported directly.
+
+        Returns:
+            The [`SessionStats`][group_genie.stats.SessionStats] of this session.
+        """
+        if self._stopped:
+            return self._stats()
+
+        _stats = Stats()
+        self._worker_queue.put_nowait(_stats)
+        return await _stats.future
+
+    def footprint(self) -> Future[SessionFootprint]:
+        """Measure the approximate memory footprint of this session.
+
+        Sizes are measured on the session messages and on the serialized state of
+        group reasoners and agents, they approximate the memory held by messages and
+        conversation histories. Useful for setting eviction budgets (e.g. idle
+        timeouts and [`HistoryPolicy`][group_genie.agent.HistoryPolicy] limits) and
+        for detecting leaks. Measurement serializes the state of all runners and
+        should not be done on every message.
+
+        Returns:
+            A Future that resolves to the
+                [`SessionFootprint`][group_genie.footprint.SessionFootprint], measured
+                after all previously handled messages have been added to the session.
+        """
+        _footprint = Footprint()
+        self._worker_queue.put_nowait(_footprint)
+        return _footprint.future
+
+    def usage(self, owner: str | None = None) -> Usage:
+        """Return the accumulated model usage of this session.
+
+        Usage is accumulated in memory since session creation and includes group
+        reasoner, system agent and subagent runs.
+
+        Args:
+            owner: If provided, return only the usage of executions triggered by
+                messages from this user. Otherwise, return the total usage.
+        """
+        if owner is not None:
+            return self._usage.get(owner, Usage())
+        return sum(self._usage.values(), Usage())
+
+    def usage_by_owner(self) -> dict[str, Usage]:
+        """Return the accumulated model usage of this session by user ID."""
+        return self._usage.copy()
+
+    def _record_usage(self, owner: str, key: str, usage: Usage):
+        self._usage[owner] = self._usage.get(owner, Usage()) + usage
+        if self.scheduler is not None:
+            self.scheduler.charge(self.id, owner, usage.total_tokens)
+
+    def prewarm(self, owner: str) -> Future[bool]:
+        """Create and initialize the runners of a user ahead of their first message.
+
+        Creates the user's group reasoner and system agent runners, which loads their
+        persisted state, fetches secrets and starts MCP servers. Applications can call
+        this method when they expect a message from the user soon (e.g. when the user
+        opens the chat or starts typing), so that the first reply has the same latency
+        as later replies. Prewarmed runners are stopped after their idle timeout if no
+        message arrives. Calling this method for a user with running runners only resets
+        their idle timers.
+
+        Args:
+            owner: User ID of the runner owner.
+
+        Returns:
+            A Future that resolves to True when both runners are ready, or to False if
+                the initialization of a runner failed.
+        """
+        _prewarm = Prewarm(owner=owner)
+        self._worker_queue.put_nowait(_prewarm)
+        return _prewarm.future
+
     def handle(self, message: Message) -> "Execution":
         """Process an incoming group chat message.
 
@@ -164,6 +308,13 @@ class GroupSession:
         different senders, messages are processed concurrently. For the same sender,
         messages are processed sequentially to maintain conversation coherence.
 
+        If the session has [`Admission`][group_genie.admission.Admission] limits and
+        the message exceeds them, it is handled according to the
+        [`OverloadPolicy`][group_genie.admission.OverloadPolicy]. Rejected messages
+        are not added to the session, their execution emits
+        [`Decision.DELEGATE`][group_genie.agent.Decision] and a system
+        [`Message`][group_genie.message.Message] explaining the overload.
+
         Args:
             message: The message to process.
 
@@ -171,11 +322,92 @@ class GroupSession:
             An [`Execution`][group_genie.session.Execution] object that provides
                 access to the processing stream and final result.
         """
-        execution = Execution(preferences_source=self.preferences_source)
+        span = tracing.start_span(
+            "session.handle",
+            parent=tracing.current_span(),
+            session=self.id,
+            sender=message.sender,
+        )
+        execution = Execution(
+            preferences_source=self.preferences_source,
+            span=span,
+            recorder=partial(self._record_usage, message.sender),
+            profile=self.profiler.begin(message.request_id or span.trace_id) if self.profiler else None,
+            on_change=self._admission_changed,
+        )
+
+        if self.admission is not None:
+            if (overload := self._admit(message.sender)) is not None:
+                execution._reject(message, overload)
+                return execution
+            self._executions.append((message.sender, execution))
+
         invoke = Invoke(message=message, execution=execution)
         self._worker_queue.put_nowait(invoke)
         return execution
 
+    async def submit(self, message: Message) -> "Execution":
+        """Process an incoming group chat message, waiting for admission if needed.
+
+        Like [`handle()`][group_genie.session.GroupSession.handle] but, if the
+        session's [`Admission`][group_genie.admission.Admission] policy is
+        [`BACKPRESSURE`][group_genie.admission.OverloadPolicy.BACKPRESSURE], waits
+        until the message can be admitted. Applications can bound the wait with
+        `asyncio.timeout()`. With other policies, returns immediately.
+
+        Args:
+            message: The message to process.
+
+        Returns:
+            An [`Execution`][group_genie.session.Execution] object that provides
+                access to the processing stream and final result.
+        """
+        if self.admission is not None and self.admission.policy == OverloadPolicy.BACKPRESSURE:
+            start = perf_counter()
+            while not self._stopped and self._overload(message.sender) is not None:
+                waiter = Future[None]()
+                self._admission_waiters.append(waiter)
+                await waiter
+            ADMISSION_WAIT.observe(perf_counter() - start)
+
+        return self.handle(message)
+
+    def _admit(self, owner: str) -> Overload | None:
+        overload = self._overload(owner)
+
+        while overload is not None and self.admission.policy == OverloadPolicy.DROP_OLDEST:  # type: ignore
+            if not self._drop_oldest(owner):
+                break
+            OVERLOAD.inc(scope=overload.scope, outcome="dropped")
+            overload = self._overload(owner)
+
+        if overload is not None:
+            logger.debug(f"Message from {owner} rejected: {overload.scope} admission limit {overload.limit} exceeded")
+            OVERLOAD.inc(scope=overload.scope, outcome="rejected")
+
+        return overload
+
+    def _overload(self, owner: str) -> Overload | None:
+        if self.admission is None:
+            return None
+
+        self._executions = [(o, e) for o, e in self._executions if e._active]
+        pending = sum(1 for _, e in self._executions if e._pending)
+        in_flight = sum(1 for o, _ in self._executions if o == owner)
+        return self.admission.check(pending=pending, in_flight=in_flight)
+
+    def _drop_oldest(self, owner: str) -> bool:
+        for o, execution in self._executions:
+            if o == owner and execution._drop():
+                return True
+        return False
+
+    def _admission_changed(self):
+        waiters, self._admission_waiters = self._admission_waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
     def _save(self, data_store: DataStore | None) -> Future[None]:
         if data_store is None:
             future = Future[None]()
@@ -183,7 +415,7 @@ class GroupSession:
             return future
 
         data = {"messages": [asdict(message) for message in self._messages]}
-        return data_store.save("session", data)
+        return self._health.track(data_store.save("session", data))
 
     @staticmethod
     async def load_messages(data_store: DataStore) -> list[Message] | None:
@@ -214,12 +446,76 @@ class GroupSession:
         if messages := await self.load_messages(data_store):
             self._messages = messages
 
+    def _recent_senders(self, n: int) -> list[str]:
+        senders: list[str] = []
+        for message in reversed(self._messages):
+            if len(senders) == n:
+                break
+            if message.sender != "system" and message.sender not in senders:
+                senders.append(message.sender)
+        return senders
+
+    async def _prewarm(self, owner: str, data_store: DataStore | None, future: Future[bool] | None = None):
+        reasoner_runner = await self._get_group_reasoner_runner(owner=owner, session_store=data_store)
+        agent_runner = await self._get_system_agent_runner(owner=owner, session_store=data_store)
+
+        reasoner_runner.reset_idle_timer()
+        agent_runner.reset_idle_timer()
+
+        if future is None:
+            return  # nobody waits for readiness
+
+        async def ready() -> bool:
+            results = await gather(reasoner_runner.ready(), agent_runner.ready())
+            return all(results)
+
+        task = create_task(ready())
+        task.add_done_callback(self._prewarm_tasks.discard)
+        task.add_done_callback(partial(self._prewarmed, future=future))
+        self._prewarm_tasks.add(task)
+
+    def _stats(self) -> SessionStats:
+        return SessionStats(
+            id=self.id,
+            stopped=self._stopped,
+            messages=len(self._messages),
+            queued=self._worker_queue.qsize(),
+            pending_saves=self._health.pending_saves,
+            last_error=self._health.last_error,
+            reasoners=[runner.stats() for runner in self._group_reasoner_runners.values()],
+            agents=[runner.stats() for runner in self._system_agent_runners.values()],
+        )
+
+    def _footprint(self) -> SessionFootprint:
+        return SessionFootprint(
+            id=self.id,
+            messages=len(self._messages),
+            message_bytes=sizeof(self._messages),
+            reasoners=[runner.footprint() for runner in self._group_reasoner_runners.values()],
+            agents=[runner.footprint() for runner in self._system_agent_runners.values()],
+        )
+
     def _update(self, message: Message, data_store: DataStore | None):
         self._messages.append(message)
 
         if data_store is not None:
             self._save(data_store)  # background (preserves order)
 
+    def _route(self, message: Message) -> "Route | None":
+        if not self.direct_routing:
+            return None
+
+        names = [info.name for info in self.agent_factory.agent_infos(exclude="system")]
+
+        if message.receiver in names:
+            return Route(subagent_name=message.receiver, query=message.content)  # type: ignore
+
+        if match := re.match(r"\s*@([\w\-]+)(?![\w\-])(.*)", message.content, re.DOTALL):
+            if match.group(1) in names:
+                return Route(subagent_name=match.group(1), query=match.group(2).strip())
+
+        return None
+
     async def _get_group_reasoner_runner(
         self,
         owner: str,
@@ -264,6 +560,11 @@ class GroupSession:
 
         return self._system_agent_runners[owner]
 
+    @staticmethod
+    def _prewarmed(task: Task[bool], future: Future[bool]):
+        if not future.done():
+            future.set_result(task.result())
+
     async def get_group_chat_messages(self) -> str:
         """Returns the group chat messages as a JSON string."""
         from group_sense.reasoner.prompt import format_update_messages
@@ -277,12 +578,19 @@ class GroupSession:
         async with narrow(self.data_store, self.id) as data_store:
             # TODO: handle load errors
             await self._load(data_store)
+
+            for owner in self._recent_senders(self.prewarm_recent):
+                await self._prewarm(owner, data_store)
+
             await self._loop(data_store)
 
     async def _loop(self, data_store: DataStore | None):
         while True:
             match await self._worker_queue.get():
-                case Invoke(message=message, execution=execution):
+                case Invoke(message=message, execution=execution, created=created):
+                    queue_wait = perf_counter() - created
+                    SESSION_QUEUE_WAIT.observe(queue_wait)
+                    execution.span.set_attribute("queue_wait", queue_wait)
                     # store request message in group session
                     self._update(message, data_store=data_store)
                     # snapshot messages for asynchronous processing
@@ -302,21 +610,29 @@ class GroupSession:
                         self._update(message, data_store=data_store)
 
                     exchange = Exchange(
+                        session_id=self.id,
                         group_reasoner_runner=reasoner_runner,
                         system_agent_runner=agent_runner,
                         messages=messages_snapshot,
                         callback=callback,
+                        route=self._route(message),
+                        scheduler=self.scheduler,
+                        approval_policy=self.approval_policy,
                     )
                     execution._unblock(exchange)
+                case Prewarm(owner=owner, future=future):
+                    await self._prewarm(owner, data_store, future)
                 case RequestIds(future=future):
                     request_ids = {message.request_id for message in self._messages if message.request_id}
                     future.set_result(request_ids)
-                case Stop():
+                case Stats(future=future):
+                    future.set_result(self._stats())
+                case Footprint(future=future):
+                    future.set_result(self._footprint())
+                case Stop(deadline=deadline):
                     await self._save(data_store)
-                    self._stop_group_reasoners()
-                    self._stop_system_agents()
-                    await self._join_group_reasoners()
-                    await self._join_system_agents()
+                    self._stop_runners()
+                    await self._join_runners(deadline)
                     logger.debug(f"Group session {self.id} stopped")
                     break
 
@@ -364,10 +680,54 @@ class Execution:
         ```
     """
 
-    def __init__(self, preferences_source: PreferencesSource | None = None):
+    def __init__(
+        self,
+        preferences_source: PreferencesSource | None = None,
+        span: tracing.Span | None = None,
+        recorder: UsageRecorder | None = None,
+        profile: Profile | None = None,
+        on_change: Callable[[], None] | None = None,
+    ):
         self._preferences_source = preferences_source
         self._result: Message | None = None
         self._exchange: Future[Exchange] = Future()
+        self._span = span or tracing.start_span("execution")
+        self._recorder = recorder
+        self._usage: dict[str, Usage] = {}
+        self._profile = profile
+        self._profile_path: Path | None = None
+        self._on_change = on_change
+        self._rejection: Message | None = None
+        self._discard: Callable[[], bool] | None = None  # discards queued reasoning
+        self._dropped = False
+        self._decided = False
+        self._ended = False
+
+    @property
+    def span(self) -> tracing.Span:
+        """Root [`Span`][group_genie.tracing.Span] of this execution's trace."""
+        return self._span
+
+    @property
+    def profile(self) -> Path | None:
+        """Path of the profile of this execution, if it was profiled as slow execution by the
+        session's [`ExecutionProfiler`][group_genie.profiling.ExecutionProfiler]."""
+        return self._profile_path
+
+    @property
+    def usage(self) -> Usage:
+        """Total model usage of this execution (group reasoner, system agent and subagents)."""
+        return sum(self._usage.values(), Usage())
+
+    @property
+    def usage_details(self) -> dict[str, Usage]:
+        """Model usage of this execution by runner key (`reasoner`, `system` or subagent key)."""
+        return self._usage.copy()
+
+    def _record_usage(self, key: str, usage: Usage):
+        self._usage[key] = self._usage.get(key, Usage()) + usage
+        if self._recorder is not None:
+            self._recorder(key, usage)
 
     async def result(self) -> Message | None:
         """Retrieve the final message result, automatically approving all tool calls.
@@ -427,81 +787,260 @@ class Execution:
             yield self._result
             return
 
-        exchange = await self._exchange
-
-        queue: Queue[Decision | Approval | Future[str]] = Queue()
-        context = ApprovalContext(queue=queue)  # type: ignore
+        prefetch: Task[str | None] | None = None
+        error: BaseException | None = None
 
         try:
-            response = await exchange.group_reasoner_runner.invoke(exchange.messages)
-        except Exception:
-            logger.exception("Reasoner error")
-            queue.put_nowait(Decision.IGNORE)
-        else:
-            queue.put_nowait(response.decision)
-
-            if response.decision == Decision.DELEGATE:
-                query = response.query or ""
-                logger.debug(f"Delegate query: {query}")
-
-                attachments: list[Attachment] = []
+            if self._rejection is not None:
+                self._end()
+                self._result = self._rejection
+                yield Decision.DELEGATE
+                yield self._result
+                return
+
+            exchange = await self._exchange
+
+            if self._dropped:
+                self._span.set_attribute("decision", Decision.IGNORE.value)
+                self._end()
+                yield Decision.IGNORE
+                return
+
+            queue: Queue[Decision | Approval | Future[str] | Message] = Queue()
+            context = ApprovalContext(
+                queue=queue,  # type: ignore
+                owner=exchange.message.sender,
+                policy=exchange.approval_policy,
+            )
 
-                for message in exchange.messages:
-                    attachments.extend(message.attachments)
-                logger.debug(f"Delegate attachments: {[attachment.name for attachment in attachments]}")
+            # child spans of runners and preference fetches are created in the execution span
+            with tracing.use_span(self._span), use_recorder(self._record_usage):
+                # speculatively fetch preferences of the most likely receiver concurrently with reasoning
+                prefetch = self._prefetch_preferences(exchange.message.sender)
 
-                if response.receiver is None:
-                    preferences = None
+                try:
+                    if exchange.route is not None:
+                        response = Response(
+                            decision=Decision.DELEGATE,
+                            query=exchange.route.query,
+                            receiver=exchange.message.sender,
+                        )
+                        DECISIONS.inc(decision=response.decision.value, source="route")
+                    else:
+                        await exchange.acquire()
+                        try:
+                            response = await self._reason(exchange)
+                        finally:
+                            exchange.release()
+                except Exception:
+                    logger.exception("Reasoner error")
+                    DECISIONS.inc(decision=Decision.IGNORE.value, source="error")
+                    queue.put_nowait(Decision.IGNORE)
+                    self._cancel_prefetch(prefetch)
+                    self._decide()
                 else:
-                    preferences = await self._preferences(response.receiver)
-
-                agent_input = AgentInput(
-                    query=query,
-                    attachments=attachments,
-                    preferences=preferences,
-                )
-
-                def callback(response: Future[str]):
-                    queue.put_nowait(response)
-
-                future = exchange.system_agent_runner.invoke(agent_input, context)
-                future.add_done_callback(callback)
-
-        while elem := await queue.get():
-            match elem:
-                case Decision.IGNORE:
-                    yield elem
-                    break
-                case Decision():
-                    yield elem
-                case Approval():
-                    yield elem
-                case Future():
-                    try:
-                        message = Message(
-                            content=elem.result(),
-                            sender="system",
-                            receiver=response.receiver,
-                            request_id=exchange.message.request_id,
+                    # only delegated executions consume scheduler budgets
+                    throttle = exchange.admit() if response.decision == Decision.DELEGATE else None
+                    queue.put_nowait(response.decision)
+                    self._decide()
+
+                    if throttle is not None:
+                        self._span.set_attribute("throttled", True)
+                        self._cancel_prefetch(prefetch)
+                        queue.put_nowait(
+                            Message(
+                                content=throttle.message,
+                                sender="system",
+                                receiver=exchange.message.sender,
+                                request_id=exchange.message.request_id,
+                            )
                         )
-                    except Exception as e:
-                        logger.exception("System agent error")
-                        message = Message(
-                            content=f"System agent error: {e}",
-                            sender="system",
-                            receiver=exchange.message.sender,
-                            request_id=exchange.message.request_id,
+                    elif response.decision == Decision.DELEGATE:
+                        query = response.query or ""
+                        logger.debug(f"Delegate query: {query}")
+
+                        attachments: list[Attachment] = []
+
+                        if exchange.route is not None:
+                            attachments.extend(exchange.message.attachments)
+                        else:
+                            for message in exchange.messages:
+                                attachments.extend(message.attachments)
+                        logger.debug(f"Delegate attachments: {[attachment.name for attachment in attachments]}")
+
+                        if response.receiver is None:
+                            preferences = None
+                            self._cancel_prefetch(prefetch)
+                        elif response.receiver == exchange.message.sender and prefetch is not None:
+                            preferences = await prefetch
+                        else:
+                            preferences = await self._preferences(response.receiver)
+                            self._cancel_prefetch(prefetch)
+
+                        agent_input = AgentInput(
+                            query=query,
+                            attachments=attachments,
+                            preferences=preferences,
                         )
 
-                    self._result = message
-                    exchange.callback(message)
-                    yield message
-                    break
+                        def callback(response: Future[str]):
+                            queue.put_nowait(response)
+
+                        if exchange.route is not None:
+                            logger.debug(f"Route query to subagent: {exchange.route.subagent_name}")
+                            runner = await exchange.system_agent_runner.get_subagent_runner(
+                                subagent_name=exchange.route.subagent_name,
+                                subagent_instance="direct",
+                            )
+                        else:
+                            runner = exchange.system_agent_runner
+
+                        await exchange.acquire()
+                        try:
+                            future = runner.invoke(agent_input, context)
+                        except Exception:
+                            exchange.release()
+                            raise
+                        future.add_done_callback(exchange.release)
+                        future.add_done_callback(callback)
+                    else:
+                        self._cancel_prefetch(prefetch)
+
+            while elem := await queue.get():
+                match elem:
+                    case Decision.IGNORE:
+                        self._span.set_attribute("decision", Decision.IGNORE.value)
+                        self._end()
+                        yield elem
+                        break
+                    case Decision():
+                        self._span.set_attribute("decision", elem.value)
+                        yield elem
+                    case Approval():
+                        yield elem
+                    case Message():
+                        self._end()
+                        self._result = elem
+                        exchange.callback(elem)
+                        yield elem
+                        break
+                    case Future():
+                        try:
+                            message = Message(
+                                content=elem.result(),
+                                sender="system",
+                                receiver=response.receiver,
+                                request_id=exchange.message.request_id,
+                            )
+                        except Exception as e:
+                            logger.exception("System agent error")
+                            message = Message(
+                                content=f"System agent error: {e}",
+                                sender="system",
+                                receiver=exchange.message.sender,
+                                request_id=exchange.message.request_id,
+                            )
+                            self._end(error=e)
+                        else:
+                            self._end()
+
+                        self._result = message
+                        exchange.callback(message)
+                        yield message
+                        break
+        except (Exception, CancelledError) as e:
+            error = e
+            raise
+        finally:
+            # ends executions of failed, cancelled or abandoned streams
+            self._cancel_prefetch(prefetch)
+            self._end(error=error)
+
+    async def _reason(self, exchange: "Exchange") -> Response:
+        if not self._dropped:
+            future = exchange.group_reasoner_runner.invoke(exchange.messages)
+            self._discard = partial(exchange.group_reasoner_runner.discard, future)
+            try:
+                return await future
+            except CancelledError:
+                if not self._dropped:
+                    raise
+            finally:
+                self._discard = None
+
+        DECISIONS.inc(decision=Decision.IGNORE.value, source="overload")
+        return Response(decision=Decision.IGNORE)
 
     async def _preferences(self, receiver: str) -> str | None:
         if self._preferences_source is None:
             return None
-        return await self._preferences_source.get_preferences(receiver)
+        with tracing.span("preferences", receiver=receiver):
+            start = perf_counter()
+            preferences = await self._preferences_source.get_preferences(receiver)
+            PREFERENCES_FETCH_DURATION.observe(perf_counter() - start)  # not recorded for cancelled prefetches
+            return preferences
+
+    def _prefetch_preferences(self, receiver: str) -> "Task[str | None] | None":
+        if self._preferences_source is None:
+            return None
+        return create_task(self._preferences(receiver))
+
+    def _cancel_prefetch(self, prefetch: "Task[str | None] | None"):
+        if prefetch is not None:
+            prefetch.cancel()
+            prefetch.add_done_callback(self._discard_prefetch)
+
+    @staticmethod
+    def _discard_prefetch(prefetch: "Task[str | None]"):
+        # retrieve errors of unused prefetches (that may have failed before cancellation)
+        if not prefetch.cancelled() and (e := prefetch.exception()) is not None:
+            logger.debug(f"Discarded failed preferences prefetch: {e!r}")
+
+    @property
+    def _active(self) -> bool:
+        return not (self._ended or self._dropped)
+
+    @property
+    def _pending(self) -> bool:
+        return not self._decided
+
+    def _reject(self, message: Message, overload: Overload):
+        self._rejection = Message(
+            content=overload.message,
+            sender="system",
+            receiver=message.sender,
+            request_id=message.request_id,
+        )
+        self._span.set_attribute("overload", overload.scope)
+
+    def _drop(self) -> bool:
+        if self._decided or self._dropped:
+            return False
+        if self._discard is not None and not self._discard():
+            return False  # reasoning already running
+        self._dropped = True
+        self._span.set_attribute("dropped", True)
+        return True
+
+    def _decide(self):
+        if not self._decided:
+            self._decided = True
+            if self._on_change is not None:
+                self._on_change()
+
+    def _end(self, error: BaseException | None = None):
+        if self._ended:
+            return
+        self._ended = True
+        self._decide()
+        if self._profile is not None:
+            self._profile_path = self._profile.end()
+            self._profile = None
+            if self._profile_path is not None:
+                self._span.set_attribute("profile", str(self._profile_path))
+        self._span.end(error=error)
+        if self._on_change is not None:
+            self._on_change()
 
     def _unblock(self, exchange: "Exchange"):
         self._exchange.set_result(exchange)
@@ -509,20 +1048,50 @@ class Execution:
 
 @dataclass
 class Exchange:
+    session_id: str
     group_reasoner_runner: GroupReasonerRunner
     system_agent_runner: AgentRunner
     messages: list[Message]
     callback: Callable[[Message], None]
+    route: "Route | None" = None
+    scheduler: Scheduler | None = None
+    approval_policy: ApprovalPolicy | None = None
 
     @property
     def message(self):
         return self.messages[-1]
 
+    def admit(self) -> Throttle | None:
+        if self.scheduler is not None:
+            return self.scheduler.admit(self.session_id, self.message.sender)
+        return None
+
+    async def acquire(self):
+        if self.scheduler is not None:
+            await self.scheduler.acquire(self.message.sender)
+
+    def release(self, *args):
+        if self.scheduler is not None:
+            self.scheduler.release()
+
+
+@dataclass
+class Route:
+    subagent_name: str
+    query: str
+
 
 @dataclass
 class Invoke:
     message: Message
     execution: Execution
+    created: float = field(default_factory=perf_counter)
+
+
+@dataclass
+class Prewarm:
+    owner: str
+    future: Future[bool] = field(default_factory=Future)
 
 
 @dataclass
@@ -530,6 +1099,16 @@ class RequestIds:
     future: Future[set[str]] = field(default_factory=Future)
 
 
+@dataclass
+class Stats:
+    future: Future[SessionStats] = field(default_factory=Future)
+
+
+@dataclass
+class Footprint:
+    future: Future[SessionFootprint] = field(default_factory=Future)
+
+
 @dataclass
 class Stop:
-    pass
+    deadline: float | None = None  # perf_counter() deadline
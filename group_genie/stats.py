@@ -0,0 +1,194 @@
+from asyncio import Future
+from dataclasses import dataclass, field
+from time import time
+from typing import Iterable
+
+
+@dataclass
+class ErrorInfo:
+    """Most recent error of a session or runner.
+
+    Attributes:
+        source: Where the error occurred (`init`, `run`, `fork`, `merge`, `timeout`
+            or `save`).
+        error: Representation of the exception.
+        time: Unix timestamp of the error.
+    """
+
+    source: str
+    error: str
+    time: float = field(default_factory=time)
+
+
+@dataclass
+class RunnerStats:
+    """State of a group reasoner or agent runner.
+
+    Attributes:
+        key: Runner key (`reasoner:<owner>`, `system` or `<subagent name>:<instance id>`).
+        owner: User ID of the runner owner.
+        kind: `reasoner` or `agent`.
+        live: Whether the runner worker is initialized and running.
+        stopped: Whether the runner was stopped (explicitly, after its idle timeout
+            or after an initialization error).
+        idle_deadline: Unix timestamp at which the runner is stopped if it receives
+            no further invocation. None if it has no idle timeout.
+        queued: Number of queued invocations.
+        in_flight: Number of running invocations.
+        in_flight_age: Age of the oldest running invocation in seconds, since it was
+            queued. None if nothing is running.
+        pending_saves: Number of state saves not yet completed by the
+            [`DataStore`][group_genie.datastore.DataStore].
+        last_error: Most recent error, if any.
+        subagents: Stats of the subagent runners of an agent runner.
+    """
+
+    key: str
+    owner: str
+    kind: str
+    live: bool = False
+    stopped: bool = False
+    idle_deadline: float | None = None
+    queued: int = 0
+    in_flight: int = 0
+    in_flight_age: float | None = None
+    pending_saves: int = 0
+    last_error: ErrorInfo | None = None
+    subagents: list["RunnerStats"] = field(default_factory=list)
+
+    def walk(self) -> Iterable["RunnerStats"]:
+        """Iterate over this runner and its subagent runners (recursively)."""
+        yield self
+        for subagent in self.subagents:
+            yield from subagent.walk()
+
+
+@dataclass
+class SessionStats:
+    """Health and load of a [`GroupSession`][group_genie.session.GroupSession].
+
+    Returned by [`stats()`][group_genie.session.GroupSession.stats].
+
+    Attributes:
+        id: Session ID.
+        stopped: Whether the session was stopped.
+        messages: Number of messages of the session.
+        queued: Depth of the session worker queue.
+        pending_saves: Number of session saves not yet completed by the
+            [`DataStore`][group_genie.datastore.DataStore].
+        last_error: Most recent error of the session, if any.
+        reasoners: Stats of the group reasoner runners, one per owner.
+        agents: Stats of the system agent runners, one per owner, including their
+            subagent runners.
+    """
+
+    id: str
+    stopped: bool = False
+    messages: int = 0
+    queued: int = 0
+    pending_saves: int = 0
+    last_error: ErrorInfo | None = None
+    reasoners: list[RunnerStats] = field(default_factory=list)
+    agents: list[RunnerStats] = field(default_factory=list)
+
+    def runners(self) -> Iterable[RunnerStats]:
+        """Iterate over all runners of the session, including subagent runners."""
+        for runner in self.reasoners + self.agents:
+            yield from runner.walk()
+
+    def summary(self) -> "StatsSummary":
+        """Return the aggregate form of these stats."""
+        return StatsSummary.of([self])
+
+
+@dataclass
+class StatsSummary:
+    """Aggregate of the stats of one or more sessions, e.g. for dashboards.
+
+    Attributes:
+        sessions: Number of sessions.
+        stopped: Number of stopped sessions.
+        messages: Total number of messages.
+        queued: Total number of queued session messages and runner invocations.
+        runners: Total number of runners.
+        live_runners: Number of live runners.
+        in_flight: Total number of running invocations.
+        oldest_in_flight: Age of the oldest running invocation in seconds.
+        pending_saves: Total number of pending saves.
+        errors: Number of sessions and runners with a recorded error.
+        last_error: Most recent error across all sessions and runners.
+    """
+
+    sessions: int = 0
+    stopped: int = 0
+    messages: int = 0
+    queued: int = 0
+    runners: int = 0
+    live_runners: int = 0
+    in_flight: int = 0
+    oldest_in_flight: float | None = None
+    pending_saves: int = 0
+    errors: int = 0
+    last_error: ErrorInfo | None = None
+
+    @staticmethod
+    def of(stats: Iterable[SessionStats]) -> "StatsSummary":
+        """Aggregate the stats of several sessions.
+
+        Example:
+            ```python
+            stats = await asyncio.gather(*[session.stats() for session in sessions])
+            summary = StatsSummary.of(stats)
+            ```
+        """
+        summary = StatsSummary()
+
+        for session in stats:
+            summary.sessions += 1
+            summary.stopped += session.stopped
+            summary.messages += session.messages
+            summary.queued += session.queued
+            summary.pending_saves += session.pending_saves
+            summary._error(session.last_error)
+
+            for runner in session.runners():
+                summary.runners += 1
+                summary.live_runners += runner.live
+                summary.queued += runner.queued
+                summary.in_flight += runner.in_flight
+                summary.pending_saves += runner.pending_saves
+                summary._error(runner.last_error)
+                if runner.in_flight_age is not None:
+                    summary.oldest_in_flight = max(summary.oldest_in_flight or 0.0, runner.in_flight_age)
+
+        return summary
+
+    def _error(self, error: ErrorInfo | None):
+        if error is None:
+            return
+        self.errors += 1
+        if self.last_error is None or error.time > self.last_error.time:
+            self.last_error = error
+
+
+class Health:
+    """Tracks pending saves and the most recent error of a session or runner."""
+
+    def __init__(self):
+        self.pending_saves = 0
+        self.last_error: ErrorInfo | None = None
+
+    def error(self, source: str, e: BaseException):
+        self.last_error = ErrorInfo(source=source, error=repr(e))
+
+    def track(self, future: Future[None]) -> Future[None]:
+        """Count a save as pending until its future is done, recording save errors."""
+        if not future.done():
+            self.pending_saves += 1
+            future.add_done_callback(self._saved)
+        return future
+
+    def _saved(self, future: Future[None]):
+        self.pending_saves -= 1
+        if not future.cancelled() and (e := future.exception()) is not None:
+            self.error("save", e)
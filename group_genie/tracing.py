@@ -0,0 +1,269 @@
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import Any, Iterator
+
+from group_genie.utils import identifier
+
+logger = logging.getLogger(__name__)
+
+_current_span = ContextVar["Span | None"]("current_span", default=None)
+_exporter: "SpanExporter | None" = None
+
+
+@dataclass
+class Span:
+    """A timed stage of message processing within a trace.
+
+    All spans created while processing a message share the same `trace_id`. Child
+    spans reference their parent with `parent_id`, so that the nesting of session,
+    reasoner, agent, subagent and approval stages can be reconstructed from the
+    exported spans.
+
+    Attributes:
+        name: Name of the stage (e.g. `session.handle`, `agent.run`).
+        trace_id: ID shared by all spans of a trace.
+        span_id: Unique ID of this span.
+        parent_id: ID of the parent span, None for a root span.
+        start_time: Start time in seconds since the epoch.
+        end_time: End time in seconds since the epoch, None while the span is open.
+        attributes: Stage-specific attributes (e.g. agent name, decision).
+        error: Error representation if the stage failed, None otherwise.
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None = None
+    start_time: float = field(default_factory=time.time)
+    end_time: float | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def duration(self) -> float | None:
+        """Span duration in seconds, None while the span is open."""
+        if self.end_time is None:
+            return None
+        return self.end_time - self.start_time
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def end(self, error: BaseException | None = None):
+        """End the span and export it. Subsequent calls have no effect."""
+        if self.end_time is not None:
+            return
+
+        self.end_time = time.time()
+        if error is not None:
+            self.error = repr(error)
+        if _exporter is not None:
+            _exporter.on_end(self)
+
+
+class SpanExporter(ABC):
+    """Abstract base class for span exporters.
+
+    Exporters are called synchronously when spans start and end. Implementations
+    must be fast and must not raise.
+    """
+
+    def on_start(self, span: Span):
+        """Called when a span starts. The default implementation does nothing."""
+        pass
+
+    @abstractmethod
+    def on_end(self, span: Span):
+        """Called when a span ends."""
+        ...
+
+    def shutdown(self):
+        """Flush and release exporter resources. The default implementation does nothing."""
+        pass
+
+
+class JsonlSpanExporter(SpanExporter):
+    """Appends ended spans as JSON lines to a local file.
+
+    Each line contains the fields of a [`Span`][group_genie.tracing.Span].
+    Attributes that are not JSON-serializable are written as strings.
+    """
+
+    def __init__(self, path: Path):
+        """Initialize the exporter.
+
+        Args:
+            path: Path of the JSONL file. Parent directories are created if needed.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._file = path.open("a")
+        self._lock = Lock()
+
+    def on_end(self, span: Span):
+        line = json.dumps(asdict(span), default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def shutdown(self):
+        with self._lock:
+            self._file.close()
+
+
+class OpenTelemetrySpanExporter(SpanExporter):
+    """Mirrors spans to OpenTelemetry spans of the globally configured tracer provider.
+
+    Requires the `opentelemetry-api` package and a configured tracer provider (e.g.
+    from `opentelemetry-sdk`). Parent-child relations and start and end times are
+    preserved.
+    """
+
+    def __init__(self, instrumenting_module_name: str = "group_genie"):
+        from opentelemetry import trace
+
+        self._trace = trace
+        self._tracer = trace.get_tracer(instrumenting_module_name)
+        self._spans: dict[str, Any] = {}
+        self._lock = Lock()
+
+    def on_start(self, span: Span):
+        parent = self._spans.get(span.parent_id) if span.parent_id else None
+        context = self._trace.set_span_in_context(parent) if parent is not None else None
+        otel_span = self._tracer.start_span(
+            span.name,
+            context=context,
+            start_time=int(span.start_time * 1e9),
+        )
+        with self._lock:
+            self._spans[span.span_id] = otel_span
+
+    def on_end(self, span: Span):
+        with self._lock:
+            otel_span = self._spans.pop(span.span_id, None)
+
+        if otel_span is None:
+            return
+
+        for key, value in span.attributes.items():
+            otel_span.set_attribute(key, value if isinstance(value, (str, bool, int, float)) else str(value))
+        if span.error is not None:
+            otel_span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, span.error))
+        otel_span.end(end_time=int(span.end_time * 1e9) if span.end_time else None)
+
+
+def configure_tracing(
+    exporter: SpanExporter | None = None,
+    path: Path = Path(".data", "traces.jsonl"),
+) -> SpanExporter:
+    """Enable tracing of message processing.
+
+    If no exporter is given, spans are exported to OpenTelemetry if it is installed
+    and a tracer provider has been configured, otherwise to a local JSONL file.
+
+    Args:
+        exporter: Exporter to use. Replaces (and shuts down) a previously configured
+            exporter.
+        path: Path of the JSONL file used if OpenTelemetry is not available.
+
+    Returns:
+        The configured exporter.
+
+    Example:
+        ```python
+        configure_tracing(path=Path(".data", "traces.jsonl"))
+        ```
+    """
+    global _exporter
+
+    if exporter is None:
+        exporter = OpenTelemetrySpanExporter() if _opentelemetry_configured() else JsonlSpanExporter(path)
+
+    if _exporter is not None:
+        _exporter.shutdown()
+
+    _exporter = exporter
+    return exporter
+
+
+def disable_tracing():
+    """Disable tracing and shut down the configured exporter."""
+    global _exporter
+
+    if _exporter is not None:
+        _exporter.shutdown()
+        _exporter = None
+
+
+def _opentelemetry_configured() -> bool:
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        return False
+    return not isinstance(trace.get_tracer_provider(), (trace.ProxyTracerProvider, trace.NoOpTracerProvider))
+
+
+def current_span() -> Span | None:
+    """Return the span of the current context, None if there is no active span."""
+    return _current_span.get()
+
+
+def start_span(name: str, parent: Span | None = None, **attributes: Any) -> Span:
+    """Start a span without activating it in the current context.
+
+    The caller is responsible for ending the span with
+    [`end()`][group_genie.tracing.Span.end]. Use
+    [`span()`][group_genie.tracing.span] for spans covering a code block.
+
+    Args:
+        name: Name of the span.
+        parent: Parent span. Starts a new trace if None.
+        **attributes: Initial span attributes.
+    """
+    span = Span(
+        name=name,
+        trace_id=parent.trace_id if parent else identifier(),
+        span_id=identifier()[:16],
+        parent_id=parent.span_id if parent else None,
+        attributes=attributes,
+    )
+    if _exporter is not None:
+        _exporter.on_start(span)
+    return span
+
+
+@contextmanager
+def span(name: str, parent: Span | None = None, **attributes: Any) -> Iterator[Span]:
+    """Context manager that starts a span, activates it in the current context and ends it on exit.
+
+    Args:
+        name: Name of the span.
+        parent: Parent span. Defaults to the span of the current context.
+        **attributes: Initial span attributes.
+    """
+    _span = start_span(name, parent=parent or current_span(), **attributes)
+    with use_span(_span):
+        try:
+            yield _span
+        except BaseException as e:
+            _span.end(error=e)
+            raise
+        else:
+            _span.end()
+
+
+@contextmanager
+def use_span(span: Span | None) -> Iterator[None]:
+    """Context manager that activates an existing span in the current context."""
+    token = _current_span.set(span)
+    try:
+        yield
+    finally:
+        _current_span.reset(token)
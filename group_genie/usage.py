@@ -0,0 +1,65 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
+
+@dataclass
+class Usage:
+    """Model usage of one or more agent or group reasoner runs.
+
+    Attributes:
+        input_tokens: Number of input (prompt) tokens, including cached tokens.
+        output_tokens: Number of output (completion) tokens.
+        requests: Number of model requests.
+        tool_calls: Number of tool calls.
+    """
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    requests: int = 0
+    tool_calls: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+    def __add__(self, other: "Usage") -> "Usage":
+        return Usage(
+            input_tokens=self.input_tokens + other.input_tokens,
+            output_tokens=self.output_tokens + other.output_tokens,
+            requests=self.requests + other.requests,
+            tool_calls=self.tool_calls + other.tool_calls,
+        )
+
+
+UsageRecorder = Callable[[str, Usage], None]
+"""Callback type for recording the usage of a run.
+
+Called with the key of the runner that produced the usage (`reasoner` for the
+group reasoner, the agent key, e.g. `system` or `search:a1b2c3d4`, for agents)
+and the usage of the run.
+"""
+
+_current_recorder = ContextVar[UsageRecorder | None]("usage_recorder", default=None)
+
+
+def current_recorder() -> UsageRecorder | None:
+    """Return the usage recorder of the current context, None if there is none."""
+    return _current_recorder.get()
+
+
+@contextmanager
+def use_recorder(recorder: UsageRecorder | None) -> Iterator[None]:
+    """Context manager that activates a usage recorder in the current context."""
+    token = _current_recorder.set(recorder)
+    try:
+        yield
+    finally:
+        _current_recorder.reset(token)
+
+
+def record(key: str, usage: Usage | None):
+    """Record the usage of a run with the usage recorder of the current context (if any)."""
+    if usage is not None and (recorder := _current_recorder.get()) is not None:
+        recorder(key, usage)
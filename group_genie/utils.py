@@ -1,4 +1,5 @@
 from asyncio import get_running_loop
+from collections import deque
 from functools import partial
 from typing import Callable, TypeVar
 from uuid import uuid4
@@ -12,3 +13,23 @@ async def arun(func: Callable[..., T], *args, **kwargs) -> T:
 
 def identifier() -> str:
     return uuid4().hex
+
+
+class LatencyWindow:
+    """Sliding window of recent latency samples."""
+
+    def __init__(self, size: int = 100):
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, latency: float):
+        self._samples.append(latency)
+
+    def percentile(self, q: float) -> float | None:
+        """Return the q-quantile (0 <= q <= 1) of the samples, or None if empty."""
+        if not self._samples:
+            return None
+        samples = sorted(self._samples)
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
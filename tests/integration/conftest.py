@@ -1,6 +1,6 @@
-from asyncio import Queue
+from asyncio import Queue, gather
 from pathlib import Path
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Callable
 
 import pytest
 import pytest_asyncio
@@ -10,9 +10,11 @@ from pydantic_ai.models.test import TestModel
 
 from group_genie.agent import AgentFactory, AgentInfo, Approval, AsyncTool
 from group_genie.agent.provider.pydantic_ai import DefaultAgent
+from group_genie.bench.models import simulated_agent_factory, simulated_group_reasoner_factory
 from group_genie.datastore import DataStore
 from group_genie.message import Message
 from group_genie.reasoner import GroupReasoner, GroupReasonerFactory
+from group_genie.session import Execution, GroupSession
 from tests.integration.mcp.server import STDIO_SERVER_PATH
 
 
@@ -26,6 +28,10 @@ async def approve(expected: int, queue: Queue) -> list[Approval]:
     return approvals
 
 
+async def collect(execution: Execution) -> list:
+    return [elem async for elem in execution.stream()]
+
+
 @pytest_asyncio.fixture
 async def data_store(tmp_path: Path) -> AsyncIterator[DataStore]:
     async with DataStore(root_path=tmp_path) as ds:
@@ -42,6 +48,36 @@ def group_reasoner_factory() -> GroupReasonerFactory:
     )
 
 
+@pytest_asyncio.fixture
+async def simulated_session_factory() -> AsyncIterator[Callable[..., GroupSession]]:
+    """Creates sessions with simulated group reasoners and agents, stopped on teardown."""
+    sessions: list[GroupSession] = []
+
+    def create(
+        reasoner_latency: float = 0.0,
+        agent_latency: float = 0.0,
+        delegate_ratio: float = 1.0,
+        **kwargs: Any,
+    ) -> GroupSession:
+        session = GroupSession(
+            id="test-session",
+            group_reasoner_factory=simulated_group_reasoner_factory(
+                latency=reasoner_latency,
+                delegate_ratio=delegate_ratio,
+            ),
+            agent_factory=simulated_agent_factory(latency=agent_latency, response_size=10),
+            **kwargs,
+        )
+        sessions.append(session)
+        return session
+
+    yield create
+
+    for session in sessions:
+        session.stop()
+    await gather(*[session.join() for session in sessions])
+
+
 @pytest.fixture
 def agent_factory() -> AgentFactory:
     mcp_server = MCPServerStdio(
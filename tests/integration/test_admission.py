@@ -0,0 +1,151 @@
+import asyncio
+from typing import Callable
+
+import pytest
+from group_sense import Decision
+
+from group_genie.admission import Admission, Overload, OverloadPolicy
+from group_genie.message import Message
+from group_genie.session import GroupSession
+from tests.integration.conftest import collect
+
+SessionFactory = Callable[..., GroupSession]
+
+
+def test_admission_check():
+    admission = Admission(max_pending=2, max_in_flight_per_owner=1)
+
+    assert admission.check(pending=1, in_flight=0) is None
+    assert admission.check(pending=2, in_flight=0) == Overload(scope="session", limit=2)
+    assert admission.check(pending=1, in_flight=1) == Overload(scope="owner", limit=1)
+    assert Admission().check(pending=100, in_flight=100) is None
+
+
+@pytest.mark.asyncio
+async def test_admission_reject(simulated_session_factory: SessionFactory):
+    session = simulated_session_factory(reasoner_latency=0.1, admission=Admission(max_in_flight_per_owner=1))
+
+    try:
+        execution_1 = session.handle(Message(content="a", sender="user"))
+        execution_2 = session.handle(Message(content="b", sender="user", request_id="2"))
+        execution_3 = session.handle(Message(content="c", sender="other"))
+
+        elems_1, elems_2, elems_3 = await asyncio.gather(
+            collect(execution_1),
+            collect(execution_2),
+            collect(execution_3),
+        )
+        execution_4 = session.handle(Message(content="d", sender="user"))
+        result_4 = await execution_4.result()
+    finally:
+        session.stop()
+        await session.join()
+
+    assert elems_1[0] == Decision.DELEGATE
+    assert elems_1[1].content == "x" * 10
+
+    assert elems_2[0] == Decision.DELEGATE
+    assert elems_2[1].receiver == "user"
+    assert elems_2[1].request_id == "2"
+    assert "too many requests" in elems_2[1].content
+    assert execution_2.span.attributes["overload"] == "owner"
+
+    assert elems_3[1].content == "x" * 10
+    assert result_4 is not None and result_4.content == "x" * 10
+
+    assert [m.content for m in session._messages if m.sender != "system"] == ["a", "c", "d"]
+
+
+@pytest.mark.asyncio
+async def test_admission_drop_oldest(simulated_session_factory: SessionFactory):
+    session = simulated_session_factory(
+        reasoner_latency=0.1, admission=Admission(max_in_flight_per_owner=2, policy=OverloadPolicy.DROP_OLDEST)
+    )
+
+    try:
+        execution_1 = session.handle(Message(content="a", sender="user"))
+        task_1 = asyncio.create_task(collect(execution_1))
+        execution_2 = session.handle(Message(content="b", sender="user"))
+        task_2 = asyncio.create_task(collect(execution_2))
+
+        await asyncio.sleep(0.05)  # reasoning of execution 1 running, execution 2 queued
+        execution_3 = session.handle(Message(content="c", sender="user"))
+        elems_1, elems_2, elems_3 = await asyncio.gather(task_1, task_2, collect(execution_3))
+    finally:
+        session.stop()
+        await session.join()
+
+    assert elems_1[0] == Decision.DELEGATE
+    assert elems_2 == [Decision.IGNORE]
+    assert elems_3[0] == Decision.DELEGATE
+    assert execution_2.span.attributes["dropped"] is True
+
+    # message of the dropped execution is kept in the session
+    assert [m.content for m in session._messages if m.sender != "system"] == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_admission_drop_oldest_rejects_without_pending(simulated_session_factory: SessionFactory):
+    session = simulated_session_factory(
+        reasoner_latency=0.1, admission=Admission(max_in_flight_per_owner=1, policy=OverloadPolicy.DROP_OLDEST)
+    )
+
+    try:
+        execution_1 = session.handle(Message(content="a", sender="user"))
+        task_1 = asyncio.create_task(collect(execution_1))
+
+        await asyncio.sleep(0.05)  # reasoning of execution 1 running
+        execution_2 = session.handle(Message(content="b", sender="user"))
+        elems_1, elems_2 = await asyncio.gather(task_1, collect(execution_2))
+    finally:
+        session.stop()
+        await session.join()
+
+    assert elems_1[0] == Decision.DELEGATE
+    assert "too many requests" in elems_2[1].content
+
+
+@pytest.mark.asyncio
+async def test_admission_cancelled_stream(simulated_session_factory: SessionFactory):
+    session = simulated_session_factory(reasoner_latency=0.1, admission=Admission(max_in_flight_per_owner=1))
+
+    try:
+        execution_1 = session.handle(Message(content="a", sender="user"))
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(collect(execution_1), 0.05)
+
+        execution_2 = session.handle(Message(content="b", sender="user"))
+        result_2 = await execution_2.result()
+    finally:
+        session.stop()
+        await session.join()
+
+    assert execution_1._ended
+    assert execution_1.span.end_time is not None
+    assert result_2 is not None and result_2.content == "x" * 10
+
+
+@pytest.mark.asyncio
+async def test_admission_backpressure(simulated_session_factory: SessionFactory):
+    session = simulated_session_factory(
+        reasoner_latency=0.1, admission=Admission(max_pending=1, policy=OverloadPolicy.BACKPRESSURE)
+    )
+
+    try:
+        execution_1 = await session.submit(Message(content="a", sender="user"))
+        task_1 = asyncio.create_task(collect(execution_1))
+
+        rejected = session.handle(Message(content="b", sender="other"))
+        assert "overloaded" in (await collect(rejected))[1].content
+
+        execution_2 = await session.submit(Message(content="c", sender="other"))
+        assert execution_1._decided  # admitted after execution 1 was decided
+
+        elems_1, elems_2 = await asyncio.gather(task_1, collect(execution_2))
+    finally:
+        session.stop()
+        await session.join()
+
+    assert elems_1[0] == Decision.DELEGATE
+    assert elems_2[0] == Decision.DELEGATE
+    assert elems_2[1].content == "x" * 10
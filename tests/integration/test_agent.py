@@ -1,10 +1,14 @@
 import json
-from asyncio import Queue, create_task
+from asyncio import Queue, create_task, wait_for
 
 import pytest
+from pydantic_ai.mcp import MCPServerStdio
+from pydantic_ai.models.test import TestModel
 
-from group_genie.agent import Agent, AgentFactory, AgentInput, ApprovalContext
-from tests.integration.conftest import approve
+from group_genie.agent import Agent, AgentFactory, AgentInput, ApprovalContext, CachePolicy, ToolCache
+from group_genie.agent.provider.pydantic_ai import DefaultAgent
+from tests.integration.conftest import approve, get_weather
+from tests.integration.mcp.server import STDIO_SERVER_PATH
 
 
 @pytest.fixture
@@ -67,3 +71,62 @@ async def test_agent_run_with_auto_approve_false(agent: Agent):
     for approval in approvals:
         assert approval.sender == "test-agent"
         assert approval.tool_name in {"get_weather", "tool_1", "tool_2"}
+
+
+def create_cached_agent(cache: ToolCache) -> DefaultAgent:
+    return DefaultAgent(
+        system_prompt="",
+        model=TestModel(),
+        toolsets=[MCPServerStdio(command="python", args=[str(STDIO_SERVER_PATH)])],
+        tools=[get_weather],
+        tool_cache=cache,
+    )
+
+
+@pytest.mark.asyncio
+async def test_agent_run_with_tool_cache():
+    # cache shared by agents, e.g. of different owners
+    cache = ToolCache({"get_weather": CachePolicy(ttl=60), "tool_1": CachePolicy(ttl=60)})
+    agent_1 = create_cached_agent(cache)
+    agent_2 = create_cached_agent(cache)
+
+    context = ApprovalContext(queue=Queue(), auto_approve=False)
+    input = AgentInput(query="What is the weather in Paris?")
+
+    async with agent_1.mcp(), agent_2.mcp():
+        approval_task = create_task(approve(3, context.queue))
+        result_1 = await agent_1.run(input=input, callback=context.approval_callback(sender="test-agent"))
+        await approval_task
+
+        # cached tools are neither approved nor executed
+        approval_task = create_task(approve(1, context.queue))
+        result_2 = await agent_2.run(input=input, callback=context.approval_callback(sender="test-agent"))
+        approvals = await approval_task
+
+    assert [approval.tool_name for approval in approvals] == ["tool_2"]
+    assert json.loads(result_2) == json.loads(result_1)
+
+
+@pytest.mark.asyncio
+async def test_agent_run_with_tool_cache_same_named_tools():
+    async def get_weather(city: str) -> str:
+        return f"The weather in {city} is rainy"
+
+    cache = ToolCache({"get_weather": CachePolicy(ttl=60)})
+    agent_1 = create_cached_agent(cache)
+    agent_2 = DefaultAgent(system_prompt="", model=TestModel(), tools=[get_weather], tool_cache=cache)
+
+    context_1 = ApprovalContext(queue=Queue(), auto_approve=True)
+    context_2 = ApprovalContext(queue=Queue(), auto_approve=False)
+    input = AgentInput(query="What is the weather in Paris?")
+
+    async with agent_1.mcp(), agent_2.mcp():
+        await agent_1.run(input=input, callback=context_1.approval_callback(sender="test-agent"))
+
+        # another function with the same name doesn't use the cached result
+        approval_task = create_task(approve(1, context_2.queue))
+        result = await agent_2.run(input=input, callback=context_2.approval_callback(sender="test-agent"))
+        approvals = await wait_for(approval_task, timeout=5)
+
+    assert [approval.tool_name for approval in approvals] == ["get_weather"]
+    assert "rainy" in json.loads(result)["get_weather"]
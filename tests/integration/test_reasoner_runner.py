@@ -0,0 +1,195 @@
+import asyncio
+from typing import Any
+
+import pytest
+from group_sense import Decision, Response
+
+from group_genie.message import Message
+from group_genie.reasoner import GroupReasoner, GroupReasonerFactory, GroupReasonerRunner, RegexPrefilter
+from group_genie.reasoner.runner import HEDGE_MIN_SAMPLES
+from group_genie.scheduler import Budget, Scheduler
+from group_genie.usage import Usage, use_recorder
+
+
+class CountingGroupReasoner(GroupReasoner):
+    def __init__(self):
+        self._processed = 0
+
+    @property
+    def processed(self) -> int:
+        return self._processed
+
+    def get_serialized(self) -> Any:
+        return {"processed": self._processed}
+
+    def set_serialized(self, state: Any):
+        self._processed = state["processed"]
+
+    async def run(self, updates: list[Message]) -> Response:
+        self._processed += len(updates)
+        return Response(decision=Decision.DELEGATE, query=updates[-1].content, receiver=updates[-1].sender)
+
+    def usage(self) -> Usage | None:
+        return Usage(input_tokens=10, output_tokens=2, requests=1)
+
+
+@pytest.mark.asyncio
+async def test_prefilter_skips_reasoner():
+    reasoner = CountingGroupReasoner()
+    factory = GroupReasonerFactory(
+        group_reasoner_factory_fn=lambda secrets, owner: reasoner,
+        prefilters=[RegexPrefilter(pattern=r"[\W_]*")],
+    )
+    runner = GroupReasonerRunner(key="reasoner:alice", owner="alice", group_reasoner_factory=factory)
+
+    messages = [Message(content="👍", sender="alice")]
+    response = await runner.invoke(messages)
+
+    assert response.decision == Decision.IGNORE
+    assert reasoner.processed == 0
+
+    messages.append(Message(content="What's the weather?", sender="alice"))
+    response = await runner.invoke(messages)
+
+    assert response.decision == Decision.DELEGATE
+    assert response.query == "What's the weather?"
+    assert reasoner.processed == 2
+
+    runner.stop()
+    await runner.join()
+
+
+class SlowGroupReasoner(CountingGroupReasoner):
+    def __init__(self, delays: list[float]):
+        super().__init__()
+        self._delays = delays
+
+    async def run(self, updates: list[Message]) -> Response:
+        await asyncio.sleep(self._delays.pop(0) if self._delays else 0)
+        return await super().run(updates)
+
+
+@pytest.mark.asyncio
+async def test_reasoner_timeout():
+    factory = GroupReasonerFactory(
+        group_reasoner_factory_fn=lambda secrets, owner: SlowGroupReasoner(delays=[10]),
+        group_reasoner_timeout=0.1,
+    )
+    runner = GroupReasonerRunner(key="reasoner:alice", owner="alice", group_reasoner_factory=factory)
+
+    recorded: list[tuple[str, Usage]] = []
+
+    with use_recorder(lambda key, usage: recorded.append((key, usage))):
+        future = runner.invoke([Message(content="What's the weather?", sender="alice")])
+    response = await future
+
+    assert response.decision == Decision.IGNORE
+    assert recorded == [("reasoner", Usage(input_tokens=10, output_tokens=2, requests=1))]  # timed out run
+
+    runner.stop()
+    await runner.join()
+
+
+@pytest.mark.asyncio
+async def test_reasoner_invoke_cancelled_while_running():
+    factory = GroupReasonerFactory(
+        group_reasoner_factory_fn=lambda secrets, owner: SlowGroupReasoner(delays=[0.2]),
+    )
+    runner = GroupReasonerRunner(key="reasoner:alice", owner="alice", group_reasoner_factory=factory)
+
+    messages = [Message(content="Hello", sender="alice")]
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(runner.invoke(messages), timeout=0.1)  # cancels the invoke future
+    await asyncio.sleep(0.2)
+
+    messages.append(Message(content="What's the weather?", sender="alice"))
+    response = await runner.invoke(messages)
+
+    assert response.query == "What's the weather?"
+    assert not runner.stopped
+    assert runner.stats().last_error is None
+
+    runner.stop()
+    await runner.join()
+
+
+def hedging_factory(reasoners: list[SlowGroupReasoner]) -> GroupReasonerFactory:
+    def create_group_reasoner(secrets: dict[str, str], owner: str) -> GroupReasoner:
+        # first instance is slow on the call after warm-up, hedge instances are fast
+        delays = [0.0] * HEDGE_MIN_SAMPLES + [10.0] if not reasoners else []
+        reasoners.append(SlowGroupReasoner(delays=delays))
+        return reasoners[-1]
+
+    return GroupReasonerFactory(
+        group_reasoner_factory_fn=create_group_reasoner,
+        hedge_percentile=0.95,
+    )
+
+
+@pytest.mark.asyncio
+async def test_reasoner_hedging():
+    reasoners: list[SlowGroupReasoner] = []
+    factory = hedging_factory(reasoners)
+    runner = GroupReasonerRunner(key="reasoner:alice", owner="alice", group_reasoner_factory=factory)
+
+    messages: list[Message] = []
+    for i in range(HEDGE_MIN_SAMPLES + 1):
+        messages.append(Message(content=f"Question {i}", sender="alice"))
+        response = await asyncio.wait_for(runner.invoke(messages), timeout=5)
+        assert response.query == f"Question {i}"
+
+    assert len(reasoners) == 2
+    assert runner._group_reasoner is reasoners[1]
+    assert reasoners[1].processed == HEDGE_MIN_SAMPLES + 1
+
+    runner.stop()
+    await runner.join()
+
+
+@pytest.mark.asyncio
+async def test_reasoner_usage():
+    factory = GroupReasonerFactory(group_reasoner_factory_fn=lambda secrets, owner: CountingGroupReasoner())
+    runner = GroupReasonerRunner(key="reasoner:alice", owner="alice", group_reasoner_factory=factory)
+
+    recorded: list[tuple[str, Usage]] = []
+
+    with use_recorder(lambda key, usage: recorded.append((key, usage))):
+        future = runner.invoke([Message(content="What's the weather?", sender="alice")])
+    await future
+
+    assert recorded == [("reasoner", Usage(input_tokens=10, output_tokens=2, requests=1))]
+
+    runner.stop()
+    await runner.join()
+
+
+@pytest.mark.asyncio
+async def test_reasoner_hedging_usage():
+    reasoners: list[SlowGroupReasoner] = []
+    factory = hedging_factory(reasoners)
+    runner = GroupReasonerRunner(key="reasoner:alice", owner="alice", group_reasoner_factory=factory)
+    scheduler = Scheduler(owner_budget=Budget(tokens=1000, period=3600))
+
+    recorded: list[Usage] = []
+
+    def record(key: str, usage: Usage):
+        recorded.append(usage)
+        scheduler.charge("s1", "alice", usage.total_tokens)
+
+    messages: list[Message] = []
+    with use_recorder(record):
+        for i in range(HEDGE_MIN_SAMPLES + 1):
+            messages.append(Message(content=f"Question {i}", sender="alice"))
+            await asyncio.wait_for(runner.invoke(messages), timeout=5)
+
+    # usage of the cancelled primary call is recorded in addition to the hedge call
+    assert len(reasoners) == 2
+    assert len(recorded) == HEDGE_MIN_SAMPLES + 2
+    assert sum(recorded, Usage()).requests == HEDGE_MIN_SAMPLES + 2
+
+    _, tokens = scheduler._owner_buckets["alice"]
+    assert tokens is not None
+    assert tokens.balance == pytest.approx(1000 - 12 * (HEDGE_MIN_SAMPLES + 2), abs=1)
+
+    runner.stop()
+    await runner.join()
@@ -1,11 +1,16 @@
+import asyncio
 import json
 from asyncio import Queue, create_task
 from collections.abc import AsyncIterator
 
 import pytest
 import pytest_asyncio
+from pydantic_ai.messages import ModelMessage, ModelResponse, SystemPromptPart, TextPart, UserPromptPart
+from pydantic_ai.models.function import AgentInfo as FunctionAgentInfo
+from pydantic_ai.models.function import FunctionModel
 
-from group_genie.agent import AgentFactory, AgentInput, AgentRunner, ApprovalContext
+from group_genie.agent import AgentFactory, AgentInfo, AgentInput, AgentRunner, ApprovalContext, AsyncTool
+from group_genie.agent.provider.pydantic_ai import DefaultAgent
 from group_genie.datastore import DataStore
 from tests.integration.conftest import approve
 
@@ -88,6 +93,23 @@ async def test_runner_invoke_with_auto_approve_false(runner: AgentRunner):
         assert approval.tool_name in {"get_weather", "tool_1", "tool_2"}
 
 
+@pytest.mark.asyncio
+async def test_runner_cancel_while_waiting_for_approval(runner: AgentRunner):
+    context = ApprovalContext(queue=Queue(), auto_approve=False)
+
+    future = runner.invoke(input=AgentInput(query="What is the weather in Paris?"), context=context)
+    approval = await asyncio.wait_for(context.queue.get(), timeout=5)
+
+    runner.cancel()
+    await runner.join()
+    await asyncio.sleep(0)
+
+    with pytest.raises(RuntimeError, match="cancelled"):
+        await future
+    assert approval.ftr.done()  # shielded approval wait completed
+    assert not await approval.approved()
+
+
 @pytest.mark.asyncio
 async def test_runner_persistence(agent_factory: AgentFactory, data_store: DataStore):
     context = ApprovalContext(queue=Queue(), auto_approve=True)
@@ -129,3 +151,143 @@ async def test_runner_persistence(agent_factory: AgentFactory, data_store: DataS
     assert len(history1) > 0
     assert len(history2) == len(history1)
     assert history2 == history1
+
+
+class SlowAgent(DefaultAgent):
+    async def run(self, input: AgentInput, callback) -> str:
+        await asyncio.sleep(10)
+        return "too late"
+
+
+@pytest.mark.asyncio
+async def test_runner_invoke_timeout():
+    factory = AgentFactory(
+        system_agent_factory=lambda secrets, extra_tools, subagent_infos: SlowAgent(system_prompt="", model="test"),
+        system_agent_info=AgentInfo(name="system", description="Slow system agent", timeout=0.1),
+    )
+    runner = AgentRunner(key="slow-runner", name="system", owner="test-user", agent_factory=factory)
+
+    context = ApprovalContext(queue=Queue(), auto_approve=True)
+    with pytest.raises(TimeoutError, match="timed out"):
+        await runner.invoke(input=AgentInput(query="Hello"), context=context)
+
+    runner.stop()
+    await runner.join()
+
+
+class DelegatingAgent(DefaultAgent):
+    def __init__(self, run_subagent: AsyncTool):
+        super().__init__(system_prompt="", model="test")
+        self._run_subagent = run_subagent
+
+    async def run(self, input: AgentInput, callback) -> str:
+        return await self._run_subagent(query=input.query, subagent_name="slow", subagent_instance="i1")
+
+
+class SleepingAgent(DefaultAgent):
+    async def run(self, input: AgentInput, callback) -> str:
+        await asyncio.sleep(0.3)
+        return "done"
+
+
+@pytest.mark.asyncio
+async def test_runner_timeout_during_subagent_run():
+    factory = AgentFactory(
+        system_agent_factory=lambda secrets, extra_tools, subagent_infos: DelegatingAgent(extra_tools["run_subagent"]),
+        system_agent_info=AgentInfo(name="system", description="Delegating system agent", timeout=0.1),
+    )
+    factory.add_agent_factory_fn(
+        factory_fn=lambda secrets: SleepingAgent(system_prompt="", model="test"),
+        info=AgentInfo(name="slow", description="Slow subagent"),
+    )
+    runner = AgentRunner(key="system", name="system", owner="test-user", agent_factory=factory)
+    context = ApprovalContext(queue=Queue(), auto_approve=True)
+
+    with pytest.raises(TimeoutError, match="timed out"):
+        await runner.invoke(input=AgentInput(query="Hello"), context=context)
+
+    subagent_runner = await runner.get_subagent_runner("slow", "i1")
+    await asyncio.sleep(0.4)  # subagent run completes after its invoke was cancelled
+
+    assert not subagent_runner.stopped
+    assert subagent_runner.stats().last_error is None
+    assert await subagent_runner.invoke(input=AgentInput(query="Again"), context=context) == "done"
+
+    runner.stop()
+    await runner.join()
+
+
+async def slow_echo(messages: list[ModelMessage], info: FunctionAgentInfo) -> ModelResponse:
+    await asyncio.sleep(0.2)
+    return ModelResponse(parts=[TextPart(content=f"answer {len(messages)}")])
+
+
+@pytest.mark.asyncio
+async def test_runner_forks():
+    factory = AgentFactory(
+        system_agent_factory=lambda secrets, extra_tools, subagent_infos: DefaultAgent(
+            system_prompt="You are a test agent",
+            model=FunctionModel(slow_echo),
+        ),
+        system_agent_info=AgentInfo(name="system", description="Forking system agent", max_forks=2),
+    )
+    runner = AgentRunner(key="fork-runner", name="system", owner="test-user", agent_factory=factory)
+    context = ApprovalContext(queue=Queue(), auto_approve=True)
+
+    start = asyncio.get_running_loop().time()
+    futures = [runner.invoke(input=AgentInput(query=f"query {i}"), context=context) for i in range(4)]
+    results = await asyncio.gather(*futures)
+    elapsed = asyncio.get_running_loop().time() - start
+
+    # 3 runs in parallel from an empty history, the 4th on the main instance after its first run
+    # (depending on timing, completed forks are merged before or after the 4th run)
+    assert results[:3] == ["answer 1", "answer 1", "answer 1"]
+    assert results[3] in ["answer 3", "answer 5", "answer 7"]
+    assert elapsed < 0.6
+
+    runner.stop()
+    await runner.join()
+
+    history = runner._agent._history  # type: ignore
+    prompts = [part for message in history for part in message.parts if isinstance(part, UserPromptPart)]
+    system_prompts = [part for message in history for part in message.parts if isinstance(part, SystemPromptPart)]
+
+    assert len(history) == 8
+    assert len(prompts) == 4
+    assert len(system_prompts) == 1
+    assert isinstance(history[0].parts[0], SystemPromptPart)
+
+
+@pytest.mark.asyncio
+async def test_runner_stateless_pool():
+    def create_search_agent(secrets: dict[str, str]):
+        return DefaultAgent(system_prompt="You are a search agent", model=FunctionModel(slow_echo))
+
+    factory = AgentFactory(
+        system_agent_factory=lambda secrets, extra_tools, subagent_infos: DefaultAgent(
+            system_prompt="You are a test agent",
+            model=FunctionModel(slow_echo),
+        ),
+    )
+    factory.add_agent_factory_fn(
+        create_search_agent,
+        AgentInfo(name="search", description="Stateless search agent", stateless=True, pool_size=2),
+    )
+
+    system_runner = AgentRunner(key="system", name="system", owner="test-user", agent_factory=factory)
+    runner = await system_runner.get_subagent_runner("search", "a1b2c3d4")
+    assert await system_runner.get_subagent_runner("search", "e5f6a7b8") is runner
+
+    context = ApprovalContext(queue=Queue(), auto_approve=True)
+
+    start = asyncio.get_running_loop().time()
+    futures = [runner.invoke(input=AgentInput(query=f"query {i}"), context=context) for i in range(4)]
+    results = await asyncio.gather(*futures)
+    elapsed = asyncio.get_running_loop().time() - start
+
+    # each run starts from an empty history, 2 runs at a time
+    assert results == ["answer 1"] * 4
+    assert 0.4 <= elapsed < 0.6
+
+    system_runner.stop()
+    await system_runner.join()
@@ -1,12 +1,27 @@
+import asyncio
+import gc
 from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any, Callable
 
 import pytest
 import pytest_asyncio
+from group_sense import Decision
 
+from group_genie import tracing
 from group_genie.agent import AgentFactory, Approval
+from group_genie.datastore import DataStore
 from group_genie.message import Message
+from group_genie.metrics import AGENT_RUN_DURATION, DECISIONS, SESSION_QUEUE_WAIT, default_registry
+from group_genie.preferences import PreferencesSource
+from group_genie.profiling import ExecutionProfiler
 from group_genie.reasoner import GroupReasonerFactory
+from group_genie.scheduler import Budget, Scheduler
 from group_genie.session import GroupSession
+from group_genie.tracing import Span
+from group_genie.usage import Usage
+from tests.integration.conftest import collect
+from tests.unit.test_tracing import RecordingSpanExporter
 
 
 @pytest_asyncio.fixture
@@ -69,3 +84,337 @@ async def test_session_handle(session: GroupSession):
                 break
 
     assert len(approvals) == 4
+
+
+@pytest.mark.asyncio
+async def test_session_direct_routing(
+    agent_factory: AgentFactory,
+    group_reasoner_factory: GroupReasonerFactory,
+):
+    session = GroupSession(
+        id="test-session",
+        group_reasoner_factory=group_reasoner_factory,
+        agent_factory=agent_factory,
+        direct_routing=True,
+    )
+
+    message = Message(content="@a call your tools", sender="user", request_id="123")
+
+    approvals: list[Approval] = []
+    execution = session.handle(message)
+
+    async for elem in execution.stream():
+        match elem:
+            case Approval() as approval:
+                approvals.append(approval)
+                approval.approve()
+            case Message() as response:
+                assert response.sender == "system"
+                assert response.receiver == "user"
+                assert response.request_id == "123"
+                assert "You passed to tool 1" in response.content
+                break
+
+    assert {approval.tool_name for approval in approvals} == {"tool_1", "tool_2"}
+    assert all(approval.sender == "a:direct" for approval in approvals)
+
+    session.stop()
+    await session.join()
+
+
+@pytest.mark.asyncio
+async def test_session_prewarm(session: GroupSession):
+    assert await session.prewarm("user")
+
+    reasoner_runner = session._group_reasoner_runners["user"]
+    agent_runner = session._system_agent_runners["user"]
+
+    execution = session.handle(Message(content="What is the weather in Paris?", sender="user"))
+    assert await execution.result() is not None
+
+    assert session._group_reasoner_runners["user"] is reasoner_runner
+    assert session._system_agent_runners["user"] is agent_runner
+
+
+@pytest.mark.asyncio
+async def test_session_prewarm_cancelled(simulated_session_factory: Callable[..., GroupSession]):
+    errors: list[dict[str, Any]] = []
+    asyncio.get_running_loop().set_exception_handler(lambda loop, context: errors.append(context))
+
+    session = simulated_session_factory()
+    session.prewarm("user").cancel()  # caller stopped waiting
+    assert await session.prewarm("other")
+    await asyncio.sleep(0.01)
+
+    asyncio.get_running_loop().set_exception_handler(None)
+    assert errors == []
+    assert not session._prewarm_tasks
+
+
+@pytest.mark.asyncio
+async def test_session_prewarm_recent(
+    agent_factory: AgentFactory,
+    group_reasoner_factory: GroupReasonerFactory,
+    data_store: DataStore,
+):
+    session = GroupSession(
+        id="test-session",
+        group_reasoner_factory=group_reasoner_factory,
+        agent_factory=agent_factory,
+        data_store=data_store,
+    )
+
+    for sender in ["user1", "user2", "user3"]:
+        session.handle(Message(content="Hello", sender=sender, receiver="user4"))
+
+    session.stop()
+    await session.join()
+
+    session = GroupSession(
+        id="test-session",
+        group_reasoner_factory=group_reasoner_factory,
+        agent_factory=agent_factory,
+        data_store=data_store,
+        prewarm_recent=2,
+    )
+
+    await session.request_ids()
+
+    assert set(session._group_reasoner_runners) == {"user2", "user3"}
+    assert set(session._system_agent_runners) == {"user2", "user3"}
+
+    session.stop()
+    await session.join()
+
+
+@pytest.mark.asyncio
+async def test_session_metrics(session: GroupSession):
+    queue_waits = SESSION_QUEUE_WAIT.count()
+    agent_runs = AGENT_RUN_DURATION.count(agent="system", outcome="ok")
+    delegations = DECISIONS.value(decision="delegate", source="reasoner")
+
+    message = Message(content="What is the weather in Paris?", sender="user")
+    result = await session.handle(message).result()
+    assert result is not None
+
+    assert SESSION_QUEUE_WAIT.count() == queue_waits + 1
+    assert AGENT_RUN_DURATION.count(agent="system", outcome="ok") == agent_runs + 1
+    assert DECISIONS.value(decision="delegate", source="reasoner") == delegations + 1
+    assert "group_genie_reasoner_run_seconds_count" in default_registry.render()
+
+
+@pytest.mark.asyncio
+async def test_session_tracing(session: GroupSession):
+    exporter = RecordingSpanExporter()
+    tracing.configure_tracing(exporter)
+
+    try:
+        message = Message(content="What is the weather in Paris?", sender="user")
+        await session.handle(message).result()
+    finally:
+        tracing.disable_tracing()
+
+    spans = {span.span_id: span for span in exporter.ended}
+    root = next(span for span in spans.values() if span.name == "session.handle")
+
+    def parent(span: Span) -> Span:
+        return spans[span.parent_id]  # type: ignore
+
+    assert root.parent_id is None
+    assert all(span.trace_id == root.trace_id for span in spans.values())
+
+    reasoner = next(span for span in spans.values() if span.name == "reasoner.invoke")
+    assert parent(reasoner) is root
+    assert reasoner.attributes["decision"] == "delegate"
+
+    system_agent = next(
+        span for span in spans.values() if span.name == "agent.run" and span.attributes["agent"] == "system"
+    )
+    assert parent(system_agent) is root
+
+    run_subagent = next(span for span in spans.values() if span.name == "run_subagent")
+    assert parent(run_subagent) is system_agent
+
+    subagent = next(
+        span for span in spans.values() if span.name == "agent.run" and span.attributes["agent"] != "system"
+    )
+    assert parent(subagent) is run_subagent
+
+
+@pytest.mark.asyncio
+async def test_session_usage(session: GroupSession):
+    execution = session.handle(Message(content="What is the weather in Paris?", sender="user"))
+    await execution.result()
+
+    details = execution.usage_details
+    assert "system" in details
+    assert any(key.startswith("a:") for key in details)
+    assert details["system"].requests > 0
+    assert details["system"].tool_calls > 0
+    assert execution.usage.total_tokens > 0
+
+    assert session.usage("user") == execution.usage
+    assert session.usage() == execution.usage
+    assert session.usage("other") == Usage()
+    assert session.usage_by_owner() == {"user": execution.usage}
+
+
+@pytest.mark.asyncio
+async def test_session_footprint(session: GroupSession):
+    empty = await session.footprint()
+    assert empty.messages == 0
+    assert empty.runners == 0
+
+    await session.handle(Message(content="What is the weather in Paris?", sender="user")).result()
+    footprint = await session.footprint()
+
+    assert footprint.messages == 2
+    assert footprint.message_bytes > empty.message_bytes
+    assert [r.key for r in footprint.reasoners] == ["reasoner:user"]
+    assert [r.key for r in footprint.agents] == ["system"]
+
+    system = footprint.agents[0]
+    assert system.state_bytes > 0
+    assert system.mcp_contexts == 1
+    assert system.tasks >= 1
+    assert len(system.subagents) == 1
+    assert system.subagents[0].key.startswith("a:")
+    assert system.total_bytes > system.state_bytes
+
+    assert footprint.runners == 3
+    assert footprint.mcp_contexts == 2
+    assert footprint.by_owner() == {"user": footprint.total_bytes - footprint.message_bytes}
+
+
+@pytest.mark.asyncio
+async def test_session_stats(session: GroupSession):
+    execution = session.handle(Message(content="What is the weather in Paris?", sender="user"))
+
+    async for elem in execution.stream():
+        if isinstance(elem, Approval):
+            # system agent run is blocked on this approval
+            stats = await session.stats()
+            system = stats.agents[0]
+            assert system.live
+            assert system.in_flight == 1
+            assert system.in_flight_age is not None and system.in_flight_age > 0
+            elem.approve()
+
+    stats = await session.stats()
+    assert stats.messages == 2
+    assert stats.queued == 0
+    assert [r.key for r in stats.reasoners] == ["reasoner:user"]
+    assert [r.key for r in stats.agents] == ["system"]
+    assert all(runner.live and not runner.stopped and runner.in_flight == 0 for runner in stats.runners())
+    assert all(runner.last_error is None for runner in stats.runners())
+    assert len(stats.agents[0].subagents) == 1
+
+    summary = stats.summary()
+    assert summary.sessions == 1
+    assert summary.runners == 3
+    assert summary.live_runners == 3
+    assert summary.errors == 0
+
+    session.stop()
+    await session.join()
+
+    stats = await session.stats()
+    assert stats.stopped
+    assert not any(runner.live for runner in stats.runners())
+
+
+@pytest.mark.asyncio
+async def test_session_profiling(
+    agent_factory: AgentFactory,
+    group_reasoner_factory: GroupReasonerFactory,
+    tmp_path: Path,
+):
+    session = GroupSession(
+        id="test-session",
+        group_reasoner_factory=group_reasoner_factory,
+        agent_factory=agent_factory,
+        profiler=ExecutionProfiler(directory=tmp_path, threshold=0.0, interval=0.001),
+    )
+
+    try:
+        execution = session.handle(Message(content="What is the weather in Paris?", sender="user", request_id="r1"))
+        await execution.result()
+    finally:
+        session.stop()
+        await session.join()
+
+    assert execution.profile == tmp_path / "r1.collapsed"
+    assert execution.span.attributes["profile"] == str(execution.profile)
+
+
+@pytest.mark.asyncio
+async def test_session_throttling(
+    agent_factory: AgentFactory,
+    group_reasoner_factory: GroupReasonerFactory,
+):
+    scheduler = Scheduler(owner_budget=Budget(requests=1, period=3600), max_concurrency=1)
+    session = GroupSession(
+        id="test-session",
+        group_reasoner_factory=group_reasoner_factory,
+        agent_factory=agent_factory,
+        scheduler=scheduler,
+    )
+
+    try:
+        result_1 = await session.handle(Message(content="What is the weather in Paris?", sender="user")).result()
+        result_2 = await session.handle(Message(content="And in Vienna?", sender="user", request_id="2")).result()
+    finally:
+        session.stop()
+        await session.join()
+
+    assert result_1 is not None
+    assert "budget is exhausted" not in result_1.content
+
+    assert result_2 is not None
+    assert result_2.receiver == "user"
+    assert result_2.request_id == "2"
+    assert "requests budget is exhausted" in result_2.content
+
+
+@pytest.mark.asyncio
+async def test_session_throttling_ignored_messages(simulated_session_factory: Callable[..., GroupSession]):
+    scheduler = Scheduler(owner_budget=Budget(requests=1, period=3600))
+    session = simulated_session_factory(delegate_ratio=0.0, scheduler=scheduler)
+
+    elems_1 = await collect(session.handle(Message(content="a", sender="user")))
+    elems_2 = await collect(session.handle(Message(content="b", sender="user", receiver="system")))
+    elems_3 = await collect(session.handle(Message(content="c", sender="user")))
+    elems_4 = await collect(session.handle(Message(content="d", sender="user", receiver="system")))
+
+    # ignored messages are not throttled and consume no requests
+    assert elems_1 == [Decision.IGNORE]
+    assert elems_2[1].content == "x" * 10
+    assert elems_3 == [Decision.IGNORE]
+    assert elems_4[0] == Decision.DELEGATE
+    assert "requests budget is exhausted" in elems_4[1].content
+
+    assert [m.content for m in session._messages] == ["a", "b", "x" * 10, "c", "d", elems_4[1].content]
+
+
+class FailingPreferencesSource(PreferencesSource):
+    async def get_preferences(self, username: str) -> str | None:
+        raise RuntimeError("preferences unavailable")
+
+
+@pytest.mark.asyncio
+async def test_session_failed_prefetch_retrieved(simulated_session_factory: Callable[..., GroupSession]):
+    errors: list[dict[str, Any]] = []
+    asyncio.get_running_loop().set_exception_handler(lambda loop, context: errors.append(context))
+
+    session = simulated_session_factory(
+        reasoner_latency=0.05,
+        delegate_ratio=0.0,
+        preferences_source=FailingPreferencesSource(),
+    )
+    elems = await collect(session.handle(Message(content="a", sender="user")))
+    await asyncio.sleep(0.01)
+    gc.collect()
+
+    asyncio.get_running_loop().set_exception_handler(None)
+    assert elems == [Decision.IGNORE]
+    assert errors == []
@@ -0,0 +1,74 @@
+import asyncio
+import json
+from pathlib import Path
+from time import perf_counter
+from typing import Callable
+
+import pytest
+from group_sense import Decision
+
+from group_genie.datastore import DataStore
+from group_genie.message import Message
+from group_genie.metrics import RUNNERS_CANCELLED
+from group_genie.session import GroupSession
+from tests.integration.conftest import collect
+
+SessionFactory = Callable[..., GroupSession]
+
+
+@pytest.mark.asyncio
+async def test_stop_without_deadline(simulated_session_factory: SessionFactory, tmp_path: Path):
+    session = simulated_session_factory(agent_latency=0.1, data_store=DataStore(root_path=tmp_path))
+
+    tasks = [asyncio.create_task(collect(session.handle(Message(content="a", sender=f"user-{i}")))) for i in range(3)]
+    await asyncio.sleep(0.05)
+
+    session.stop()
+    await session.join()
+
+    for elems in await asyncio.gather(*tasks):
+        assert elems[1].content == "x" * 10
+
+
+@pytest.mark.asyncio
+async def test_stop_deadline_cancels_agents(simulated_session_factory: SessionFactory, tmp_path: Path):
+    session = simulated_session_factory(agent_latency=10.0, data_store=DataStore(root_path=tmp_path))
+    cancelled = RUNNERS_CANCELLED.value(kind="agent")
+
+    tasks = [asyncio.create_task(collect(session.handle(Message(content="a", sender=f"user-{i}")))) for i in range(3)]
+    await asyncio.sleep(0.1)  # agent runs in flight
+
+    start = perf_counter()
+    session.stop(timeout=0.2)
+    await session.join()
+
+    assert perf_counter() - start < 2.0
+    assert RUNNERS_CANCELLED.value(kind="agent") == cancelled + 3
+
+    for elems in await asyncio.gather(*tasks):
+        assert elems[0] == Decision.DELEGATE
+        assert elems[1].content == "System agent error: Agent system cancelled"
+
+    # state of cancelled agents is saved
+    for i in range(3):
+        assert (tmp_path / "test-session" / f"user-{i}" / "system.json").exists()
+
+
+@pytest.mark.asyncio
+async def test_stop_deadline_cancels_reasoners(simulated_session_factory: SessionFactory, tmp_path: Path):
+    session = simulated_session_factory(reasoner_latency=10.0, data_store=DataStore(root_path=tmp_path))
+    cancelled = RUNNERS_CANCELLED.value(kind="reasoner")
+
+    task_1 = asyncio.create_task(collect(session.handle(Message(content="a", sender="user"))))
+    task_2 = asyncio.create_task(collect(session.handle(Message(content="b", sender="user"))))
+    await asyncio.sleep(0.1)  # first reasoning in flight, second queued
+
+    session.stop(timeout=0.1)
+    await session.join()
+
+    assert RUNNERS_CANCELLED.value(kind="reasoner") == cancelled + 1
+    assert await task_1 == [Decision.IGNORE]
+    assert await task_2 == [Decision.IGNORE]
+
+    data = json.loads((tmp_path / "test-session" / "user" / "reasoner.json").read_text())
+    assert data == {"processed": 0}
@@ -0,0 +1,98 @@
+import asyncio
+from asyncio import Queue, create_task
+
+import pytest
+
+from group_genie.agent import Approval, ApprovalContext, ApprovalPolicy, ApprovalRule
+
+
+def test_rule_matching():
+    rule = ApprovalRule(approve=True, tool="read_*", owner="user-*", args={"path": r"/data/.*"})
+
+    assert rule.matches("user-1", "system", "read_file", {"path": "/data/a.txt"})
+    assert not rule.matches("user-1", "system", "write_file", {"path": "/data/a.txt"})
+    assert not rule.matches("admin", "system", "read_file", {"path": "/data/a.txt"})
+    assert not rule.matches("user-1", "system", "read_file", {"path": "/etc/passwd"})
+    assert not rule.matches("user-1", "system", "read_file", {})
+
+
+@pytest.mark.asyncio
+async def test_rules_decide_without_approval():
+    policy = ApprovalPolicy(
+        rules=[
+            ApprovalRule(approve=False, tool="get_weather", sender="search:*"),
+            ApprovalRule(approve=True, tool="get_weather"),
+        ]
+    )
+    context = ApprovalContext(queue=Queue(), owner="user-1", policy=policy)
+
+    assert await context.approval("system", "get_weather", {"city": "Paris"})
+    assert not await context.approval("search:a1b2c3d4", "get_weather", {"city": "Paris"})
+    assert context.queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_remembered_decision():
+    policy = ApprovalPolicy()
+    context_1 = ApprovalContext(queue=Queue(), owner="user-1", policy=policy)
+    context_2 = ApprovalContext(queue=Queue(), owner="user-2", policy=policy)
+
+    task = create_task(context_1.approval("system", "search", {"query": "a"}))
+    approval: Approval = await context_1.queue.get()
+    approval.approve(remember=True)
+    assert await task
+
+    # remembered for the owner, regardless of arguments
+    assert await context_1.approval("system", "search", {"query": "b"})
+    assert context_1.queue.empty()
+
+    # not remembered for other owners
+    task = create_task(context_2.approval("system", "search", {"query": "a"}))
+    approval = await context_2.queue.get()
+    approval.deny()
+    assert not await task
+
+    policy.forget("user-1")
+    task = create_task(context_1.approval("system", "search", {"query": "b"}))
+    approval = await context_1.queue.get()
+    approval.deny()
+    assert not await task
+
+
+@pytest.mark.asyncio
+async def test_approval_timeout():
+    policy = ApprovalPolicy(timeout=0.05, timeout_decision=True)
+    context = ApprovalContext(queue=Queue(), owner="user-1", policy=policy)
+
+    assert await asyncio.wait_for(context.approval("system", "search", {}), timeout=1)
+
+    # late decisions are ignored
+    approval: Approval = context.queue.get_nowait()
+    approval.deny()
+    assert await approval.approved()
+
+
+@pytest.mark.asyncio
+async def test_approval_cancelled():
+    context = ApprovalContext(queue=Queue(), owner="user-1", policy=ApprovalPolicy(timeout=10))
+
+    task = create_task(context.approval("system", "search", {}))
+    approval: Approval = await context.queue.get()
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.sleep(0)
+
+    # the approval is denied so that the shielded wait completes
+    assert approval.ftr.done()
+    assert not await approval.approved()
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+def test_policies_do_not_share_rules():
+    policy_1 = ApprovalPolicy()
+    policy_2 = ApprovalPolicy()
+    policy_1.rules.append(ApprovalRule(approve=True, tool="search"))
+
+    assert policy_2.rules == []
@@ -0,0 +1,146 @@
+import asyncio
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+from pydantic_ai.messages import ModelMessage, ModelResponse, TextPart, ToolCallPart, ToolReturnPart
+from pydantic_ai.models.function import AgentInfo as FunctionAgentInfo
+from pydantic_ai.models.function import FunctionModel
+
+from group_genie.agent import AgentFactory
+from group_genie.agent.provider.pydantic_ai import DefaultAgent
+from group_genie.bench import (
+    BenchConfig,
+    MemoryConfig,
+    PersistenceConfig,
+    ReplayConfig,
+    Summary,
+    load_transcript,
+    run_benchmark,
+    run_memory_benchmark,
+    run_persistence_benchmark,
+    run_replay,
+)
+from group_genie.message import Attachment, Message, Thread
+
+
+def test_summary():
+    summary = Summary.of([float(i) for i in range(1, 101)])
+
+    assert summary.count == 100
+    assert summary.mean == 50.5
+    assert summary.p50 == 50.0
+    assert summary.p95 == 95.0
+    assert summary.p99 == 99.0
+    assert summary.max == 100.0
+
+
+@pytest.mark.asyncio
+async def test_run_benchmark():
+    config = BenchConfig(
+        sessions=2,
+        senders=2,
+        messages=6,
+        rate=None,
+        attachments=1,
+        attachment_size=100,
+        reasoner_latency=0.01,
+        agent_latency=0.01,
+        persist=True,
+    )
+    report = await run_benchmark(config)
+
+    assert report.messages == 12
+    assert report.errors == 0
+    assert report.throughput > 0
+    assert report.end_to_end.count == 12
+    assert report.stages["reasoner_run"].count == 12
+    assert report.stages["agent_run"].count == 12
+    assert report.loop_lag is not None and "loop_lag" not in report.stages
+    assert "end_to_end" in report.format()
+
+
+@pytest.mark.asyncio
+async def test_run_persistence_benchmark():
+    config = PersistenceConfig(sizes=[2, 4], threads=1, attachments=1, binary_parts=1, binary_size=100, repeat=2)
+    results = await run_persistence_benchmark(config)
+
+    # 4 serialization operations and save/load of 2 targets with 2 backends per size
+    assert len(results) == 2 * (4 + 2 * 2 * 2)
+
+    saves: dict[tuple[int, str, str | None], int] = {}
+    for r in results:
+        if r.operation == "save":
+            assert r.bytes is not None
+            saves[(r.size, r.target, r.backend)] = r.bytes
+
+    assert saves[(4, "agent", "json-indent")] > saves[(2, "agent", "json-indent")]
+    assert saves[(4, "session", "json-compact")] < saves[(4, "session", "json-indent")]
+    assert all(r.latency.count == 2 for r in results)
+
+
+@pytest.mark.asyncio
+async def test_run_memory_benchmark():
+    config = MemoryConfig(sessions=2, senders=2, messages=6, sample_every=2, top=3)
+    report = await run_memory_benchmark(config)
+
+    assert [s.messages for s in report.samples] == [1, 2, 4, 6]
+    assert report.samples[-1].footprint > report.samples[0].footprint
+    assert report.samples[-1].runners == 2 * 2 * 2  # reasoner and system agent per sender and session
+    assert report.footprint_growth > 0
+    assert len(report.top_growth) == 3
+    assert [f.messages for f in report.sessions] == [12, 12]
+
+
+def write_transcript(path: Path):
+    thread = Thread(id="other", messages=[Message(content="earlier", sender="carol")])
+    attachment = Attachment(path="files/doc.pdf", name="doc", media_type="application/pdf")
+    (path.parent / "files").mkdir()
+    (path.parent / "files" / "doc.pdf").write_bytes(b"%PDF")
+    lines = [
+        {**asdict(Message(content="hi", sender="alice")), "timestamp": "2025-01-01T10:00:00+00:00"},
+        {**asdict(Message(content="see thread", sender="bob", threads=[thread])), "timestamp": 1735725602.0},
+        {**asdict(Message(content="see doc", sender="alice", attachments=[attachment])), "session": "other"},
+    ]
+    path.write_text("\n".join(json.dumps(line) for line in lines))
+
+
+def test_load_transcript(tmp_path: Path):
+    write_transcript(tmp_path / "chat.jsonl")
+    items = load_transcript(tmp_path / "chat.jsonl", interval=5.0)
+
+    assert [item.offset for item in items] == [0.0, 2.0, 7.0]
+    assert [item.session for item in items] == ["chat", "chat", "other"]
+    assert items[1].message.threads[0].messages[0].content == "earlier"
+    assert items[2].message.attachments[0].path == str(tmp_path / "files" / "doc.pdf")
+
+
+@pytest.mark.asyncio
+async def test_run_replay(tmp_path: Path):
+    async def tool_model(messages: list[ModelMessage], info: FunctionAgentInfo) -> ModelResponse:
+        await asyncio.sleep(0.01)
+        if isinstance(messages[-1].parts[-1], ToolReturnPart):
+            return ModelResponse(parts=[TextPart(content="done")])
+        return ModelResponse(parts=[ToolCallPart(tool_name="lookup", args={})])
+
+    async def lookup() -> str:
+        return "result"
+
+    def create_system_agent(secrets, extra_tools, agent_infos) -> DefaultAgent:
+        return DefaultAgent(
+            system_prompt="You are a helpful assistant", model=FunctionModel(tool_model), tools=[lookup]
+        )
+
+    write_transcript(tmp_path / "chat.jsonl")
+    config = ReplayConfig(transcripts=[tmp_path / "chat.jsonl"], speedup=100.0, copies=3, reasoner_latency=0.01)
+    report = await run_replay(config, agent_factory=AgentFactory(system_agent_factory=create_system_agent))
+
+    assert report.sessions == 6
+    assert report.messages == 9
+    assert report.delegated == 9
+    assert report.approvals == 9
+    assert report.errors == 0
+    assert report.end_to_end.count == 9
+    assert report.max_backlog > 0
+    assert "send_delay" in report.format()
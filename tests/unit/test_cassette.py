@@ -0,0 +1,71 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from pydantic_ai.messages import ModelMessage, ModelResponse, TextPart, ToolCallPart, ToolReturnPart
+from pydantic_ai.models.function import AgentInfo as FunctionAgentInfo
+from pydantic_ai.models.function import FunctionModel
+
+from group_genie.agent import AgentInput
+from group_genie.agent.provider.pydantic_ai import DefaultAgent, RecordingModel, ReplayModel
+from group_genie.cassette import Cassette
+
+
+async def weather_model(messages: list[ModelMessage], info: FunctionAgentInfo) -> ModelResponse:
+    await asyncio.sleep(0.05)
+    last = messages[-1].parts[-1]
+    if isinstance(last, ToolReturnPart):
+        return ModelResponse(parts=[TextPart(content=f"It is {last.content}")])
+    return ModelResponse(parts=[ToolCallPart(tool_name="get_weather", args={"city": "Vienna"})])
+
+
+async def approve(tool_name: str, tool_args: dict) -> bool:
+    return True
+
+
+def test_cassette_lookup(tmp_path: Path):
+    cassette = Cassette(tmp_path / "cassette.jsonl")
+    cassette.record("a", "response-a1", 0.1)
+    cassette.record("a", "response-a2", 0.2)
+    cassette.record("b", "response-b", 0.3)
+
+    cassette = Cassette(tmp_path / "cassette.jsonl")
+    assert [cassette.lookup("a").response for _ in range(3)] == ["response-a1", "response-a2", "response-a1"]
+    assert cassette.lookup("c").response == "response-a1"  # fallback to recording order
+
+    with pytest.raises(KeyError):
+        Cassette(tmp_path / "cassette.jsonl", strict=True).lookup("c")
+
+
+@pytest.mark.asyncio
+async def test_record_replay(tmp_path: Path):
+    calls: list[str] = []
+
+    async def get_weather(city: str) -> str:
+        calls.append(city)
+        return "sunny"
+
+    cassette = Cassette(tmp_path / "cassette.jsonl")
+    recording = DefaultAgent(
+        system_prompt="You are a weather assistant",
+        model=RecordingModel(FunctionModel(weather_model), cassette),
+        tools=[get_weather],
+    )
+    async with recording.mcp():
+        assert await recording.run(AgentInput(query="Weather in Vienna?"), approve) == "It is sunny"
+
+    cassette = Cassette(tmp_path / "cassette.jsonl", strict=True)
+    assert len(cassette.entries) == 2
+    assert all(entry.latency >= 0.05 for entry in cassette.entries)
+
+    replaying = DefaultAgent(
+        system_prompt="You are a weather assistant",
+        model=ReplayModel(cassette, latency_scale=0.0),
+        tools=[get_weather],
+    )
+    async with replaying.mcp():
+        start = asyncio.get_running_loop().time()
+        assert await replaying.run(AgentInput(query="Weather in Vienna?"), approve) == "It is sunny"
+        assert asyncio.get_running_loop().time() - start < 0.05
+
+    assert calls == ["Vienna", "Vienna"]  # tools are executed on replay
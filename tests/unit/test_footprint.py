@@ -0,0 +1,39 @@
+import sys
+from dataclasses import dataclass
+
+from group_genie.footprint import RunnerFootprint, SessionFootprint, sizeof
+
+
+@dataclass
+class Item:
+    name: str
+    values: list[int]
+
+
+def test_sizeof_containers():
+    text = "x" * 1000
+    assert sizeof(text) == sys.getsizeof(text)
+    assert sizeof([text]) == sys.getsizeof([text]) + sys.getsizeof(text)
+    assert sizeof([text, text]) == sys.getsizeof([text, text]) + sys.getsizeof(text)  # shared objects counted once
+    assert sizeof({"key": [text]}) > sizeof([text])
+
+
+def test_sizeof_objects():
+    item = Item(name="x" * 1000, values=list(range(100)))
+    assert sizeof(item) > sys.getsizeof(item.name) + sys.getsizeof(item.values)
+    assert sizeof(Item) == 0
+
+
+def test_session_footprint_totals():
+    subagent = RunnerFootprint(key="a:1", owner="alice", kind="agent", state_bytes=10, tasks=1, mcp_contexts=1)
+    system = RunnerFootprint(
+        key="system", owner="alice", kind="agent", state_bytes=20, tasks=2, mcp_contexts=1, subagents=[subagent]
+    )
+    reasoner = RunnerFootprint(key="reasoner", owner="bob", kind="reasoner", state_bytes=5, tasks=1)
+    footprint = SessionFootprint(id="s", messages=2, message_bytes=100, reasoners=[reasoner], agents=[system])
+
+    assert footprint.total_bytes == 135
+    assert footprint.runners == 3
+    assert footprint.tasks == 4
+    assert footprint.mcp_contexts == 2
+    assert footprint.by_owner() == {"alice": 30, "bob": 5}
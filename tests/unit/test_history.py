@@ -0,0 +1,133 @@
+import pytest
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelRequest,
+    ModelResponse,
+    SystemPromptPart,
+    TextPart,
+    ToolCallPart,
+    ToolReturnPart,
+    UserPromptPart,
+)
+
+from group_genie.agent.history import HistoryPolicy, Summarizer
+from group_genie.agent.provider.pydantic_ai.history import SUMMARY_PREFIX, apply_history_policy
+
+
+class RecordingSummarizer(Summarizer):
+    def __init__(self):
+        self.transcripts: list[str] = []
+
+    async def summarize(self, transcript: str) -> str:
+        self.transcripts.append(transcript)
+        return f"summary {len(self.transcripts)}"
+
+
+def turn(i: int, tool: bool = False) -> list[ModelMessage]:
+    messages: list[ModelMessage] = [ModelRequest(parts=[UserPromptPart(content=f"query {i}")])]
+    if tool:
+        messages.append(ModelResponse(parts=[ToolCallPart(tool_name="search", args={"q": i}, tool_call_id=f"c{i}")]))
+        messages.append(ModelRequest(parts=[ToolReturnPart(tool_name="search", content=f"r{i}", tool_call_id=f"c{i}")]))
+    messages.append(ModelResponse(parts=[TextPart(content=f"answer {i}")]))
+    return messages
+
+
+def history(n: int, tool: bool = False) -> list[ModelMessage]:
+    messages = [message for i in range(n) for message in turn(i, tool=tool)]
+    first = messages[0]
+    assert isinstance(first, ModelRequest)
+    messages[0] = ModelRequest(parts=[SystemPromptPart(content="system"), *first.parts])
+    return messages
+
+
+def user_prompts(messages: list[ModelMessage]) -> list[str]:
+    return [
+        part.content
+        for message in messages
+        for part in message.parts
+        if isinstance(part, UserPromptPart) and isinstance(part.content, str)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_within_limits_unchanged():
+    messages = history(3)
+    assert await apply_history_policy(HistoryPolicy(max_turns=3), messages) is messages
+
+
+@pytest.mark.asyncio
+async def test_sliding_window():
+    result = await apply_history_policy(HistoryPolicy(max_turns=2), history(5, tool=True))
+
+    assert user_prompts(result) == ["query 3", "query 4"]
+    assert len(result) == 8  # tool call/return pairs retained with their turns
+
+    # system prompt moved to first retained message
+    assert isinstance(result[0].parts[0], SystemPromptPart)
+    assert isinstance(result[0].parts[1], UserPromptPart)
+
+
+@pytest.mark.asyncio
+async def test_token_budget():
+    policy = HistoryPolicy(
+        max_tokens=25, token_estimator=lambda message: 10 if isinstance(message, ModelRequest) else 0
+    )
+    result = await apply_history_policy(policy, history(5))
+    assert user_prompts(result) == ["query 3", "query 4"]
+
+
+@pytest.mark.asyncio
+async def test_compact_to():
+    policy = HistoryPolicy(max_turns=4, compact_to=0.5)
+    result = await apply_history_policy(policy, history(5))
+    assert user_prompts(result) == ["query 3", "query 4"]
+
+
+@pytest.mark.asyncio
+async def test_compact_to_token_limit():
+    def estimate(message: ModelMessage) -> int:
+        if not isinstance(message, ModelRequest):
+            return 0
+        return 50 if "query 0" in user_prompts([message]) else 10
+
+    # only the token limit is exceeded, max_turns doesn't limit the retained turns
+    policy = HistoryPolicy(max_turns=5, max_tokens=80, token_estimator=estimate, compact_to=0.5)
+    result = await apply_history_policy(policy, history(5))
+    assert user_prompts(result) == ["query 1", "query 2", "query 3", "query 4"]
+
+
+@pytest.mark.asyncio
+async def test_latest_turn_retained():
+    policy = HistoryPolicy(max_turns=1, compact_to=0.5)
+    result = await apply_history_policy(policy, history(3))
+    assert user_prompts(result) == ["query 2"]
+
+    # latest turn alone exceeds the token budget
+    policy = HistoryPolicy(max_tokens=5, token_estimator=lambda message: 10)
+    result = await apply_history_policy(policy, history(3))
+    assert user_prompts(result) == ["query 2"]
+
+
+@pytest.mark.asyncio
+async def test_summarization():
+    summarizer = RecordingSummarizer()
+    policy = HistoryPolicy(max_turns=3, summarizer=summarizer, compact_to=0.67)
+
+    result = await apply_history_policy(policy, history(4, tool=True))
+    assert user_prompts(result) == [f"{SUMMARY_PREFIX}\n\nsummary 1", "query 2", "query 3"]
+    assert isinstance(result[0].parts[0], SystemPromptPart)
+
+    transcript = summarizer.transcripts[0]
+    assert "User: query 0" in transcript
+    assert "Tool call: search" in transcript
+    assert "Tool return (search): r1" in transcript
+    assert "query 2" not in transcript
+
+    result = await apply_history_policy(policy, [*result, *turn(4)])
+    assert user_prompts(result) == [f"{SUMMARY_PREFIX}\n\nsummary 2", "query 3", "query 4"]
+    assert "summary 1" in summarizer.transcripts[1]
+
+
+def test_invalid_compact_to():
+    with pytest.raises(ValueError):
+        HistoryPolicy(compact_to=0)
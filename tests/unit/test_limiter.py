@@ -0,0 +1,68 @@
+import asyncio
+from time import perf_counter
+
+import pytest
+from pydantic_ai import Agent
+from pydantic_ai.models.test import TestModel
+
+from group_genie.agent.provider.pydantic_ai import LimitedModel
+from group_genie.limiter import configure_model_limiter, model_call, remove_model_limiter
+from group_genie.metrics import MODEL_LIMITER_WAIT
+
+
+@pytest.fixture
+def provider():
+    yield "test-provider"
+    remove_model_limiter("test-provider")
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency(provider: str):
+    configure_model_limiter(provider, max_concurrency=2)
+    active = 0
+    max_active = 0
+
+    async def call():
+        nonlocal active, max_active
+        async with model_call(provider):
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*[call() for _ in range(6)])
+    assert max_active == 2
+
+
+@pytest.mark.asyncio
+async def test_requests_per_second(provider: str):
+    configure_model_limiter(provider, requests_per_second=50, burst=2)
+    starts: list[float] = []
+
+    async def call():
+        async with model_call(provider):
+            starts.append(perf_counter())
+
+    start = perf_counter()
+    await asyncio.gather(*[call() for _ in range(6)])
+
+    # 2 calls start immediately, the remaining 4 are paced at 50 rps
+    assert starts[-1] - start == pytest.approx(0.08, abs=0.03)
+
+
+@pytest.mark.asyncio
+async def test_unconfigured_provider_is_not_limited():
+    async with model_call("unknown-provider"):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_limited_model(provider: str):
+    configure_model_limiter(provider, max_concurrency=1)
+    count = MODEL_LIMITER_WAIT.count(provider=provider)
+
+    agent = Agent(model=LimitedModel(TestModel(custom_output_text="Done"), key=provider))
+    result = await agent.run("Hello")
+
+    assert result.output == "Done"
+    assert MODEL_LIMITER_WAIT.count(provider=provider) == count + 1
@@ -0,0 +1,77 @@
+import pytest
+
+from group_genie.metrics import MetricsRegistry
+
+
+def test_counter_render():
+    registry = MetricsRegistry()
+    counter = registry.counter("decisions", "Number of decisions.")
+    counter.inc(decision="ignore")
+    counter.inc(2, decision="delegate")
+
+    assert counter.value(decision="delegate") == 2
+    assert registry.render() == (
+        "# HELP decisions Number of decisions.\n"
+        "# TYPE decisions counter\n"
+        'decisions_total{decision="ignore"} 1\n'
+        'decisions_total{decision="delegate"} 2\n'
+    )
+
+
+def test_counter_rejects_negative_increment():
+    counter = MetricsRegistry().counter("decisions", "Number of decisions.")
+    with pytest.raises(ValueError):
+        counter.inc(-1)
+
+
+def test_gauge_render():
+    registry = MetricsRegistry()
+    gauge = registry.gauge("depth", "Queue depth.")
+    gauge.inc()
+    gauge.inc()
+    gauge.dec()
+
+    assert registry.render() == "# HELP depth Queue depth.\n# TYPE depth gauge\ndepth 1\n"
+
+
+def test_histogram_render():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    histogram.observe(0.1, stage="run")
+    histogram.observe(0.5, stage="run")
+    histogram.observe(4.5, stage="run")
+
+    assert histogram.count(stage="run") == 3
+    assert registry.render() == (
+        "# HELP latency_seconds Latency.\n"
+        "# TYPE latency_seconds histogram\n"
+        'latency_seconds_bucket{stage="run",le="0.1"} 1\n'
+        'latency_seconds_bucket{stage="run",le="1"} 2\n'
+        'latency_seconds_bucket{stage="run",le="+Inf"} 3\n'
+        'latency_seconds_sum{stage="run"} 5.1\n'
+        'latency_seconds_count{stage="run"} 3\n'
+    )
+
+
+def test_label_escaping():
+    registry = MetricsRegistry()
+    registry.counter("calls", "Calls.").inc(tool='say "hi"\n')
+
+    assert 'calls_total{tool="say \\"hi\\"\\n"} 1' in registry.render()
+
+
+def test_registry_get_or_create():
+    registry = MetricsRegistry()
+
+    assert registry.counter("calls", "Calls.") is registry.counter("calls", "Calls.")
+    with pytest.raises(ValueError):
+        registry.gauge("calls", "Calls.")
+
+
+def test_observer():
+    registry = MetricsRegistry()
+    observed = []
+    registry.add_observer(lambda name, labels, value: observed.append((name, labels, value)))
+    registry.histogram("latency_seconds", "Latency.").observe(0.5, stage="run")
+
+    assert observed == [("latency_seconds", {"stage": "run"}, 0.5)]
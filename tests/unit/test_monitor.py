@@ -0,0 +1,47 @@
+import asyncio
+import time
+
+import pytest
+
+from group_genie.metrics import LOOP_LAG, LOOP_STALLS
+from group_genie.monitor import LoopMonitor, Stall
+from group_genie.utils import arun
+
+
+def block(seconds: float):
+    time.sleep(seconds)
+
+
+async def blocking_task():
+    block(0.3)
+
+
+@pytest.mark.asyncio
+async def test_loop_monitor_detects_stall():
+    stalls: list[Stall] = []
+
+    async with LoopMonitor(interval=0.01, threshold=0.1, on_stall=stalls.append) as monitor:
+        await asyncio.sleep(0.05)
+        await asyncio.create_task(blocking_task(), name="blocker")
+        await asyncio.sleep(0.05)
+
+    assert len(stalls) == 1
+    assert list(monitor.stalls) == stalls
+
+    stall = stalls[0]
+    assert stall.lag >= 0.25
+    assert stall.task == "blocker"
+    assert stall.coro == "blocking_task"
+    assert stall.stage == "tests.unit.test_monitor:block"
+    assert "time.sleep(seconds)" in stall.stack
+
+    assert LOOP_STALLS.value(stage="tests.unit.test_monitor:block") >= 1
+    assert LOOP_LAG.count() > 0
+
+
+@pytest.mark.asyncio
+async def test_loop_monitor_ignores_non_blocking_work():
+    async with LoopMonitor(interval=0.01, threshold=0.1) as monitor:
+        await asyncio.gather(asyncio.sleep(0.2), arun(block, 0.2))
+
+    assert not monitor.stalls
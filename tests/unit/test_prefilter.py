@@ -0,0 +1,78 @@
+import pytest
+from group_sense import Decision
+
+from group_genie.message import Attachment, Message
+from group_genie.reasoner import LengthPrefilter, MentionPrefilter, ReceiverPrefilter, RegexPrefilter
+
+
+class TestMentionPrefilter:
+    @pytest.mark.asyncio
+    async def test_mention_delegates(self):
+        prefilter = MentionPrefilter(mentions=["genie"])
+        response = await prefilter.apply("alice", [Message(content="@genie what time is it?", sender="alice")])
+
+        assert response is not None
+        assert response.decision == Decision.DELEGATE
+        assert response.query == "what time is it?"
+        assert response.receiver == "alice"
+
+    @pytest.mark.asyncio
+    async def test_no_mention_passes(self):
+        prefilter = MentionPrefilter(mentions=["genie"])
+        assert await prefilter.apply("alice", [Message(content="mail me at bob@genie.com", sender="alice")]) is None
+
+
+class TestRegexPrefilter:
+    @pytest.mark.asyncio
+    async def test_emoji_only_ignored(self):
+        prefilter = RegexPrefilter(pattern=r"[\W_]*")
+        response = await prefilter.apply("alice", [Message(content=" 👍🎉! ", sender="alice")])
+
+        assert response is not None
+        assert response.decision == Decision.IGNORE
+
+    @pytest.mark.asyncio
+    async def test_text_passes(self):
+        prefilter = RegexPrefilter(pattern=r"[\W_]*")
+        assert await prefilter.apply("alice", [Message(content="hello 👍", sender="alice")]) is None
+
+    @pytest.mark.asyncio
+    async def test_delegate_decision(self):
+        prefilter = RegexPrefilter(pattern=r"weather .*", decision=Decision.DELEGATE)
+        response = await prefilter.apply("alice", [Message(content="weather in Vienna", sender="alice")])
+
+        assert response is not None
+        assert response.decision == Decision.DELEGATE
+        assert response.query == "weather in Vienna"
+        assert response.receiver == "alice"
+
+
+class TestLengthPrefilter:
+    @pytest.mark.asyncio
+    async def test_short_message_ignored(self):
+        prefilter = LengthPrefilter(min_length=5)
+        response = await prefilter.apply("alice", [Message(content=" ok ", sender="alice")])
+
+        assert response is not None
+        assert response.decision == Decision.IGNORE
+
+    @pytest.mark.asyncio
+    async def test_short_message_with_attachment_passes(self):
+        prefilter = LengthPrefilter(min_length=5)
+        attachment = Attachment(path="/tmp/a.png", name="a.png", media_type="image/png")
+        message = Message(content="", sender="alice", attachments=[attachment])
+        assert await prefilter.apply("alice", [message]) is None
+
+
+class TestReceiverPrefilter:
+    @pytest.mark.asyncio
+    async def test_other_receiver_ignored(self):
+        response = await ReceiverPrefilter().apply("alice", [Message(content="hi bob", sender="alice", receiver="bob")])
+
+        assert response is not None
+        assert response.decision == Decision.IGNORE
+
+    @pytest.mark.asyncio
+    async def test_system_receiver_passes(self):
+        message = Message(content="hi", sender="alice", receiver="system")
+        assert await ReceiverPrefilter().apply("alice", [message]) is None
@@ -0,0 +1,63 @@
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from group_genie.metrics import PROFILES
+from group_genie.profiling import ExecutionProfiler
+
+
+def busy(seconds: float):
+    time.sleep(seconds)
+
+
+async def wait_for_file(path: Path) -> str:
+    for _ in range(100):
+        if path.exists():
+            return path.read_text()
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"{path} not written")
+
+
+@pytest.mark.asyncio
+async def test_profile_slow_execution(tmp_path: Path):
+    profiler = ExecutionProfiler(directory=tmp_path, threshold=0.1, interval=0.005)
+
+    profile = profiler.begin("req/1")
+    assert profile is not None
+    busy(0.15)
+    await asyncio.sleep(0.01)
+    path = profile.end()
+
+    assert path == tmp_path / "req_1.collapsed"
+    lines = (await wait_for_file(path)).splitlines()
+    assert any("tests.unit.test_profiling:busy" in line for line in lines)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+
+@pytest.mark.asyncio
+async def test_profile_fast_execution(tmp_path: Path):
+    profiler = ExecutionProfiler(directory=tmp_path, threshold=1.0, interval=0.005)
+
+    profile = profiler.begin("req-1")
+    assert profile is not None
+    await asyncio.sleep(0.02)
+
+    assert profile.end() is None
+    assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.asyncio
+async def test_profile_limits(tmp_path: Path):
+    profiler = ExecutionProfiler(directory=tmp_path, threshold=0.0, interval=0.005, max_active=2, max_profiles=1)
+
+    profiles = [profiler.begin(f"req-{i}") for i in range(3)]
+    assert profiles[2] is None  # max_active reached
+
+    await asyncio.sleep(0.05)
+    rate_limited = PROFILES.value(outcome="rate_limited")
+
+    assert profiles[0] is not None and profiles[0].end() is not None
+    assert profiles[1] is not None and profiles[1].end() is None
+    assert PROFILES.value(outcome="rate_limited") == rate_limited + 1
@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from group_genie.scheduler import Budget, FairLimiter, Scheduler, TokenBucket
+
+
+def test_token_bucket():
+    bucket = TokenBucket(capacity=2, refill_rate=1)
+    bucket.consume(5)
+
+    assert bucket.balance == pytest.approx(-3, abs=0.01)
+    assert bucket.wait_time(1) == pytest.approx(4, abs=0.01)
+
+
+def test_scheduler_request_budget():
+    scheduler = Scheduler(owner_budget=Budget(requests=2, period=3600))
+
+    assert scheduler.admit("s1", "alice") is None
+    assert scheduler.admit("s1", "alice") is None
+
+    throttle = scheduler.admit("s1", "alice")
+    assert throttle is not None
+    assert throttle.scope == "owner"
+    assert throttle.resource == "requests"
+    assert throttle.retry_after == pytest.approx(1800, rel=0.01)
+
+    assert scheduler.admit("s1", "bob") is None
+
+
+def test_scheduler_session_budget():
+    scheduler = Scheduler(session_budget=Budget(requests=1, period=3600))
+
+    assert scheduler.admit("s1", "alice") is None
+    assert scheduler.admit("s2", "alice") is None
+
+    throttle = scheduler.admit("s1", "bob")
+    assert throttle is not None
+    assert throttle.scope == "session"
+
+
+def test_scheduler_token_budget():
+    scheduler = Scheduler(owner_budget=Budget(tokens=1000, period=3600))
+
+    assert scheduler.admit("s1", "alice") is None
+    scheduler.charge("s1", "alice", 1500)
+
+    throttle = scheduler.admit("s1", "alice")
+    assert throttle is not None
+    assert throttle.resource == "tokens"
+    assert "budget is exhausted" in throttle.message
+
+
+@pytest.mark.asyncio
+async def test_fair_limiter_round_robin():
+    limiter = FairLimiter(limit=1)
+    order: list[str] = []
+
+    async def run(owner: str):
+        await limiter.acquire(owner)
+        order.append(owner)
+        await asyncio.sleep(0.01)
+        limiter.release()
+
+    await limiter.acquire("holder")
+    tasks = [asyncio.create_task(run(owner)) for owner in ["alice", "alice", "alice", "bob", "carol"]]
+    await asyncio.sleep(0.01)
+
+    assert limiter.waiting == 5
+    limiter.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["alice", "bob", "carol", "alice", "alice"]
+    assert limiter.active == 0
+
+
+@pytest.mark.asyncio
+async def test_fair_limiter_cancel_waiter():
+    limiter = FairLimiter(limit=1)
+    await limiter.acquire("alice")
+
+    task = asyncio.create_task(limiter.acquire("bob"))
+    await asyncio.sleep(0)
+    task.cancel()
+    await asyncio.sleep(0)
+
+    assert limiter.waiting == 0
+    limiter.release()
+    assert limiter.active == 0
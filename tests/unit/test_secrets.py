@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+from group_genie.secrets import AsyncSecretsProvider, CachingSecretsProvider, SecretsProvider, load_secrets
+
+
+class CountingSecretsProvider(AsyncSecretsProvider):
+    def __init__(self):
+        self.calls = 0
+
+    async def get_secrets(self, username: str) -> dict[str, str] | None:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return {"API_KEY": f"{username}-{self.calls}"}
+
+
+class StaticSecretsProvider(SecretsProvider):
+    def get_secrets(self, username: str) -> dict[str, str] | None:
+        return {"API_KEY": username} if username != "nobody" else None
+
+
+class TestCachingSecretsProvider:
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_call(self):
+        provider = CountingSecretsProvider()
+        caching = CachingSecretsProvider(provider, ttl=60)
+
+        results = await asyncio.gather(*[caching.get_secrets("alice") for _ in range(5)])
+
+        assert provider.calls == 1
+        assert all(result == {"API_KEY": "alice-1"} for result in results)
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_refreshed(self):
+        provider = CountingSecretsProvider()
+        caching = CachingSecretsProvider(provider, ttl=0)
+
+        assert await caching.get_secrets("alice") == {"API_KEY": "alice-1"}
+        assert await caching.get_secrets("alice") == {"API_KEY": "alice-2"}
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self):
+        provider = CountingSecretsProvider()
+        caching = CachingSecretsProvider(provider, ttl=60)
+
+        await caching.get_secrets("alice")
+        caching.invalidate("alice")
+        await caching.get_secrets("alice")
+
+        assert provider.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_wraps_sync_provider(self):
+        caching = CachingSecretsProvider(StaticSecretsProvider())
+        assert await caching.get_secrets("alice") == {"API_KEY": "alice"}
+
+
+@pytest.mark.asyncio
+async def test_load_secrets():
+    assert await load_secrets(None, "alice") == {}
+    assert await load_secrets(StaticSecretsProvider(), "nobody") == {}
+    assert await load_secrets(StaticSecretsProvider(), "alice") == {"API_KEY": "alice"}
@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+from group_genie.stats import ErrorInfo, Health, RunnerStats, SessionStats, StatsSummary
+
+
+def test_stats_summary():
+    subagent = RunnerStats(key="a:1", owner="alice", kind="agent", live=True, in_flight=1, in_flight_age=3.0)
+    system = RunnerStats(
+        key="system",
+        owner="alice",
+        kind="agent",
+        live=True,
+        queued=2,
+        in_flight=1,
+        in_flight_age=1.0,
+        subagents=[subagent],
+    )
+    reasoner = RunnerStats(
+        key="reasoner:bob",
+        owner="bob",
+        kind="reasoner",
+        stopped=True,
+        last_error=ErrorInfo(source="init", error="RuntimeError()", time=2.0),
+    )
+    session_1 = SessionStats(id="s1", messages=3, queued=1, pending_saves=1, reasoners=[reasoner], agents=[system])
+    session_2 = SessionStats(
+        id="s2", stopped=True, messages=2, last_error=ErrorInfo(source="save", error="OSError()", time=1.0)
+    )
+
+    summary = StatsSummary.of([session_1, session_2])
+
+    assert summary.sessions == 2
+    assert summary.stopped == 1
+    assert summary.messages == 5
+    assert summary.queued == 3
+    assert summary.runners == 3
+    assert summary.live_runners == 2
+    assert summary.in_flight == 2
+    assert summary.oldest_in_flight == 3.0
+    assert summary.pending_saves == 1
+    assert summary.errors == 2
+    assert summary.last_error is not None and summary.last_error.source == "init"
+
+
+@pytest.mark.asyncio
+async def test_health_tracks_saves():
+    health = Health()
+    ok = health.track(asyncio.Future())
+    failed = health.track(asyncio.Future())
+    assert health.pending_saves == 2
+
+    ok.set_result(None)
+    failed.set_exception(OSError("disk full"))
+    await asyncio.sleep(0)
+
+    assert health.pending_saves == 0
+    assert health.last_error is not None
+    assert health.last_error.source == "save"
+    assert "disk full" in health.last_error.error
@@ -0,0 +1,56 @@
+import time
+
+import pytest
+
+from group_genie.agent import CachePolicy, ToolCache
+
+
+def test_cache_hit_canonical_args():
+    cache = ToolCache({"search": CachePolicy(ttl=60)})
+    cache.put("search", {"query": "a", "limit": 5}, "result")
+
+    assert cache.get("search", {"limit": 5, "query": "a"}) == "result"
+
+    with pytest.raises(KeyError):
+        cache.get("search", {"query": "b", "limit": 5})
+
+
+def test_cache_uncached_tool():
+    cache = ToolCache({"search": CachePolicy(ttl=60)})
+    cache.put("delete", {"id": 1}, "deleted")
+
+    assert not cache.cached("delete")
+    with pytest.raises(KeyError):
+        cache.get("delete", {"id": 1})
+
+
+def test_cache_ttl():
+    cache = ToolCache({"search": CachePolicy(ttl=0.05)})
+    cache.put("search", None, "result")
+    assert cache.get("search", {}) == "result"
+
+    time.sleep(0.1)
+    with pytest.raises(KeyError):
+        cache.get("search", None)
+
+
+def test_cache_lru_eviction():
+    cache = ToolCache({"search": CachePolicy(ttl=60, max_size=2)})
+    cache.put("search", {"query": "a"}, "a")
+    cache.put("search", {"query": "b"}, "b")
+    cache.get("search", {"query": "a"})
+    cache.put("search", {"query": "c"}, "c")
+
+    assert cache.get("search", {"query": "a"}) == "a"
+    assert cache.get("search", {"query": "c"}) == "c"
+    with pytest.raises(KeyError):
+        cache.get("search", {"query": "b"})
+
+
+def test_cache_namespaces():
+    cache = ToolCache({"search": CachePolicy(ttl=60)})
+    cache.put("search", {"query": "a"}, "web", namespace="web-server")
+
+    assert cache.get("search", {"query": "a"}, namespace="web-server") == "web"
+    with pytest.raises(KeyError):
+        cache.get("search", {"query": "a"}, namespace="docs-server")
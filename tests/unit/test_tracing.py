@@ -0,0 +1,80 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from group_genie import tracing
+from group_genie.tracing import JsonlSpanExporter, Span, SpanExporter
+
+
+class RecordingSpanExporter(SpanExporter):
+    def __init__(self):
+        self.started: list[Span] = []
+        self.ended: list[Span] = []
+
+    def on_start(self, span: Span):
+        self.started.append(span)
+
+    def on_end(self, span: Span):
+        self.ended.append(span)
+
+
+@pytest.fixture
+def exporter():
+    exporter = tracing.configure_tracing(RecordingSpanExporter())
+    yield exporter
+    tracing.disable_tracing()
+
+
+def test_span_nesting(exporter: RecordingSpanExporter):
+    with tracing.span("outer", key="value") as outer:
+        with tracing.span("inner") as inner:
+            assert tracing.current_span() is inner
+        assert tracing.current_span() is outer
+    assert tracing.current_span() is None
+
+    assert [span.name for span in exporter.started] == ["outer", "inner"]
+    assert [span.name for span in exporter.ended] == ["inner", "outer"]
+    assert inner.trace_id == outer.trace_id
+    assert inner.parent_id == outer.span_id
+    assert outer.parent_id is None
+    assert outer.attributes == {"key": "value"}
+    assert outer.duration is not None and outer.duration >= inner.duration  # type: ignore
+
+
+def test_span_error(exporter: RecordingSpanExporter):
+    with pytest.raises(ValueError):
+        with tracing.span("failing"):
+            raise ValueError("boom")
+
+    assert exporter.ended[0].error == "ValueError('boom')"
+
+
+@pytest.mark.asyncio
+async def test_span_propagates_to_tasks(exporter: RecordingSpanExporter):
+    async def child():
+        with tracing.span("child") as span:
+            return span
+
+    with tracing.span("parent") as parent:
+        span = await asyncio.create_task(child())
+
+    assert span.parent_id == parent.span_id
+
+
+def test_jsonl_exporter(tmp_path: Path):
+    path = tmp_path / "traces" / "traces.jsonl"
+    tracing.configure_tracing(JsonlSpanExporter(path))
+
+    try:
+        with tracing.span("outer"):
+            with tracing.span("inner", agent="system"):
+                pass
+    finally:
+        tracing.disable_tracing()
+
+    spans = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [span["name"] for span in spans] == ["inner", "outer"]
+    assert spans[0]["parent_id"] == spans[1]["span_id"]
+    assert spans[0]["attributes"] == {"agent": "system"}
@@ -0,0 +1,24 @@
+from pydantic_ai.messages import ModelMessage, ModelRequest, ModelResponse, TextPart, ToolCallPart, UserPromptPart
+from pydantic_ai.usage import RequestUsage
+
+from group_genie.agent.provider.pydantic_ai.utils import messages_usage
+from group_genie.usage import Usage
+
+
+def test_usage_add():
+    usage = Usage(input_tokens=10, output_tokens=5, requests=1) + Usage(input_tokens=3, output_tokens=2, tool_calls=1)
+    assert usage == Usage(input_tokens=13, output_tokens=7, requests=1, tool_calls=1)
+    assert usage.total_tokens == 20
+
+
+def test_messages_usage():
+    messages: list[ModelMessage] = [
+        ModelRequest(parts=[UserPromptPart(content="Hello")]),
+        ModelResponse(
+            parts=[ToolCallPart(tool_name="get_weather", args={"city": "Paris"})],
+            usage=RequestUsage(input_tokens=10, output_tokens=4),
+        ),
+        ModelResponse(parts=[TextPart(content="Sunny")], usage=RequestUsage(input_tokens=20, output_tokens=2)),
+    ]
+
+    assert messages_usage(messages) == Usage(input_tokens=30, output_tokens=6, requests=2, tool_calls=1)